@@ -13,11 +13,11 @@ from .categories import Category
 # Core classes
 from .core import (
     is_any, is_field, is_container, is_array, is_structure,
-    is_pointer, is_mixin,
+    is_pointer, is_mixin, join_field_path,
     Patch, Index, Alignment,
     Container, Structure, Sequence, Array,
     Field,
-    Stream, String,
+    Stream, String, BitArray,
     Float, Double,
     Decimal, Bit, Byte, Char, Signed, Unsigned, Bitset, Bool, Enum, Scaled,
     Fraction, Bipolar, Unipolar, Datetime, IPv4Address,
@@ -33,6 +33,7 @@ from .exceptions import (
     ByteOrderTypeError, ByteOrderValueError,
     EnumTypeError, FactoryTypeError, MemberTypeError,
     ProviderTypeError, ContainerLengthError,
+    ContainerSnapshotError, ContainerLayoutError,
     FieldAddressError, FieldAlignmentError, FieldByteOrderError,
     FieldIndexError, FieldSizeError, FieldTypeError, FieldValueError,
     FieldValueEncodingError,
@@ -92,7 +93,9 @@ from .pointers import (
     StringRelativePointer32, StringRelativePointer48, StringRelativePointer64,
 )
 # Providers
-from .providers import Provider, FileProvider
+from .providers import (
+    Provider, FileProvider, SharedMemoryProvider, DiskCacheProvider,
+)
 # Utilities
 from .utils import d3flare_json, HexViewer
 
@@ -116,6 +119,8 @@ __all__ = [
     'ProviderTypeError',
 
     'ContainerLengthError',
+    'ContainerSnapshotError',
+    'ContainerLayoutError',
 
     'FieldAddressError',
     'FieldAlignmentError',
@@ -133,6 +138,8 @@ __all__ = [
     # Provider
     'Provider',
     'FileProvider',
+    'SharedMemoryProvider',
+    'DiskCacheProvider',
 
     # Core classes
     'is_any',
@@ -142,6 +149,7 @@ __all__ = [
     'is_structure',
     'is_pointer',
     'is_mixin',
+    'join_field_path',
 
     'Patch',
     'Index',
@@ -158,6 +166,7 @@ __all__ = [
 
     'Stream',
     'String',
+    'BitArray',
 
     'Float', 'Double',
 
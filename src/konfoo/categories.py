@@ -12,6 +12,8 @@ from __future__ import annotations
 import enum
 from typing import Any
 
+from .enums import lookup_member, member_maps
+
 
 class Category(enum.Enum):
     """ The :class:`Category` class is a is a subclass of the :class:`~enum.Enum`
@@ -172,10 +174,10 @@ class Category(enum.Enum):
         >>> Format.get_name('dd')
         ''
         """
-        for member in cls:
-            if member.value == value:
-                return member.name
-        return str()
+        member = lookup_member(cls, value)
+        if member is None:
+            return str()
+        return member.name
 
     @classmethod
     def get_value(cls, name: str) -> Any | None:
@@ -193,10 +195,10 @@ class Category(enum.Enum):
         >>> Format.get_value('day')
 
         """
-        for member in cls:
-            if member.name == name:
-                return member.value
-        return None
+        member = member_maps(cls)[1].get(name)
+        if member is None:
+            return None
+        return member.value
 
     @classmethod
     def get_member(cls,
@@ -216,7 +218,7 @@ class Category(enum.Enum):
         >>> Format.get_member('day', None)
 
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        return default
+        member = lookup_member(cls, value)
+        if member is None:
+            return default
+        return member
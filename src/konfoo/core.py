@@ -14,19 +14,26 @@ import calendar
 import copy
 import csv
 import datetime
+import hashlib
+import importlib
 import ipaddress
 import json
 import math
 import struct
 import time
-from configparser import ConfigParser
+import weakref
+import zlib
+from configparser import (
+    BasicInterpolation, ConfigParser, DuplicateOptionError
+)
 from operator import attrgetter
+from types import MappingProxyType
 from typing import (
     Any, Callable,
     Iterable, Iterator,
     Literal,
     ItemsView, KeysView, ValuesView,
-    Mapping, MutableSequence, NamedTuple, Type)
+    Mapping, MutableSequence, NamedTuple, TextIO, Type)
 
 from .categories import Category
 from .enums import Enumeration
@@ -34,6 +41,7 @@ from .exceptions import (
     ByteOrderTypeError, ByteOrderValueError,
     EnumTypeError, FactoryTypeError, MemberTypeError,
     ProviderTypeError, ContainerLengthError,
+    ContainerSnapshotError, ContainerLayoutError,
     FieldAddressError, FieldAlignmentError, FieldByteOrderError,
     FieldIndexError, FieldSizeError, FieldTypeError, FieldValueError,
     FieldValueEncodingError,
@@ -42,9 +50,9 @@ from .exceptions import (
 from .globals import (
     ItemClass, Byteorder, BYTEORDER, clamp)
 from .options import (
-    Option,
+    TraversalContext,
     byte_order_option, get_byte_order, nested_option, get_nested,
-    verbose_option, verbose
+    get_lazy, get_stream_policy, verbose_option, verbose
 )
 from .providers import Provider
 
@@ -89,6 +97,372 @@ def is_mixin(instance: Any) -> bool:
     return is_container(instance) or is_pointer(instance)
 
 
+#: Overridden traversal methods: {(class, method name): overridden}
+_HOOKS: dict[tuple[type, str], bool] = dict()
+
+
+def _is_hooked(cls: type, name: str) -> bool:
+    """ Returns :data:`True` if the class *cls* overrides the public traversal
+    method *name* of its base class :class:`Pointer`, :class:`Structure`,
+    :class:`Sequence` or :class:`Field`.
+    """
+    key = (cls, name)
+    hooked = _HOOKS.get(key)
+    if hooked is None:
+        hooked = True
+        for base in (Pointer, Structure, Sequence, Field):
+            if issubclass(cls, base):
+                hooked = getattr(cls, name) is not getattr(base, name, None)
+                break
+        _HOOKS[key] = hooked
+    return hooked
+
+
+def _iter_field_items(item: Structure | Sequence | Pointer,
+                      path: tuple[str | int, ...],
+                      options: dict[str, Any]) -> Iterator[
+                          tuple[tuple[str | int, ...], Field]]:
+    """ Yields the ``(field path, field item)`` tuples of the container or
+    pointer *item* with the field *path* of the *item*. An overridden
+    :meth:`~Container.field_items` method of the *item* is called with the
+    keyword *options* and its field path strings are yielded as a field path
+    with one component.
+    """
+    if _is_hooked(item.__class__, 'field_items'):
+        for field_path, field in item.field_items(
+                join_field_path(path) if path else str(), **options):
+            yield (field_path,), field
+    else:
+        yield from item.iter_field_items(path, **options)
+
+
+def _deserialize_item(item: Structure | Sequence | Field,
+                      buffer: bytes,
+                      index: Index,
+                      context: TraversalContext) -> Index:
+    """ De-serializes the *item* from the byte *buffer* with the traversal
+    *context*. An overridden :meth:`~Field.deserialize` method of the *item*
+    is called with the keyword options of the *context*.
+    """
+    if _is_hooked(item.__class__, 'deserialize'):
+        return item.deserialize(buffer, index, **context.options())
+    return item._deserialize(buffer, index, context)
+
+
+def _serialize_item(item: Structure | Sequence | Field,
+                    buffer: bytearray,
+                    index: Index,
+                    context: TraversalContext) -> Index:
+    """ Serializes the *item* to the byte *buffer* with the traversal
+    *context*. An overridden :meth:`~Field.serialize` method of the *item*
+    is called with the keyword options of the *context*.
+    """
+    if _is_hooked(item.__class__, 'serialize'):
+        return item.serialize(buffer, index, **context.options())
+    return item._serialize(buffer, index, context)
+
+
+def _read_item(item: Structure | Sequence | Pointer,
+               provider: Provider,
+               options: dict[str, Any]) -> None:
+    """ Reads the data objects referenced by the container or pointer *item*
+    from the data *provider* with the keyword *options*. A :class:`Pointer`
+    *item* defers the reading of its data object until its first access
+    with the *lazy* option.
+    """
+    if is_pointer(item) and get_lazy(options):
+        item._defer(provider, options)
+    else:
+        item.read_from(provider, **options)
+
+
+def _pointer_fields(item: Structure | Sequence | Field | None) -> list[Pointer]:
+    """ Returns the :class:`Pointer` fields of the *item* without the
+    pointer fields nested in their data objects.
+    """
+    if is_pointer(item):
+        return [item]
+    elif is_container(item):
+        return [field for item_path, field in item.field_items()
+                if is_pointer(field)]
+    return []
+
+
+def _index_item(item: Structure | Sequence | Pointer,
+                index: Index,
+                context: TraversalContext) -> Index:
+    """ Indexes the container or pointer *item* with the traversal *context*.
+    An overridden :meth:`~Container.index_fields` method of the *item* is
+    called with the keyword options of the *context*.
+    """
+    if _is_hooked(item.__class__, 'index_fields'):
+        return item.index_fields(index, **context.options())
+    return item._index_fields(index, context)
+
+
+class _BufferWriter:
+    """ Writes the content appended by a serialization in place to a writable
+    *buffer* starting at the byte *position*, without re-sizing the *buffer*.
+
+    The writer supports the :class:`bytearray` operations of the serializers:
+    ``len(writer)`` is the current write position, ``writer += content``
+    writes the *content* at the write position, and slices read and write
+    the *buffer* at absolute byte offsets.
+    """
+    __slots__ = ('view', 'position')
+
+    def __init__(self, buffer: Any, position: int) -> None:
+        self.view = memoryview(buffer).cast('B')
+        if self.view.readonly:
+            raise TypeError(f"buffer of type '{type(buffer).__name__}' "
+                            f"is not writable")
+        self.position = position
+
+    def __len__(self) -> int:
+        return self.position
+
+    def __iadd__(self, content: bytes) -> _BufferWriter:
+        start = self.position
+        stop = start + len(content)
+        if stop > len(self.view):
+            raise BufferError(f"buffer of {len(self.view)} bytes too small "
+                              f"to write {len(content)} bytes at offset "
+                              f"{start}")
+        self.view[start:stop] = content
+        self.position = stop
+        return self
+
+    def __getitem__(self, key: slice) -> memoryview:
+        return self.view[key]
+
+    def __setitem__(self, key: slice, content: bytes) -> None:
+        self.view[key] = content
+
+
+def _serialize_into(item: Structure | Sequence | Field,
+                    buffer: Any,
+                    index: Index,
+                    size: int,
+                    options: dict[str, Any]) -> Index:
+    """ Serializes the *item* with a byte *size* in place to the writable
+    *buffer* starting with the given *index* with the keyword *options* of
+    the serialization.
+    """
+    writer = _BufferWriter(buffer, index.byte)
+    if index.byte < 0 or index.byte + size > len(writer.view):
+        raise BufferError(f"buffer of {len(writer.view)} bytes too small "
+                          f"to write {size} bytes at offset {index.byte}")
+    return _serialize_item(item, writer, index,
+                           TraversalContext.from_options(options))
+
+
+class _Binding(NamedTuple):
+    """ Backing buffer of the fields bound by :meth:`Container.bind`."""
+    #: Byte view of the backing buffer.
+    view: memoryview
+    #: Encoding byte order of the backing buffer.
+    byte_order: Byteorder
+
+
+#: Bound field classes by their field class.
+_BOUND_CLASSES: dict[type, type] = dict()
+
+
+def _bound_class(cls: Type[Field]) -> Type[Field]:
+    """ Returns the bound variant of the field class *cls*, which decodes
+    its :attr:`~Field.value` on access from its backing buffer and encodes
+    an assigned :attr:`~Field.value` straight back into it.
+    """
+    bound = _BOUND_CLASSES.get(cls)
+    if bound is None:
+        value = cls.value
+
+        def get_value(field: Field) -> Any:
+            field._value = field._load()
+            return value.fget(field)
+
+        def set_value(field: Field, x: Any) -> None:
+            value.fset(field, x)
+            field._store()
+
+        def reduce_ex(field: Field, protocol: int) -> tuple[Any, ...]:
+            # Pickled and deep copied unbound with the current value
+            state = dict(field.__getstate__())
+            del state['_binding']
+            state['_value'] = field._load()
+            return object.__new__, (cls,), state
+
+        bound = _BOUND_CLASSES[cls] = type(cls.__name__, (cls,), {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__doc__': cls.__doc__,
+            '__reduce_ex__': reduce_ex,
+            'value': property(get_value, set_value, doc=value.__doc__)})
+    return bound
+
+
+#: Deferred pointer classes by their pointer class.
+_LAZY_CLASSES: dict[type, type] = dict()
+
+
+def _lazy_class(cls: Type[Pointer]) -> Type[Pointer]:
+    """ Returns the deferred variant of the pointer class *cls*, which reads
+    its :attr:`~Pointer.data` object on first access.
+    """
+    lazy = _LAZY_CLASSES.get(cls)
+    if lazy is None:
+        def get_data(pointer: Pointer) -> Structure | Sequence | Field | None:
+            pointer._fetch()
+            return pointer._data
+
+        def set_data(pointer: Pointer,
+                     value: Structure | Sequence | Field | None) -> None:
+            pointer.__dict__['_data'] = value
+
+        def read_from(pointer: Pointer,
+                      provider: Provider,
+                      *args: Any,
+                      **options: Any) -> None:
+            pointer._undefer()
+            pointer.read_from(provider, *args, **options)
+
+        def reduce_ex(pointer: Pointer, protocol: int) -> str | tuple[Any, ...]:
+            # Pickled and deep copied with the read data object
+            pointer._fetch()
+            return pointer.__reduce_ex__(protocol)
+
+        lazy = _LAZY_CLASSES[cls] = type(cls.__name__, (cls,), {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__doc__': cls.__doc__,
+            '__reduce_ex__': reduce_ex,
+            '_data': property(get_data, set_data),
+            'read_from': read_from})
+    return lazy
+
+
+class _OwnerRef(weakref.ref):
+    """ Weak reference to the owner container of an item, which is pickled
+    and deep copied as no owner.
+    """
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _no_owners, ()
+
+
+class _OwnerRefs(tuple):
+    """ Weak references to the owner containers of an item, which are
+    pickled and deep copied as no owners.
+    """
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _no_owners, ()
+
+
+def _no_owners() -> None:
+    """ Returns the owners of an unpickled or deep copied item."""
+    return None
+
+
+def _adopt(owner: Structure | Sequence | Pointer,
+           item: Structure | Sequence | Field) -> None:
+    """ Registers the *owner* container of the *item*, the structural
+    mutations of the *item* invalidate the caches of the *owner*.
+
+    A container registers itself as the owner of its members when it builds
+    a cache, the mutations of its members before are covered by the
+    mutation of the container which added them.
+
+    The owners of an *item* are stored as the weak reference of the owner or
+    as a tuple of the weak references of the owners. An *item* removed from
+    its *owner* keeps the weak reference to it, the *owner* is then only
+    invalidated once too often.
+    """
+    ref = owner.__dict__.get('_owner_ref')
+    if ref is None:
+        ref = owner.__dict__['_owner_ref'] = _OwnerRef(owner)
+    owners = item._owners
+    if owners is None:
+        item.__dict__['_owners'] = ref
+        return
+    if owners.__class__ is not _OwnerRefs:
+        owners = owners,
+    for other in owners:
+        if other is ref:
+            return
+    item.__dict__['_owners'] = _OwnerRefs(
+        (*(other for other in owners if other() is not None), ref))
+
+
+def _adopt_members(container: Structure | Sequence | Pointer) -> None:
+    """ Registers the *container* as the owner of its members and each nested
+    container and :class:`Pointer` field as the owner of its members.
+    """
+    containers = [container]
+    while containers:
+        owner = containers.pop()
+        for item in owner._members():
+            _adopt(owner, item)
+            if isinstance(item, Container):
+                containers.append(item)
+
+
+def _layout_changed(item: Structure | Sequence | Field) -> None:
+    """ Marks a structural mutation of a :class:`Container` or a
+    :class:`Field` layout by incrementing the layout version of the *item*
+    and of all containers which contain the *item*.
+    """
+    if isinstance(item, Container):
+        item.__dict__['_version'] = item._version + 1
+    owners = item._owners
+    if owners is None:
+        return
+    items = [owners]
+    visited = {id(item)}
+    while items:
+        owners = items.pop()
+        if owners.__class__ is _OwnerRefs:
+            items.extend(owners)
+            continue
+        item = owners()
+        if item is None or id(item) in visited:
+            continue
+        visited.add(id(item))
+        item.__dict__['_version'] = item._version + 1
+        if item._owners is not None:
+            items.append(item._owners)
+
+
+def join_field_path(path: tuple[str | int, ...]) -> str:
+    """ Returns the field path string of the field *path* yielded by the
+    :meth:`~Container.iter_field_items` method of a :class:`Container`.
+
+    The member names are joined with a ``'.'`` and the sequence indexes are
+    enclosed in square brackets, the empty field *path* of a :class:`Pointer`
+    field itself is named ``'field'``.
+
+    >>> join_field_path(('structure', 'array', 1, 'pointer', 'data'))
+    'structure.array[1].pointer.data'
+    >>> join_field_path((0, 'decimal'))
+    '[0].decimal'
+    >>> join_field_path(())
+    'field'
+    """
+    if not path:
+        return 'field'
+    parts = list()
+    for component in path:
+        if isinstance(component, int):
+            parts.append(f"[{component}]")
+        elif parts:
+            parts.append(f".{component}")
+        else:
+            parts.append(component)
+    return ''.join(parts)
+
+
 class Patch(NamedTuple):
     """ The :class:`Patch` class contains the relevant information to patch a
     memory area of a `data source` accessed via a data :class:`Provider` by a
@@ -169,6 +543,542 @@ class CustomizedJsonEncoder(json.JSONEncoder):
         return super().default(instance)
 
 
+class _JsonView:
+    """ Lazy JSON view of a :class:`Container`, the *items* are produced on
+    demand while the view is encoded.
+    """
+    __slots__ = ('items', 'mapping')
+
+    def __init__(self, items: Iterable[Any], mapping: bool) -> None:
+        #: ``(key, value)`` pairs of a JSON object or values of a JSON array.
+        self.items = items
+        #: JSON object (True) or JSON array (False).
+        self.mapping = mapping
+
+
+def _json_view(container: Structure | Sequence | Pointer,
+               attributes: tuple[str, ...],
+               fieldnames: tuple[str, ...],
+               nested: bool) -> Any:
+    """ Returns the lazy equivalent of the :meth:`~Container.view_fields`
+    result of the *container*.
+    """
+    if attributes:
+        field_getter = attrgetter(*attributes)
+    else:
+        field_getter = attrgetter('value')
+
+    def field_view(field: Field) -> Any:
+        if len(attributes) > 1:
+            return dict(zip(fieldnames, field_getter(field)))
+        else:
+            return field_getter(field)
+
+    def structure_items(structure: Structure) -> Iterator[tuple[str, Any]]:
+        for name, item in structure.items():
+            # Container or Pointer
+            if is_container(item) or (is_pointer(item) and nested):
+                yield name, view(item)
+            # Field
+            elif is_field(item):
+                yield name, field_view(item)
+
+    def sequence_items(sequence: Sequence) -> Iterator[Any]:
+        for index, item in enumerate(sequence):
+            # Container or Pointer
+            if is_container(item) or (is_pointer(item) and nested):
+                yield view(item)
+            # Field
+            elif is_field(item):
+                yield field_view(item)
+            else:
+                raise MemberTypeError(sequence, item, index)
+
+    def pointer_items(pointer: Pointer) -> Iterator[tuple[str, Any]]:
+        # Pointer field
+        if len(attributes) > 1:
+            yield from zip(attributes, field_getter(pointer))
+        else:
+            yield 'value', field_getter(pointer)
+        # Data object
+        data = pointer._data
+        if is_container(data) or (is_pointer(data) and nested):
+            yield 'data', view(data)
+        elif is_field(data):
+            yield 'data', field_view(data)
+        else:
+            yield 'data', data
+
+    def view(item: Structure | Sequence | Pointer) -> Any:
+        method = type(item).view_fields
+        if method is Structure.view_fields:
+            return _JsonView(structure_items(item), True)
+        elif method is Sequence.view_fields:
+            return _JsonView(sequence_items(item), False)
+        elif method is Pointer.view_fields:
+            return _JsonView(pointer_items(item), True)
+        else:
+            # Customized view of a derived class
+            return item.view_fields(*attributes,
+                                    nested=nested,
+                                    fieldnames=fieldnames)
+
+    return view(container)
+
+
+def _iter_json(value: Any,
+               encoder: json.JSONEncoder) -> Iterator[str]:
+    """ Returns the JSON formatted string chunks of the (lazy) *value* encoded
+    by the :meth:`~json.JSONEncoder.iterencode` method of the JSON *encoder*.
+    A lazy view is expanded into a JSON object or array when it is encoded,
+    the views nested in it are expanded when they are encoded.
+    """
+    default = encoder.default
+
+    def expand(instance: Any) -> Any:
+        if isinstance(instance, _JsonView):
+            if instance.mapping:
+                return dict(instance.items)
+            return list(instance.items)
+        return default(instance)
+
+    encoder.default = expand
+    return encoder.iterencode(value)
+
+
+def _set_value(field: Field, value: Any) -> None:
+    field.value = value
+
+
+def _set_bool(field: Field, value: str) -> None:
+    # Same boolean states as ConfigParser.getboolean()
+    state = ConfigParser.BOOLEAN_STATES.get(value.lower())
+    if state is None:
+        raise ValueError(f"Not a boolean: {value}")
+    field.value = state
+
+
+def _set_float(field: Field, value: str) -> None:
+    field.value = float(value)
+
+
+def _set_stream(field: Stream, value: str) -> None:
+    stream = bytes.fromhex(value.replace("'", ""))
+    # Auto size a zero sized stream field to the current length
+    if not field:
+        field.resize(len(stream))
+    field.value = stream
+
+
+#: Snapshot signature.
+_SNAPSHOT_MAGIC = b'KFSS'
+#: Snapshot format version.
+_SNAPSHOT_VERSION = 1
+#: Snapshot header: signature, version, codec, byte order, layout fingerprint.
+_SNAPSHOT_HEADER = struct.Struct('<4sBBBx16s')
+#: Snapshot pointer record: address and length of the bytestream.
+_SNAPSHOT_RECORD = struct.Struct('<QQ')
+#: Snapshot image length.
+_SNAPSHOT_IMAGE = struct.Struct('<Q')
+#: Snapshot compression codecs.
+_SNAPSHOT_CODECS = ('none', 'zlib', 'lzma', 'bz2')
+
+
+#: Cached layouts of the fields for the layout fingerprints.
+_FIELD_LAYOUTS: dict[tuple[Any, ...], bytes] = dict()
+
+#: Field attributes changing the decoded value of a field for the layout
+#: fingerprints.
+_DECODING_ATTRIBUTES = ('_signed', '_scale', '_bits_integer', '_signed_fraction',
+                        '_enum', '_word_size', '_data_byte_order')
+
+#: Compiled layouts shared by all containers with the same structural layout:
+#: {layout key: compiled layout}
+_LAYOUTS: dict[tuple[Any, ...], _Layout] = dict()
+
+#: Struct format characters of the byte aligned decimal fields by their size
+#: in bytes: (unsigned, signed)
+_DECIMAL_FORMATS = {1: ('B', 'b'), 2: ('H', 'h'), 4: ('I', 'i'), 8: ('Q', 'q')}
+
+
+def _field_format(field: Field) -> tuple[str, Byteorder] | None:
+    """ Returns the struct format character and the byte order of a *field*
+    which can be de-/serialized with a :class:`struct.Struct` of a compiled
+    layout, otherwise :data:`None`.
+    """
+    cls = field.__class__
+    if (cls.deserialize is not Field.deserialize or
+            cls.serialize is not Field.serialize):
+        return None
+    if cls.unpack is Decimal.unpack and cls.pack is Decimal.pack:
+        size, offset = divmod(field._bit_size, 8)
+        formats = _DECIMAL_FORMATS.get(size)
+        if (offset or formats is None or
+                field._align_to_byte_size != size or
+                field._align_to_bit_offset):
+            return None
+        return formats[bool(field._signed)], field._byte_order
+    elif cls.unpack is Float.unpack and cls.pack is Float.pack:
+        return 'f', field._byte_order
+    elif cls.unpack is Double.unpack and cls.pack is Double.pack:
+        return 'd', field._byte_order
+    return None
+
+
+class _FieldGroup(NamedTuple):
+    """ Codec of the members of a field group in a compiled layout which
+    are de-/serialized together from one integer of the group content.
+    """
+    #: Size of the field group in bytes.
+    size: int
+    #: Byte order value of the buffer.
+    byte_order: str
+    #: Bit shift, bit mask, minimum, maximum and bit flag of each member.
+    members: tuple[tuple[int, int, int, int, bool], ...]
+
+
+def _field_group(field: Field) -> tuple[int, Byteorder, int,
+                                        tuple[int, int, int, bool]] | None:
+    """ Returns the group size in bytes, the byte order, the bit size and the
+    bit mask, minimum, maximum and bit flag of a *field* which can be
+    de-/serialized with the other members of its field group from the group
+    content of a compiled layout, otherwise :data:`None`.
+    """
+    cls = field.__class__
+    if (cls.deserialize is not Field.deserialize or
+            cls.serialize is not Field.serialize or
+            cls.unpack is not Decimal.unpack or
+            cls.pack is not Decimal.pack):
+        return None
+    return (field._align_to_byte_size, field._byte_order, field._bit_size,
+            (field.bit_mask(), field.min(), field.max(), field.is_bit()))
+
+
+class _Layout:
+    """ Compiled layout of the fields of a :class:`Structure` or
+    :class:`Sequence` and its nested containers, shared by all containers
+    with the same structural layout.
+
+    A layout is only compiled from fields indexed by a validated
+    de-serialization, serialization or indexing. Containers with a compiled
+    layout are trusted: the field indexes are set from the index table of
+    the layout without validating them again.
+
+    The byte aligned :class:`Decimal`, :class:`Float` and :class:`Double`
+    fields are de-/serialized in runs of adjacent fields with one
+    :class:`struct.Struct`, the :class:`Decimal` fields of a field group
+    together from one integer of the group content, and all other fields
+    with their own :meth:`~Field.unpack` and :meth:`~Field.pack` methods.
+    """
+    __slots__ = ('indexes', 'size', 'formats', 'groups', 'codecs')
+
+    def __init__(self,
+                 indexes: tuple[tuple[int, int], ...],
+                 size: tuple[int, int],
+                 formats: tuple[tuple[str, Byteorder] | None, ...],
+                 groups: tuple[tuple[Any, ...] | None, ...]) -> None:
+        #: Relative index (byte, bit) of each field.
+        self.indexes = indexes
+        #: Relative index (byte, bit) after the last field.
+        self.size = size
+        #: Struct format character and byte order of each field or None.
+        self.formats = formats
+        #: Field group codec parameters of each field or None.
+        self.groups = groups
+        #: Codec steps by the byte order of the buffer.
+        self.codecs: dict[Byteorder, list[tuple[Any, ...]]] = dict()
+
+    @classmethod
+    def compile(cls,
+                fields: tuple[Field, ...],
+                start: Index,
+                end: Index) -> _Layout:
+        """ Returns the compiled layout of the *fields* indexed from the
+        *start* index to the *end* index.
+        """
+        indexes = tuple((field._index.byte - start.byte, field._index.bit)
+                        for field in fields)
+        size = (end.byte - start.byte, end.bit)
+        formats = tuple(_field_format(field) if not bit else None
+                        for field, (byte, bit) in zip(fields, indexes))
+        groups = tuple(_field_group(field) if fmt is None else None
+                       for field, fmt in zip(fields, formats))
+        return cls(indexes, size, formats, groups)
+
+    def _after(self, position: int) -> tuple[int, int]:
+        """ Returns the relative index (byte, bit) after the field at the
+        *position*.
+        """
+        if position + 1 < len(self.indexes):
+            return self.indexes[position + 1]
+        return self.size
+
+    def _group(self,
+               byte: int,
+               positions: list[int],
+               byte_order: Byteorder) -> list[tuple[Any, ...]]:
+        """ Returns the codec steps for the fields at the *positions* which
+        start in the same byte of the layout.
+
+        The fields are de-/serialized together with one
+        ``(field group, offset, positions, shifts)`` step if all of them are
+        members of the same field group and none of them needs its own byte
+        order conversion, otherwise each field has its own step.
+        """
+        groups = [self.groups[position] for position in positions]
+        if all(group is not None for group in groups):
+            size = groups[0][0]
+            if all(group[0] == size and
+                   (group[1] is Byteorder.auto or
+                    group[1] is byte_order or
+                    group[2] <= 8)
+                   for group in groups):
+                shifts = tuple(self.indexes[position][1]
+                               for position in positions)
+                members = tuple((shift, *group[3])
+                                for shift, group in zip(shifts, groups))
+                return [(_FieldGroup(size, byte_order.value, members),
+                         byte, tuple(positions), shifts)]
+        return [(None, byte, position, self._after(position))
+                for position in positions]
+
+    def codec(self, byte_order: Byteorder) -> list[tuple[Any, ...]]:
+        """ Returns the codec steps for a buffer with the *byte order*.
+
+        A step is either ``(struct, offset, positions, offsets)`` for a run
+        of fields, ``(field group, offset, positions, shifts)`` for the
+        members of a field group, or ``(None, offset, position, index)`` for
+        a single field with the relative index (byte, bit) after the field.
+        """
+        steps = self.codecs.get(byte_order)
+        if steps is not None:
+            return steps
+        steps = list()
+        run = None
+        group = None
+        positions = range(len(self.formats))
+        layout = zip(positions, self.formats, self.indexes)
+        for position, fmt, (byte, bit) in layout:
+            if fmt is None:
+                if group is not None and group[1] == byte:
+                    group[2].append(position)
+                else:
+                    group = [None, byte, [position]]
+                    steps.append(group)
+                run = None
+                continue
+            group = None
+            char, order = fmt
+            if order is Byteorder.auto:
+                order = byte_order
+            if run is not None and run[0] is order and run[1] == byte:
+                run[1] += struct.calcsize(char)
+                run[2] += char
+                run[4].append(position)
+                run[5].append(byte)
+            else:
+                run = [order, byte + struct.calcsize(char), char,
+                       byte, [position], [byte]]
+                steps.append(run)
+        codecs = list()
+        for step in steps:
+            if step[0] is None:
+                codecs += self._group(step[1], step[2], byte_order)
+            else:
+                order, _, chars, byte, members, offsets = step
+                prefix = '>' if order is Byteorder.big else '<'
+                codecs.append((struct.Struct(prefix + chars), byte,
+                               tuple(members), tuple(offsets)))
+        self.codecs[byte_order] = codecs
+        return codecs
+
+    def _trusted(self,
+                 index: Index,
+                 context: TraversalContext) -> bool:
+        """ Returns :data:`True` if the layout can be applied starting with
+        the given *index* with the traversal *context*.
+        """
+        byte, bit, address, base, update = index
+        return (not bit and byte >= 0 and address >= 0 and
+                (context.byte_order is Byteorder.big or
+                 context.byte_order is Byteorder.little))
+
+    def deserialize(self,
+                    fields: tuple[Field, ...],
+                    buffer: bytes,
+                    index: Index,
+                    context: TraversalContext) -> Index | None:
+        """ De-serializes the *fields* of the layout from the byte *buffer*
+        starting with the given *index* and returns the :class:`Index` after
+        the last field, or :data:`None` if the compiled layout can not be
+        used for the *buffer* or the *index*.
+        """
+        byte, bit, address, base, update = index
+        if (not self._trusted(index, context) or
+                len(buffer) < byte + self.size[0] + bool(self.size[1])):
+            return None
+        new_index = tuple.__new__
+        from_bytes = int.from_bytes
+        for codec, offset, members, offsets in self.codec(context.byte_order):
+            if codec.__class__ is _FieldGroup:
+                start = byte + offset
+                content = from_bytes(buffer[start:start + codec.size],
+                                     codec.byte_order)
+                for position, (shift, mask, minimum, maximum, is_bit) in zip(
+                        members, codec.members):
+                    field = fields[position]
+                    field._index = new_index(Index, (start, shift,
+                                                     address + offset,
+                                                     base, update))
+                    if not is_bit:
+                        field._align_to_bit_offset = shift
+                    value = (content >> shift) & mask
+                    if value > maximum:
+                        value |= ~mask
+                    field._value = value
+                continue
+            if codec is not None:
+                values = codec.unpack_from(buffer, byte + offset)
+                for position, value, shift in zip(members, values, offsets):
+                    field = fields[position]
+                    field._index = new_index(Index, (byte + shift, 0,
+                                                     address + shift,
+                                                     base, update))
+                    field._align_to_bit_offset = 0
+                    field._value = value
+                continue
+            field = fields[members]
+            start = new_index(Index, (byte + offset,
+                                      self.indexes[members][1],
+                                      address + offset,
+                                      base, update))
+            if not _is_hooked(field.__class__, 'deserialize'):
+                field._decode(buffer, start, context)
+                continue
+            after = field.deserialize(buffer, start, **context.options())
+            if after.byte - byte != offsets[0] or after.bit != offsets[1]:
+                # Field changed its size: de-serialize the fields behind
+                for field in fields[members + 1:]:
+                    after = _deserialize_item(field, buffer, after, context)
+                return after
+        return Index(byte + self.size[0], self.size[1],
+                     address + self.size[0], base, update)
+
+    def serialize(self,
+                  fields: tuple[Field, ...],
+                  buffer: bytearray,
+                  index: Index,
+                  context: TraversalContext) -> Index | None:
+        """ Serializes the *fields* of the layout to the byte *buffer*
+        starting with the given *index* and returns the :class:`Index` after
+        the last field, or :data:`None` if the compiled layout can not be
+        used for the *buffer* or the *index*.
+        """
+        byte, bit, address, base, update = index
+        if not self._trusted(index, context) or len(buffer) != byte:
+            return None
+        new_index = tuple.__new__
+        for codec, offset, members, offsets in self.codec(context.byte_order):
+            if codec.__class__ is _FieldGroup:
+                content = 0
+                for position, (shift, mask, minimum, maximum, is_bit) in zip(
+                        members, codec.members):
+                    field = fields[position]
+                    field._index = new_index(Index, (byte + offset, shift,
+                                                     address + offset,
+                                                     base, update))
+                    if not is_bit:
+                        field._align_to_bit_offset = shift
+                    content |= (clamp(field._value, minimum, maximum) &
+                                mask) << shift
+                buffer += content.to_bytes(codec.size, codec.byte_order)
+                continue
+            if codec is not None:
+                values = list()
+                for position, shift in zip(members, offsets):
+                    field = fields[position]
+                    field._index = new_index(Index, (byte + shift, 0,
+                                                     address + shift,
+                                                     base, update))
+                    field._align_to_bit_offset = 0
+                    values.append(field._value)
+                try:
+                    buffer += codec.pack(*values)
+                except struct.error:
+                    # Field value out of range: let the fields pack them
+                    for position in members:
+                        field = fields[position]
+                        buffer += field.pack(buffer,
+                                             byte_order=context.byte_order)
+                continue
+            field = fields[members]
+            start = new_index(Index, (byte + offset,
+                                      self.indexes[members][1],
+                                      address + offset,
+                                      base, update))
+            if not _is_hooked(field.__class__, 'serialize'):
+                field._encode(buffer, start, context)
+                continue
+            after = field.serialize(buffer, start, **context.options())
+            if after.byte - byte != offsets[0] or after.bit != offsets[1]:
+                # Field changed its size: serialize the fields behind
+                for field in fields[members + 1:]:
+                    after = _serialize_item(field, buffer, after, context)
+                return after
+        return Index(byte + self.size[0], self.size[1],
+                     address + self.size[0], base, update)
+
+    def index_fields(self,
+                     fields: tuple[Field, ...],
+                     index: Index,
+                     context: TraversalContext) -> Index | None:
+        """ Indexes the *fields* of the layout starting with the given
+        *index* and returns the :class:`Index` after the last field, or
+        :data:`None` if the compiled layout can not be used for the *index*.
+        """
+        byte, bit, address, base, update = index
+        if bit or byte < 0 or address < 0:
+            return None
+        new_index = tuple.__new__
+        for field, (offset, shift) in zip(fields, self.indexes):
+            field._index = new_index(Index, (byte + offset, shift,
+                                             address + offset,
+                                             base, update))
+            if not field.is_bit():
+                field._align_to_bit_offset = shift
+            if context.nested and is_pointer(field):
+                field.index_data()
+        return Index(byte + self.size[0], self.size[1],
+                     address + self.size[0], base, update)
+
+
+#: Cached value converters for the field classes: {(field class, ini): setter}
+_CONVERTERS: dict[tuple[type, bool], Callable[[Field, Any], None]] = dict()
+
+
+def _get_converter(cls: Type[Field],
+                   ini: bool) -> Callable[[Field, Any], None]:
+    """ Returns the value converter for the fields of the *cls* which sets the
+    field value from an ``.ini`` file string (*ini*) or from a JSON value.
+    """
+    converter = _CONVERTERS.get((cls, ini))
+    if converter is None:
+        if cls.is_string():
+            converter = _set_value
+        elif cls.is_stream():
+            converter = _set_stream
+        elif not ini:
+            converter = _set_value
+        elif cls.is_bool():
+            converter = _set_bool
+        elif cls.is_float():
+            converter = _set_float
+        else:
+            converter = _set_value
+        _CONVERTERS[(cls, ini)] = converter
+    return converter
+
+
 class Container:
     """ The :class:`Container` class is an *abstract interface* for all classes
     which can contain :class:`Field` items. Container classes are
@@ -180,6 +1090,17 @@ class Container:
     The :class:`Container` class provides core features to **view**, **save**
     and **load** the *attributes* of the :class:`Field` items in the `Container`.
     """
+    # Layout version, incremented by each structural mutation of the
+    # container or of its nested containers and fields
+    _version: int = 0
+    # Weak reference or weak references to the containers of the container
+    _owners: weakref.ref | tuple[weakref.ref, ...] | None = None
+    # Cached path index: (version, {'field path': field})
+    _path_index: tuple[int, dict[str, Field]] | None = None
+    # Cached compiled layout: (version, layout, fields, layout key)
+    _layout_cache: tuple[int, _Layout | None,
+                         tuple[Field, ...],
+                         tuple[Any, ...] | None] | None = None
 
     @abc.abstractmethod
     def view_fields(self,
@@ -223,6 +1144,196 @@ class Container:
         """
         return list()
 
+    @abc.abstractmethod
+    def iter_field_items(self,
+                         path: tuple[str | int, ...] = (),
+                         **options: Any) -> Iterator[tuple[tuple[str | int, ...],
+                                                           Field]]:
+        """ Yields a **flatten** sequence of ``(field path, field item)``
+        tuples for each :class:`Field` *nested* in the `Container`.
+
+        The field path is a :class:`tuple` of the member names and sequence
+        indexes to the field item. Use :func:`join_field_path` to get the
+        field path string of the field path.
+
+        :param tuple path: item path.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            :attr:`~Pointer.data` objects of all :class:`Pointer` fields in the
+            `Container` yield their referenced :attr:`~Pointer.data` object
+            field items as well (chained method call).
+
+        .. note::
+            This abstract method must be implemented by a derived class.
+        """
+        yield from ()
+
+    def path_index(self) -> Mapping[str, Field]:
+        """ Returns a read-only mapping of the ``{'field path': field}`` pairs
+        for each :class:`Field` *nested* in the `Container` including the
+        fields of the :attr:`~Pointer.data` objects of all :class:`Pointer`
+        fields (nested).
+
+        The path index is built once by walking the `Container` and cached
+        until the next structural mutation of the `Container` or of one of
+        its nested containers and fields, the field path strings are equal
+        to the field paths of :meth:`field_items`.
+
+        Example:
+
+        >>> structure = Structure(a=Byte(), b=Structure(c=Byte()))
+        >>> list(structure.path_index())
+        ['a', 'b.c']
+        >>> structure.b.d = Byte()
+        >>> list(structure.path_index())
+        ['a', 'b.c', 'b.d']
+        """
+        cache = self._path_index
+        if cache is None or cache[0] != self._version:
+            index = {join_field_path(item_path): field
+                     for item_path, field in self.iter_field_items(nested=True)}
+            _adopt_members(self)
+            cache = self._path_index = (self._version, index)
+        return MappingProxyType(cache[1])
+
+    def _layout_plan(self) -> tuple[_Layout | None, tuple[Field, ...]]:
+        """ Returns the shared compiled layout of the `Container` or
+        :data:`None` if the layout is not compiled yet, and the fields of the
+        `Container` and its nested containers.
+
+        The plan is cached until the next structural mutation of the
+        `Container` or of one of its nested containers and fields.
+        """
+        cache = self._layout_cache
+        if cache is None or cache[0] != self._version:
+            fields = list()
+            key = self._layout_key(fields)
+            layout = _LAYOUTS.get(key) if key is not None else None
+            cache = self._layout_cache = (self._version, layout,
+                                          tuple(fields), key)
+        return cache[1], cache[2]
+
+    def _compile_layout(self, start: Index, end: Index) -> None:
+        """ Compiles the layout of the `Container` de-serialized from the
+        *start* index to the *end* index, unless it is already compiled or
+        can not be compiled.
+        """
+        cache = self._layout_cache
+        if (start.bit or cache is None or cache[0] != self._version or
+                cache[1] is not None or cache[3] is None):
+            return
+        version, layout, fields, key = cache
+        layout = _LAYOUTS.get(key)
+        if layout is None:
+            layout = _LAYOUTS[key] = _Layout.compile(fields, start, end)
+        self._layout_cache = (version, layout, fields, key)
+
+    def _compiled_size(self) -> tuple[int, int] | None:
+        """ Returns the size of the compiled layout of the `Container` as a
+        tuple in the form of ``(number of bytes, remaining number of bits)``
+        or :data:`None` if no up-to-date compiled layout exists.
+        """
+        cache = self._layout_cache
+        if cache is None or cache[0] != self._version or cache[1] is None:
+            return None
+        return cache[1].size
+
+    def __getstate__(self) -> dict[str, Any] | None:
+        # The caches are rebuilt on demand
+        state = self.__dict__.copy()
+        state.pop('_path_index', None)
+        state.pop('_layout_cache', None)
+        state.pop('_owners', None)
+        state.pop('_owner_ref', None)
+        state.pop('_version', None)
+        return state or None
+
+    def _members(self) -> Iterable[Structure | Sequence | Field]:
+        """ Returns the items directly contained in the `Container`."""
+        return ()
+
+    def _lookup_fields(self,
+                       paths: Iterable[str],
+                       name: str) -> list[tuple[str, Field]]:
+        """ Returns the ``(path, field)`` pairs for the field *paths* with or
+        without the leading *name* of the `Container`.
+        """
+        index = self.path_index()
+        fields = list()
+        for path in paths:
+            field = index.get(path)
+            if field is None and path.startswith(name):
+                tail = path[len(name):]
+                if tail.startswith('.'):
+                    field = index.get(tail[1:])
+                elif tail.startswith('['):
+                    field = index.get(tail)
+            if field is None:
+                raise KeyError(path)
+            fields.append((path, field))
+        return fields
+
+    def get_values(self,
+                   paths: Iterable[str],
+                   *attributes: str,
+                   **options: Any) -> dict[str, Any | tuple[Any, ...]]:
+        """ Returns a :class:`dict` of ``{'field path': attribute}`` or
+        ``{'field path': tuple(attributes)}`` pairs for the fields *nested*
+        in the `Container` selected by their field *paths*.
+
+        The fields are looked-up in the cached :meth:`path_index`.
+
+        :param paths: field paths with or without the leading *name* of the
+            `Container`. The field path of a :attr:`~Pointer.data` object is
+            ``'pointer.data'``.
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword str name: name of the `Container`.
+            Default is the class name of the instance.
+        :raises KeyError: if a field path does not exist in the `Container`.
+
+        Example:
+
+        >>> class Foo(Structure):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.decimal = Decimal(8)
+        ...         self.array = Array(Byte, 2)
+        ...         self.pointer = Pointer(Structure(x=Decimal(16)))
+        >>> foo = Foo()
+        >>> foo.set_values({'Foo.decimal': 1, 'array[1]': 2, 'pointer.data.x': 3})
+        >>> foo.get_values(['Foo.decimal', 'array[1]', 'pointer.data.x'])
+        {'Foo.decimal': 1, 'array[1]': '0x2', 'pointer.data.x': 3}
+        >>> foo.get_values(['decimal'], 'name', 'bit_size')
+        {'decimal': ('Decimal8', 8)}
+        """
+        name = options.pop('name', self.__class__.__name__)
+        if attributes:
+            field_getter = attrgetter(*attributes)
+        else:
+            field_getter = attrgetter('value')
+        return {path: field_getter(field)
+                for path, field in self._lookup_fields(paths, name)}
+
+    def set_values(self,
+                   values: Mapping[str, Any],
+                   **options: Any) -> None:
+        """ Sets the field :attr:`~Field.value` of the fields *nested* in the
+        `Container` selected by the field paths of the ``{'field path':
+        value}`` *values*.
+
+        The fields are looked-up in the cached :meth:`path_index`, no field
+        value is set if a field path does not exist in the `Container`.
+
+        :param values: ``{'field path': value}`` pairs with or without the
+            leading *name* of the `Container` in the field paths.
+        :keyword str name: name of the `Container`.
+            Default is the class name of the instance.
+        :raises KeyError: if a field path does not exist in the `Container`.
+        """
+        name = options.pop('name', self.__class__.__name__)
+        for path, field in self._lookup_fields(values.keys(), name):
+            field.value = values[path]
+
     @nested_option()
     def to_list(self,
                 *attributes: str,
@@ -251,8 +1362,8 @@ class Container:
             field_getter = attrgetter(*attributes)
         else:
             field_getter = attrgetter('value')
-        for item in self.field_items(**options):
-            field_path, field = item
+        for item_path, field in _iter_field_items(self, (), options):
+            field_path = join_field_path(item_path)
             if field_path.startswith('['):
                 # Sequence
                 field_path = f"{name}{field_path}"
@@ -291,8 +1402,8 @@ class Container:
             field_getter = attrgetter(*attributes)
         else:
             field_getter = attrgetter('value')
-        for item in self.field_items(**options):
-            field_path, field = item
+        for item_path, field in _iter_field_items(self, (), options):
+            field_path = join_field_path(item_path)
             if save and field_path.startswith('['):
                 # Sequence element
                 field_path = '_' + field_path
@@ -359,12 +1470,122 @@ class Container:
             array[2] = 0x0
             pointer = 0x0
         """
-        options['save'] = True
-        parser = ConfigParser()
-        parser.read_dict(self.to_dict(*attributes, **options))
+        section = str(options.get('name', self.__class__.__name__))
+        self._check_ini_options(section, options)
         with open(file, 'w') as file_:
-            parser.write(file_)
-        file_.close()
+            self.dump_ini(file_, *attributes, **options)
+
+    def _check_ini_options(self,
+                           section: str,
+                           options: dict[str, Any]) -> None:
+        """ Raises a :class:`~configparser.DuplicateOptionError` in the same
+        manner as the :class:`~configparser.ConfigParser` if the field paths
+        of two fields *nested* in the `Container` are converted to the same
+        option name in the *section* of an ``.ini`` file.
+
+        The field paths are only compared if the member names of a nested
+        :class:`Structure` collide.
+        """
+        optionxform = ConfigParser().optionxform
+        nested = get_nested(options)
+        items = [self]
+        while items:
+            item = items.pop()
+            if is_structure(item) and len(set(map(optionxform, item))) < len(item):
+                break
+            for member in item._members():
+                if is_container(member) or (nested and is_pointer(member)):
+                    items.append(member)
+        else:
+            return
+
+        names = set()
+        for item_path, field in _iter_field_items(self, (), options):
+            field_path = join_field_path(item_path)
+            if field_path.startswith('['):
+                # Sequence element
+                field_path = '_' + field_path
+            option = optionxform(field_path)
+            if option in names:
+                raise DuplicateOptionError(section, option, '<dict>')
+            names.add(option)
+
+    @nested_option()
+    def dump_ini(self,
+                 fp: TextIO,
+                 *attributes: str,
+                 **options: Any) -> None:
+        """ Writes the selected field *attributes* for each :class:`Field`
+        *nested* in the `Container` in the ``.ini`` file format to the text
+        file object *fp*.
+
+        The lines are written while walking the `Container`, the output is
+        identical to :meth:`save` but no intermediate dictionary and
+        :class:`~configparser.ConfigParser` of the complete content is built.
+        Field paths converted to the same option name raise a
+        :class:`~configparser.DuplicateOptionError` before a line is written,
+        like the :class:`~configparser.ConfigParser` does.
+
+        :param fp: writable text file object.
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword str name: name of the section in the ``.ini`` file.
+            Default is the class name of the instance.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` writes their referenced :attr:`~Pointer.data` object
+            field attributes as well (chained method call).
+
+        Example:
+
+        >>> import io
+        >>> class Foo(Structure):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.float = Float()
+        ...         self.structure = Structure()
+        ...         self.structure.decimal = Decimal(8)
+        ...         self.array = Array(Byte, 2)
+        >>> text = io.StringIO()
+        >>> Foo().dump_ini(text)
+        >>> print(text.getvalue())
+        [Foo]
+        float = 0.0
+        structure.decimal = 0
+        array[0] = 0x0
+        array[1] = 0x0
+        <BLANKLINE>
+        <BLANKLINE>
+        >>> try:
+        ...     Structure(Value=Byte(), value=Byte()).dump_ini(text)
+        ... except DuplicateOptionError as error:
+        ...     print(error)
+        While reading from '<dict>': option 'value' in section 'Structure' already exists
+        """
+        # Name of the section
+        section = str(options.pop('name', self.__class__.__name__))
+        self._check_ini_options(section, options)
+        parser = ConfigParser()
+        interpolation = BasicInterpolation()
+
+        if attributes:
+            field_getter = attrgetter(*attributes)
+        else:
+            field_getter = attrgetter('value')
+
+        fp.write(f"[{section}]\n")
+        for item_path, field in _iter_field_items(self, (), options):
+            field_path = join_field_path(item_path)
+            if field_path.startswith('['):
+                # Sequence element
+                field_path = '_' + field_path
+            option = parser.optionxform(field_path)
+            value = str(field_getter(field))
+            if value:
+                # Same checks as the ConfigParser
+                interpolation.before_set(parser, section, option, value)
+            value = value.replace('\n', '\n\t')
+            fp.write(f"{option} = {value}\n")
+        fp.write("\n")
 
     @nested_option()
     @verbose_option(True)
@@ -442,7 +1663,8 @@ class Container:
         if parser.has_section(section):
             verbose(options, f"[{section}]")
 
-            for field_path, field in self.field_items(**options):
+            for item_path, field in _iter_field_items(self, (), options):
+                field_path = join_field_path(item_path)
                 if field_path.startswith('['):
                     # Sequence element
                     option = '_' + field_path
@@ -478,6 +1700,150 @@ class Container:
         else:
             verbose(options, f"No section [{section}] found.")
 
+    @nested_option()
+    @verbose_option(False)
+    def bulk_load(self,
+                  file: str,
+                  **options: Any) -> None:
+        """ Loads the field *value* for each :class:`Field` *nested* in the
+        `Container` from an ``.ini`` *file* written by :meth:`save` or from a
+        ``.json`` *file* written by :meth:`write_json`.
+
+        The *file* is parsed once and the value converter for the fields is
+        decided once per field class, the field values of a ``.json`` *file*
+        are resolved with the :meth:`path_index` of the `Container`.
+        A *file* with the suffix ``.json`` is loaded as a JSON file, all other
+        files are loaded as an ``.ini`` file.
+
+        :param str file: name and location of the ``.ini`` or ``.json`` file.
+        :keyword str section: section in the ``.ini`` file to look-up the
+            value for each :class:`Field` in the `Container`.
+            If no *section* is specified the class name of the instance is used.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` load their referenced :attr:`~Pointer.data` object field
+            values as well (chained method call).
+        :keyword bool verbose: if :data:`True` the loading is executed in verbose
+            mode. Defaults to ``False``.
+
+        Example:
+
+        >>> import os, tempfile
+        >>> class Foo(Structure):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.stream = Stream()
+        ...         self.float = Float()
+        ...         self.array = Array(Byte, 2)
+        ...         self.pointer = Pointer(Structure(x=Decimal(8)))
+        >>> foo = Foo()
+        >>> foo.initialize_fields({'stream': '0102', 'float': 1.5,
+        ...                        'array': [1, 2],
+        ...                        'pointer': {'value': 16, 'data': {'x': 3}}})
+        >>> folder = tempfile.mkdtemp()
+        >>> foo.save(os.path.join(folder, 'foo.ini'), nested=True)
+        >>> foo.write_json(os.path.join(folder, 'foo.json'), nested=True)
+        >>> bar = Foo()
+        >>> bar.bulk_load(os.path.join(folder, 'foo.ini'), nested=True)
+        >>> bar.to_list(nested=True) == foo.to_list(nested=True)
+        True
+        >>> bar = Foo()
+        >>> bar.bulk_load(os.path.join(folder, 'foo.json'), nested=True)
+        >>> bar.to_list(nested=True) == foo.to_list(nested=True)
+        True
+        """
+        if str(file).lower().endswith('.json'):
+            section = self.__class__.__name__
+            ini = False
+            with open(file) as file_:
+                content = json.load(file_)
+            verbose(options, f"[{section}]")
+            items = self._json_items(content, get_nested(options))
+        else:
+            section = options.pop('section', self.__class__.__name__)
+            ini = True
+            parser = ConfigParser()
+            with open(file) as file_:
+                parser.read_file(file_)
+            if not parser.has_section(section):
+                verbose(options, f"No section [{section}] found.")
+                return
+            verbose(options, f"[{section}]")
+            items = self._ini_items(dict(parser.items(section)),
+                                    get_nested(options))
+
+        is_verbose = options.get('verbose', False)
+        for field_path, field, value in items:
+            _get_converter(field.__class__, ini)(field, value)
+            if not is_verbose:
+                continue
+            elif field_path.startswith('['):
+                verbose(options, f"{section}{field_path} = {field.value}")
+            else:
+                verbose(options, f"{section}.{field_path} = {field.value}")
+
+    def _ini_items(self,
+                   values: dict[str, str],
+                   nested: bool) -> Iterator[tuple[str, Field, str]]:
+        """ Yields the ``(field path, field, value)`` items for the fields
+        *nested* in the `Container` with a value in the ``.ini`` file
+        section *values*.
+
+        The fields are looked-up in the :meth:`path_index` of the `Container`.
+        """
+        optionxform = ConfigParser().optionxform
+        # Field path of the data object of a skipped Pointer field
+        skipped = None
+        for field_path, field in self.path_index().items():
+            if skipped is not None:
+                if (field_path == skipped or
+                        field_path.startswith((skipped + '.', skipped + '['))):
+                    continue
+                skipped = None
+            if is_pointer(field) and field is not self and not nested:
+                skipped = field_path + '.data'
+            if field_path.startswith('['):
+                # Sequence element
+                option = optionxform('_' + field_path)
+            else:
+                option = optionxform(field_path)
+            if option in values:
+                yield field_path, field, values[option]
+
+    def _json_items(self,
+                    content: Any,
+                    nested: bool) -> Iterator[tuple[str, Field, Any]]:
+        """ Yields the ``(field path, field, value)`` items for the fields
+        *nested* in the `Container` with a value in the JSON *content*
+        written by :meth:`write_json`.
+
+        The fields are looked-up in the :meth:`path_index` of the `Container`.
+        """
+        index = self.path_index()
+
+        def flatten(path: str, node: Any) -> Iterator[tuple[str, Field, Any]]:
+            if isinstance(node, dict):
+                pointer = index.get(path if path else 'field')
+                if is_pointer(pointer):
+                    # Pointer field with its data object
+                    if 'value' in node:
+                        yield path if path else 'field', pointer, node['value']
+                    if nested or not path:
+                        yield from flatten(f"{path}.data" if path else 'data',
+                                           node.get('data'))
+                else:
+                    for name, item in node.items():
+                        yield from flatten(f"{path}.{name}" if path else name,
+                                           item)
+            elif isinstance(node, list):
+                for number, item in enumerate(node):
+                    yield from flatten(f"{path}[{number}]", item)
+            else:
+                field = index.get(path if path else 'field')
+                if field is not None:
+                    yield path if path else 'field', field, node
+
+        return flatten(str(), content)
+
     @nested_option()
     def to_json(self,
                 *attributes: str,
@@ -504,97 +1870,816 @@ class Container:
                                                fieldnames=fieldnames),
                               **options)
         else:
-            return json.dumps(self.view_fields(*attributes,
-                                               nested=nested,
-                                               fieldnames=fieldnames),
-                              cls=CustomizedJsonEncoder,
-                              **options)
+            return json.dumps(self.view_fields(*attributes,
+                                               nested=nested,
+                                               fieldnames=fieldnames),
+                              cls=CustomizedJsonEncoder,
+                              **options)
+
+    @nested_option()
+    def write_json(self,
+                   file: str,
+                   *attributes: str,
+                   **options: Any) -> None:
+        """ Writes the selected field *attributes* for each :class:`Field`
+        *nested* in the `Container` to a ``.json`` *file*.
+
+        :param str file: name and location of the ``.json`` *file*.
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for the
+            field *path* and the selected field *attributes*.
+            Defaults to ``(*attributes)``.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` lists their referenced :attr:`~Pointer.data` object field
+            attributes as well (chained method call).
+        """
+        with open(file, 'w', newline='') as file_:
+            self.dump_json(file_, *attributes, **options)
+
+    @nested_option()
+    def dump_json(self,
+                  fp: TextIO,
+                  *attributes: str,
+                  **options: Any) -> None:
+        """ Writes the selected field *attributes* for each :class:`Field`
+        *nested* in the `Container` as a JSON formatted stream to the text file
+        object *fp*.
+
+        The JSON chunks are written while walking the `Container`, the output
+        is identical to :meth:`to_json` but no intermediate view of the
+        complete `Container` and no complete JSON string is built.
+
+        :param fp: writable text file object.
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for the
+            selected field *attributes*. Defaults to ``(*attributes)``.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` views their referenced :attr:`~Pointer.data` object field
+            attributes as well (chained method call).
+
+        The remaining *options* are forwarded to the JSON encoder class
+        (keyword ``cls``) like for :func:`json.dumps`.
+
+        Example:
+
+        >>> import io
+        >>> class Foo(Structure):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.stream = Stream()
+        ...         self.structure = Structure()
+        ...         self.structure.decimal = Decimal(8)
+        ...         self.array = Array(Byte, 2)
+        ...         self.pointer = Pointer()
+        >>> foo = Foo()
+        >>> text = io.StringIO()
+        >>> foo.dump_json(text, nested=True, indent=2)
+        >>> text.getvalue() == foo.to_json(nested=True, indent=2)
+        True
+        >>> print(text.getvalue())
+        {
+          "stream": "",
+          "structure": {
+            "decimal": 0
+          },
+          "array": [
+            "0x0",
+            "0x0"
+          ],
+          "pointer": {
+            "value": "0x0",
+            "data": null
+          }
+        }
+        """
+        nested = options.pop('nested', False)
+        fieldnames = options.pop('fieldnames', attributes)
+        encoder = options.pop('cls', CustomizedJsonEncoder)(**options)
+        fp.writelines(_iter_json(_json_view(self, attributes, fieldnames, nested),
+                                 encoder))
+
+    @staticmethod
+    def _get_fieldnames(*attributes: str,
+                        **options: Any) -> list[str]:
+        # Default dictionary keys
+        keys = ['id']
+        if attributes:
+            keys.extend(attributes)
+        else:
+            keys.append('value')
+        # Customized dictionary keys
+        return options.get('fieldnames', keys)
+
+    @nested_option()
+    def to_csv(self,
+               *attributes: str,
+               **options: Any) -> list[dict[str, Any]]:
+        """ Returns a **flatten** list of dictionaries containing the field
+        *path* and the selected field *attributes* for each :class:`Field`
+        *nested* in the `Container`.
+
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword str name: name of the `Container`.
+            Default is the class name of the instance.
+        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for
+            the field *path* and the selected field *attributes*.
+            Defaults to ``('id', *attributes)``.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` lists their referenced :attr:`~Pointer.data` object field
+            attributes as well (chained method call).
+        """
+        keys = self._get_fieldnames(*attributes, **options)
+        options['chain'] = True
+        return [dict(zip(keys, field)) for field in
+                self.to_list(*attributes, **options)]
+
+    @nested_option()
+    def write_csv(self,
+                  file: str,
+                  *attributes: str,
+                  **options: Any) -> None:
+        """ Writes the field *path* and the selected field *attributes* for each
+        :class:`Field` *nested* in the `Container` to a ``.csv`` *file*.
+
+        :param str file: name and location of the ``.csv`` *file*.
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword str name: name of the `Container`.
+            Default is the class name of the instance.
+        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for the
+            field *path* and the selected field *attributes*.
+            Defaults to ``('id', *attributes)``.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` lists their referenced :attr:`~Pointer.data` object field
+            attributes as well (chained method call).
+        """
+        with open(file, 'w', newline='') as file_:
+            self.dump_csv(file_, *attributes, **options)
+
+    @nested_option()
+    def dump_csv(self,
+                 fp: TextIO,
+                 *attributes: str,
+                 **options: Any) -> None:
+        """ Writes the field *path* and the selected field *attributes* for each
+        :class:`Field` *nested* in the `Container` in the ``.csv`` file format to
+        the text file object *fp*.
+
+        The rows are written while walking the `Container`, the output is
+        identical to :meth:`write_csv` but no list of the rows is built.
+
+        :param fp: writable text file object opened with ``newline=''``.
+        :param str attributes: selected :class:`Field` attributes.
+            Fallback is the field :attr:`~Field.value`.
+        :keyword str name: name of the `Container`.
+            Default is the class name of the instance.
+        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for the
+            field *path* and the selected field *attributes*.
+            Defaults to ``('id', *attributes)``.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            `Container` lists their referenced :attr:`~Pointer.data` object field
+            attributes as well (chained method call).
+        """
+        fieldnames = self._get_fieldnames(*attributes, **options)
+        writer = csv.DictWriter(fp, fieldnames)
+        writer.writeheader()
+        # Name of the Container
+        name = options.pop('name', self.__class__.__name__)
+
+        if attributes:
+            field_getter = attrgetter(*attributes)
+        else:
+            field_getter = attrgetter('value')
+        for item_path, field in _iter_field_items(self, (), options):
+            field_path = join_field_path(item_path)
+            if field_path.startswith('['):
+                # Sequence
+                field_path = f"{name}{field_path}"
+            else:
+                field_path = f"{name}.{field_path}"
+            if len(attributes) > 1:
+                row = (field_path, *field_getter(field))
+            else:
+                row = (field_path, field_getter(field))
+            writer.writerow(dict(zip(fieldnames, row)))
+
+    def _row_items(self) -> Iterable[Structure | Sequence | Field]:
+        # Sequence: one row per element
+        if is_sequence(self):
+            return self
+        # Pointer to a sequence: one row per element of the data object
+        elif is_pointer(self) and is_sequence(self._data):
+            return self._data
+        # Any other container: one row
+        else:
+            return self,
 
     @nested_option()
-    def write_json(self,
-                   file: str,
+    def to_columns(self,
                    *attributes: str,
-                   **options: Any) -> None:
-        """ Writes the selected field *attributes* for each :class:`Field`
-        *nested* in the `Container` to a ``.json`` *file*.
+                   **options: Any) -> dict[str, list[Any]]:
+        """ Returns a :class:`dict` of ``{'field path': column}`` pairs
+        containing the selected field *attribute* of each :class:`Field`
+        *nested* in the `Container` as a column.
+
+        A :class:`Sequence` or an :class:`Array`, or a :class:`Pointer`
+        referencing one of them, produces one row per element and the
+        *field path* is relative to the element. Any other `Container`
+        produces exactly one row. Missing fields of heterogeneous elements
+        are filled with :data:`None`.
+
+        The columns are built directly from the field values in one
+        traversal of the `Container`.
 
-        :param str file: name and location of the ``.json`` *file*.
         :param str attributes: selected :class:`Field` attributes.
             Fallback is the field :attr:`~Field.value`.
-        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for the
-            field *path* and the selected field *attributes*.
-            Defaults to ``(*attributes)``.
+        :keyword tuple[str, ...] fieldnames: sequence of column name suffixes
+            for the selected field *attributes*, if more than one *attribute*
+            is selected. Defaults to ``(*attributes)``.
         :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
             `Container` lists their referenced :attr:`~Pointer.data` object field
             attributes as well (chained method call).
-        """
-        content = self.to_json(*attributes, **options)
-        with open(file, 'w', newline='') as file_:
-            file_.write(content)
 
-    @staticmethod
-    def _get_fieldnames(*attributes: str,
-                        **options: Any) -> list[str]:
-        # Default dictionary keys
-        keys = ['id']
+        Example:
+
+        >>> class Point(Structure):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.x = Signed(16)
+        ...         self.y = Signed(16)
+        ...         self.flags = Byte()
+        >>> points = Array(Point, 3)
+        >>> points.deserialize(bytes.fromhex('010002000a030004001400'))
+        Index(byte=15, bit=0, address=15, base_address=0, update=False)
+        >>> points.to_columns()
+        {'x': [1, 3, 0], 'y': [2, 4, 0], 'flags': ['0xa', '0x14', '0x0']}
+        >>> points.to_columns('value', 'bit_size', fieldnames=('value', 'size'))
+        {'x.value': [1, 3, 0],
+         'x.size': [16, 16, 16],
+         'y.value': [2, 4, 0],
+         'y.size': [16, 16, 16],
+         'flags.value': ['0xa', '0x14', '0x0'],
+         'flags.size': [8, 8, 8]}
+        >>> points[0].to_columns()
+        {'x': [1], 'y': [2], 'flags': ['0xa']}
+        """
         if attributes:
-            keys.extend(attributes)
+            field_getter = attrgetter(*attributes)
         else:
-            keys.append('value')
-        # Customized dictionary keys
-        return options.get('fieldnames', keys)
+            field_getter = attrgetter('value')
+
+        # Column name suffixes
+        if len(attributes) > 1:
+            fieldnames = options.get('fieldnames', attributes)
+        else:
+            fieldnames = None
+        # Column name of a field without a field path
+        default = attributes[0] if attributes else 'value'
+
+        nested = get_nested(options)
+        columns = dict()
+        rows = 0
+
+        def column(name: str) -> list[Any]:
+            values = columns.get(name)
+            if values is None:
+                values = columns[name] = [None] * rows
+            elif len(values) < rows:
+                values.extend([None] * (rows - len(values)))
+            return values
+
+        for item in self._row_items():
+            # Container or Pointer
+            if is_container(item) or (is_pointer(item) and nested):
+                items = ((join_field_path(item_path), field) for item_path, field
+                         in _iter_field_items(item, (), options))
+            # Field
+            elif is_field(item):
+                items = ((str(), item),)
+            else:
+                raise MemberTypeError(self, item, rows)
+
+            for field_path, field in items:
+                if fieldnames is None:
+                    column(field_path or default).append(field_getter(field))
+                else:
+                    for key, value in zip(fieldnames, field_getter(field)):
+                        if field_path:
+                            key = f"{field_path}.{key}"
+                        column(key).append(value)
+            rows += 1
+
+        for values in columns.values():
+            values.extend([None] * (rows - len(values)))
+        return columns
 
     @nested_option()
-    def to_csv(self,
-               *attributes: str,
-               **options: Any) -> list[dict[str, Any]]:
-        """ Returns a **flatten** list of dictionaries containing the field
-        *path* and the selected field *attributes* for each :class:`Field`
-        *nested* in the `Container`.
+    def to_dataframe(self,
+                     *attributes: str,
+                     **options: Any) -> Any:
+        """ Returns a :class:`pandas.DataFrame` with the selected field
+        *attribute* of each :class:`Field` *nested* in the `Container` as a
+        column, see :meth:`to_columns`.
+
+        .. note:: Requires the optional package ``pandas``.
 
         :param str attributes: selected :class:`Field` attributes.
             Fallback is the field :attr:`~Field.value`.
-        :keyword str name: name of the `Container`.
-            Default is the class name of the instance.
-        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for
-            the field *path* and the selected field *attributes*.
-            Defaults to ``('id', *attributes)``.
+        :keyword tuple[str, ...] fieldnames: sequence of column name suffixes
+            for the selected field *attributes*, if more than one *attribute*
+            is selected. Defaults to ``(*attributes)``.
         :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
             `Container` lists their referenced :attr:`~Pointer.data` object field
             attributes as well (chained method call).
+
+        Example:
+
+        >>> import pytest
+        >>> pandas = pytest.importorskip('pandas')
+        >>> points = Array(lambda: Structure(x=Signed(16), flags=Byte()), 2)
+        >>> points.deserialize(bytes.fromhex('feff0a030014'))
+        Index(byte=6, bit=0, address=6, base_address=0, update=False)
+        >>> frame = points.to_dataframe()
+        >>> frame.columns.tolist()
+        ['x', 'flags']
+        >>> frame.to_dict('list') == points.to_columns()
+        True
+        >>> frame['x'].tolist() == [point.x.value for point in points]
+        True
         """
-        keys = self._get_fieldnames(*attributes, **options)
-        options['chain'] = True
-        return [dict(zip(keys, field)) for field in
-                self.to_list(*attributes, **options)]
+        try:
+            import pandas
+        except ImportError as error:
+            raise ImportError(
+                f"{self.__class__.__name__}.to_dataframe() requires the "
+                f"optional package 'pandas'.") from error
+        return pandas.DataFrame(self.to_columns(*attributes, **options))
 
     @nested_option()
-    def write_csv(self,
-                  file: str,
-                  *attributes: str,
-                  **options: Any) -> None:
-        """ Writes the field *path* and the selected field *attributes* for each
-        :class:`Field` *nested* in the `Container` to a ``.csv`` *file*.
+    def to_arrow(self,
+                 *attributes: str,
+                 **options: Any) -> Any:
+        """ Returns a :class:`pyarrow.Table` with the selected field
+        *attribute* of each :class:`Field` *nested* in the `Container` as a
+        column, see :meth:`to_columns`.
+
+        A column with field values of mixed types, e.g. the member names and
+        unknown values of an :class:`Enum` field, contains the field values
+        as strings.
+
+        .. note:: Requires the optional package ``pyarrow``.
 
-        :param str file: name and location of the ``.csv`` *file*.
         :param str attributes: selected :class:`Field` attributes.
             Fallback is the field :attr:`~Field.value`.
-        :keyword str name: name of the `Container`.
-            Default is the class name of the instance.
-        :keyword tuple[str, ...] fieldnames: sequence of dictionary keys for the
-            field *path* and the selected field *attributes*.
-            Defaults to ``('id', *attributes)``.
+        :keyword tuple[str, ...] fieldnames: sequence of column name suffixes
+            for the selected field *attributes*, if more than one *attribute*
+            is selected. Defaults to ``(*attributes)``.
         :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
             `Container` lists their referenced :attr:`~Pointer.data` object field
             attributes as well (chained method call).
+
+        Example:
+
+        >>> import pytest
+        >>> pyarrow = pytest.importorskip('pyarrow')
+        >>> points = Array(lambda: Structure(x=Signed(16), flags=Byte()), 2)
+        >>> points.deserialize(bytes.fromhex('feff0a030014'))
+        Index(byte=6, bit=0, address=6, base_address=0, update=False)
+        >>> table = points.to_arrow()
+        >>> table.column_names
+        ['x', 'flags']
+        >>> table.to_pydict() == points.to_columns()
+        True
+        >>> table['x'].to_pylist() == [point.x.value for point in points]
+        True
         """
-        with open(file, 'w', newline='') as file_:
-            fieldnames = self._get_fieldnames(*attributes, **options)
-            writer = csv.DictWriter(file_, fieldnames)
-            writer.writeheader()
-            content = self.to_csv(*attributes, **options)
-            for row in content:
-                writer.writerow(row)
+        try:
+            import pyarrow
+        except ImportError as error:
+            raise ImportError(
+                f"{self.__class__.__name__}.to_arrow() requires the "
+                f"optional package 'pyarrow'.") from error
+        columns = dict()
+        for name, values in self.to_columns(*attributes, **options).items():
+            try:
+                columns[name] = pyarrow.array(values)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # Column with values of mixed types
+                columns[name] = pyarrow.array(
+                    [None if value is None else str(value) for value in values])
+        return pyarrow.table(columns)
+
+    @byte_order_option()
+    @nested_option()
+    def serialize_into(self,
+                       buffer: Any,
+                       index: Index = Index(),
+                       **options: Any) -> Index:
+        """ Serializes the `Container` in place to the writable *buffer*
+        starting at the byte offset of the given *index*, without re-sizing
+        the *buffer*.
+
+        The *buffer* can be any object supporting the writable buffer
+        protocol, like a :class:`bytearray`, a writable :class:`memoryview`
+        or a :class:`mmap.mmap`.
+
+        Returns the :class:`Index` of the *buffer* after the last serialized
+        :class:`Field` in the `Container`.
+
+        :param buffer: writable byte buffer to serialize to.
+        :param Index index: current write :class:`Index` within the *buffer*.
+        :keyword byte_order: encoding byte order for the serialization.
+        :type byte_order: Byteorder|Literal['auto', 'big', 'little']
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields of
+            the `Container` serialize their referenced :attr:`~Pointer.data`
+            object to their own :attr:`~Pointer.bytestream` as well.
+        :raises BufferError: if the *buffer* is too small for the `Container`.
+
+        Example:
+
+        >>> buffer = bytearray(b'\\xff' * 6)
+        >>> structure = Structure(a=Decimal(16), b=Decimal(8))
+        >>> structure.a.value, structure.b.value = 0x1234, 0x56
+        >>> structure.serialize_into(buffer, Index(2))
+        Index(byte=5, bit=0, address=3, base_address=0, update=False)
+        >>> buffer.hex()
+        'ffff341256ff'
+        """
+        byte_length, bit_length = self.container_size()
+        return _serialize_into(self, buffer, index,
+                               byte_length + bool(bit_length), options)
+
+    def prefetch(self,
+                 depth: int | None = None,
+                 budget: int | None = None) -> int:
+        """ Reads breadth-first the deferred :attr:`~Pointer.data` objects of
+        the :class:`Pointer` fields in the `Container` and in their read
+        :attr:`~Pointer.data` objects and returns the number of bytes read.
+
+        The reading of the :attr:`~Pointer.data` objects is deferred by reading
+        the `Container` with the *lazy* option.
+
+        :param int|None depth: number of :class:`Pointer` levels to read.
+            Defaults to all levels.
+        :param int|None budget: stops reading after the number of bytes read
+            reaches the *budget*. Defaults to no limit.
+
+        Example:
+
+        >>> class Memory(Provider):
+        ...     def __init__(self, content):
+        ...         self.content = content
+        ...         self.reads = 0
+        ...     def read(self, address=0, count=0):
+        ...         self.reads += 1
+        ...         return self.content[address:address + count]
+        ...     def write(self, buffer=bytes(), address=0, count=0):
+        ...         pass
+        >>> memory = Memory(bytes.fromhex('00000000080000000c000000aa'))
+        >>> leaf = Structure(value=Byte())
+        >>> node = Structure(next=Pointer(Structure(next=Pointer(leaf))))
+        >>> pointer = Pointer(node, address=4)
+        >>> pointer.read_from(memory, lazy=True)
+        >>> memory.reads
+        1
+        >>> pointer.prefetch(depth=1)
+        4
+        >>> memory.reads
+        2
+        >>> pointer.data.next.data.next.data.value.value
+        '0xaa'
+        >>> memory.reads
+        3
+        """
+        size = 0
+        if is_pointer(self):
+            size += self._fetch()
+            queue = [(pointer, 1) for pointer in _pointer_fields(self._data)]
+        else:
+            queue = [(pointer, 1) for pointer in _pointer_fields(self)]
+        for pointer, level in queue:
+            if depth is not None and level > depth:
+                break
+            if budget is not None and size >= budget:
+                break
+            size += pointer._fetch()
+            queue.extend((item, level + 1)
+                         for item in _pointer_fields(pointer._data))
+        return size
+
+    @byte_order_option()
+    def bind(self,
+             buffer: Any,
+             index: Index = Index(),
+             **options: Any) -> Index:
+        """ Binds the fields of the `Container` to the *buffer* starting at the
+        byte offset of the given *index* and returns the :class:`Index` of the
+        *buffer* after the last bound :class:`Field`.
+
+        The :attr:`~Field.value` of a bound :class:`Field` is decoded on
+        access from the *buffer* with the :meth:`~Field.unpack` method of the
+        `Field`, and an assigned :attr:`~Field.value` is encoded straight back
+        into the *buffer* with its :meth:`~Field.pack` method. The *buffer* is
+        the source of truth, nothing is decoded upfront.
+
+        The *buffer* can be any object supporting the buffer protocol, like a
+        :class:`bytearray`, a :class:`memoryview` or a :class:`mmap.mmap`.
+        A read-only *buffer* can not be assigned.
+
+        The referenced :attr:`~Pointer.data` objects of the :class:`Pointer`
+        fields in the `Container` are not bound. Bind the `Container` again
+        after changing its structural layout and :meth:`unbind` it before
+        pickling it.
+
+        :param buffer: byte buffer to bind to.
+        :param Index index: start :class:`Index` within the *buffer*.
+        :keyword byte_order: encoding byte order of the *buffer*.
+        :type byte_order: Byteorder|Literal['auto', 'big', 'little']
+        :raises BufferError: if the *buffer* is too small for the `Container`.
+
+        Example:
+
+        >>> buffer = bytearray.fromhex('00341256')
+        >>> structure = Structure(a=Decimal(16), b=Decimal(8))
+        >>> structure.bind(buffer, Index(1))
+        Index(byte=4, bit=0, address=3, base_address=0, update=False)
+        >>> structure.a.value
+        4660
+        >>> buffer[1:3] = b'\\xcd\\xab'
+        >>> hex(structure.a.value)
+        '0xabcd'
+        >>> structure.b.value = 0x99
+        >>> buffer.hex()
+        '00cdab99'
+        >>> structure.unbind()
+        """
+        view = memoryview(buffer).cast('B')
+        end = self.index_fields(index)
+        size = end.byte + bool(end.bit)
+        if index.byte < 0 or size > len(view):
+            raise BufferError(f"buffer of {len(view)} bytes too small "
+                              f"to bind {size - index.byte} bytes at "
+                              f"offset {index.byte}")
+        binding = _Binding(view, get_byte_order(options))
+        layout, fields = self._layout_plan()
+        if layout is None:
+            fields = [field for item_path, field in self.field_items()]
+        for field in fields:
+            if '_binding' not in field.__dict__:
+                field.__class__ = _bound_class(field.__class__)
+            field._binding = binding
+        return end
+
+    def unbind(self) -> None:
+        """ Unbinds the fields of the `Container` from their backing buffer.
+
+        Each unbound :class:`Field` keeps the :attr:`~Field.value` decoded
+        last from the backing buffer.
+        """
+        for item_path, field in self.field_items():
+            if '_binding' in field.__dict__:
+                field._value = field._load()
+                field.__class__ = field.__class__.__base__
+                del field._binding
+
+    def layout_fingerprint(self) -> str:
+        """ Returns the fingerprint of the structural layout of the `Container`
+        as a hexadecimal string.
+
+        The fingerprint covers the field path, the field class, the bit size,
+        the alignment, the byte order and the decoding attributes like the
+        signedness, the scaling, the fraction format and the enumeration of
+        each :class:`Field` *nested* in the `Container` including the fields
+        of the :attr:`~Pointer.data` objects of all :class:`Pointer` fields
+        (nested) and the data object byte order of the `Pointer` fields.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for item_path, field in self.iter_field_items(nested=True):
+            digest.update(self._field_layout(item_path, field))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _field_layout(path: tuple[str | int, ...],
+                      field: Field) -> bytes:
+        """ Returns the layout of the *field* with the field *path* for the
+        :meth:`layout_fingerprint`.
+        """
+        key = (field.__class__,
+               field._bit_size,
+               field._align_to_byte_size,
+               field._align_to_bit_offset,
+               field._byte_order,
+               *(getattr(field, name, None) for name in _DECODING_ATTRIBUTES))
+        layout = _FIELD_LAYOUTS.get(key)
+        if layout is None:
+            layout = _FIELD_LAYOUTS[key] = repr(key).encode('utf-8')
+        return repr(path).encode('utf-8') + layout
+
+    @byte_order_option()
+    def to_snapshot(self,
+                    codec: Literal['none', 'zlib', 'lzma', 'bz2'] = 'none',
+                    **options: Any) -> bytes:
+        """ Returns a compact binary snapshot of the `Container`.
+
+        The snapshot contains the serialized image of the `Container`, the
+        :attr:`~Pointer.address` and the :attr:`~Pointer.bytestream` of each
+        :class:`Pointer` field *nested* in the `Container`, and the
+        :meth:`layout_fingerprint` of the `Container`.
+
+        :param str codec: compression codec of the snapshot content.
+            Defaults to ``'none'``.
+        :keyword byte_order: encoding byte order for the serialized image.
+        :type byte_order: Byteorder|Literal['auto', 'big', 'little']
+
+        Example:
+
+        >>> class Foo(Structure):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.decimal = Decimal(8)
+        ...         self.pointer = Pointer(Structure(x=Decimal(16)))
+        >>> foo = Foo()
+        >>> foo.initialize_fields({'decimal': 1,
+        ...                        'pointer': {'value': 16, 'data': {'x': 2}}})
+        >>> foo.pointer.bytestream = '0200'
+        >>> snapshot = foo.to_snapshot(codec='zlib')
+        >>> bar = Foo()
+        >>> bar.from_snapshot(snapshot)
+        >>> bar.to_list(nested=True)
+        [('Foo.decimal', 1),
+         ('Foo.pointer', '0x10'),
+         ('Foo.pointer.data.x', 2)]
+        >>> bar.pointer.bytestream
+        '0200'
+
+        A snapshot restores only a `Container` with the same layout:
+
+        >>> baz = Foo()
+        >>> baz.decimal.signed = True
+        >>> try:
+        ...     baz.from_snapshot(snapshot)
+        ... except ContainerSnapshotError as error:
+        ...     print(error.__class__.__name__)
+        ContainerLayoutError
+        >>> baz.to_list(nested=True)
+        [('Foo.decimal', 0),
+         ('Foo.pointer', '0x0'),
+         ('Foo.pointer.data.x', 0)]
+        """
+        if codec not in _SNAPSHOT_CODECS:
+            raise ContainerSnapshotError(self, f"unknown codec '{codec}'")
+        byte_order = get_byte_order(options)
+
+        image = bytearray()
+        self.serialize(image, byte_order=byte_order, nested=False)
+        content = bytearray(_SNAPSHOT_IMAGE.pack(len(image)))
+        content += image
+        digest = hashlib.blake2b(digest_size=16)
+        for item_path, field in self.iter_field_items(nested=True):
+            digest.update(self._field_layout(item_path, field))
+            if is_pointer(field):
+                stream = field._stream()
+                content += _SNAPSHOT_RECORD.pack(field.address, len(stream))
+                content += stream
+        if codec != 'none':
+            content = importlib.import_module(codec).compress(content)
+
+        header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC,
+                                       _SNAPSHOT_VERSION,
+                                       _SNAPSHOT_CODECS.index(codec),
+                                       tuple(Byteorder).index(byte_order),
+                                       digest.digest())
+        return header + content
+
+    def from_snapshot(self, snapshot: bytes) -> None:
+        """ Restores the `Container` from a binary *snapshot* created by
+        :meth:`to_snapshot`.
+
+        The serialized image is de-serialized into the `Container` and the
+        :attr:`~Pointer.data` object of each :class:`Pointer` field *nested*
+        in the `Container` is de-serialized from its restored
+        :attr:`~Pointer.bytestream`.
+
+        The `Container` is left unchanged if the *snapshot* can not be
+        restored. A `Container` whose layout depends on the restored data is
+        first restored as a copy.
+
+        :param bytes snapshot: binary snapshot of a `Container`.
+        :raises ContainerSnapshotError: if the *snapshot* format is invalid.
+        :raises ContainerLayoutError: if the layout of the restored `Container`
+            does not match the layout of the *snapshot*.
+        """
+        view = memoryview(snapshot)
+        if len(view) < _SNAPSHOT_HEADER.size:
+            raise ContainerSnapshotError(self, "truncated header")
+        magic, version, codec, byte_order, fingerprint = \
+            _SNAPSHOT_HEADER.unpack_from(view)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ContainerSnapshotError(self, "invalid signature")
+        if version != _SNAPSHOT_VERSION:
+            raise ContainerSnapshotError(self, f"unsupported version {version}")
+        if codec >= len(_SNAPSHOT_CODECS):
+            raise ContainerSnapshotError(self, f"unknown codec {codec}")
+        if byte_order >= len(Byteorder):
+            raise ContainerSnapshotError(self, f"unknown byte order {byte_order}")
+        byte_order = tuple(Byteorder)[byte_order]
+        content = view[_SNAPSHOT_HEADER.size:]
+        if _SNAPSHOT_CODECS[codec] != 'none':
+            content = memoryview(importlib.import_module(
+                _SNAPSHOT_CODECS[codec]).decompress(content))
+
+        if len(content) < _SNAPSHOT_IMAGE.size:
+            raise ContainerSnapshotError(self, "truncated image")
+        size, = _SNAPSHOT_IMAGE.unpack_from(content)
+        offset = _SNAPSHOT_IMAGE.size + size
+        if len(content) < offset:
+            raise ContainerSnapshotError(self, "truncated image")
+        image = bytes(content[_SNAPSHOT_IMAGE.size:offset])
+        records = list()
+        while offset < len(content):
+            if len(content) < offset + _SNAPSHOT_RECORD.size:
+                raise ContainerSnapshotError(self, "truncated pointer record")
+            address, size = _SNAPSHOT_RECORD.unpack_from(content, offset)
+            offset += _SNAPSHOT_RECORD.size
+            if len(content) < offset + size:
+                raise ContainerSnapshotError(self, "truncated pointer record")
+            records.append((address, bytes(content[offset:offset + size])))
+            offset += size
+
+        # The layout is checked before the container is changed, a layout
+        # which depends on the restored data is checked with a restored copy.
+        digest = hashlib.blake2b(digest_size=16)
+        pointers = 0
+        for item_path, field in self.iter_field_items(nested=True):
+            digest.update(self._field_layout(item_path, field))
+            pointers += is_pointer(field)
+        if digest.digest() != fingerprint or pointers != len(records):
+            copy.deepcopy(self)._restore_snapshot(image, records,
+                                                  byte_order, fingerprint)
+        self._restore_snapshot(image, records, byte_order, fingerprint)
+
+    def _restore_snapshot(self,
+                          image: bytes,
+                          records: list[tuple[int, bytes]],
+                          byte_order: Byteorder,
+                          fingerprint: bytes) -> None:
+        """ Restores the `Container` from the serialized *image* and the
+        ``(address, bytestream)`` *records* of the :class:`Pointer` fields of
+        a snapshot with the layout *fingerprint*.
+        """
+        self.deserialize(image, byte_order=byte_order, nested=False)
+
+        # Data objects are restored in the order of the pointers, the fields
+        # of a data object are walked after its pointer restored the data.
+        records = iter(records)
+        digest = hashlib.blake2b(digest_size=16)
+        for item_path, field in self.iter_field_items(nested=True):
+            digest.update(self._field_layout(item_path, field))
+            if not is_pointer(field):
+                continue
+            address, stream = next(records, (None, None))
+            if address != field.address:
+                break
+            field.bytestream = stream
+            while True:
+                index = field.deserialize_data()
+                if not index.update:
+                    break
+        else:
+            if next(records, None) is None and digest.digest() == fingerprint:
+                return
+        layout = self.layout_fingerprint()
+        raise ContainerLayoutError(self, layout, fingerprint.hex())
+
+    @byte_order_option()
+    def save_snapshot(self,
+                      file: str,
+                      codec: Literal['none', 'zlib', 'lzma', 'bz2'] = 'none',
+                      **options: Any) -> None:
+        """ Writes a compact binary snapshot of the `Container` created by
+        :meth:`to_snapshot` to a *file*.
+
+        :param str file: name and location of the snapshot *file*.
+        :param str codec: compression codec of the snapshot content.
+            Defaults to ``'none'``.
+        :keyword byte_order: encoding byte order for the serialized image.
+        :type byte_order: Byteorder|Literal['auto', 'big', 'little']
+        """
+        snapshot = self.to_snapshot(codec, **options)
+        with open(file, 'wb') as file_:
+            file_.write(snapshot)
+
+    def load_snapshot(self, file: str) -> None:
+        """ Restores the `Container` from a binary snapshot *file* written by
+        :meth:`save_snapshot`, see :meth:`from_snapshot`.
+
+        :param str file: name and location of the snapshot *file*.
+        """
+        with open(file, 'rb') as file_:
+            self.from_snapshot(file_.read())
 
 
 class Structure(dict, Container):
@@ -631,6 +2716,31 @@ class Structure(dict, Container):
     - List the **path** to the field and the field **item** itself for each
       :class:`Field` in the `Structure` as a flatted list via :meth:`field_items()`.
     - Get the **metadata** of the `Structure` via :meth:`describe()`.
+
+    A `Structure` is pickled and deep copied with its fields:
+
+    >>> import pickle
+    >>> structure = Structure(signed=Decimal(8, signed=True),
+    ...                       scaled=Scaled(100, 16),
+    ...                       pointer=Pointer(Structure(x=Byte())))
+    >>> structure.signed.value = -5
+    >>> structure.scaled.value = 50.0
+    >>> structure.index_fields(Index(byte=4, address=4096))
+    Index(byte=11, bit=0, address=4103, base_address=0, update=False)
+    >>> list(structure.path_index())
+    ['signed', 'scaled', 'pointer', 'pointer.data.x']
+    >>> clone = pickle.loads(pickle.dumps(structure))
+    >>> clone.to_list('value', 'index', nested=True)
+    [('Structure.signed', (-5, Index(byte=4, bit=0, address=4096,
+                                     base_address=0, update=False))),
+     ('Structure.scaled', (50.0, Index(byte=5, bit=0, address=4097,
+                                       base_address=0, update=False))),
+     ('Structure.pointer', ('0x0', Index(byte=7, bit=0, address=4099,
+                                         base_address=0, update=False))),
+     ('Structure.pointer.data.x', ('0x0', Index(byte=0, bit=0, address=0,
+                                                base_address=0, update=False)))]
+    >>> copy.deepcopy(structure).to_list() == structure.to_list()
+    True
     """
     # Item type.
     item_type: ItemClass = ItemClass.Structure
@@ -656,7 +2766,8 @@ class Structure(dict, Container):
             super().__setitem__(name, item)
         # Dictionaries
         elif is_mapping(item):
-            super().__setitem__(name, Structure(item))
+            item = Structure(item)
+            super().__setitem__(name, item)
         # Sequence
         elif is_sequence(item):
             super().__setitem__(name, item)
@@ -665,6 +2776,39 @@ class Structure(dict, Container):
             super().__setitem__(name, item)
         else:
             raise MemberTypeError(self, item, name)
+        _layout_changed(self)
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        _layout_changed(self)
+
+    def clear(self) -> None:
+        super().clear()
+        _layout_changed(self)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        item = super().pop(name, *default)
+        _layout_changed(self)
+        return item
+
+    def popitem(self) -> tuple[str, Structure | Sequence | Field]:
+        item = super().popitem()
+        _layout_changed(self)
+        return item
+
+    def setdefault(self,
+                   name: str,
+                   default: Structure | Sequence | Field | None = None) -> Any:
+        item = super().setdefault(name, default)
+        _layout_changed(self)
+        return item
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        _layout_changed(self)
+
+    def _members(self) -> Iterable[Structure | Sequence | Field]:
+        return self.values()
 
     def __getattr__(self, name: str) -> Any:
         """ Returns the :class:`Field` of the `Structure` member whose
@@ -704,6 +2848,7 @@ class Structure(dict, Container):
             setitem = item()
             if is_any(setitem):
                 super().__setitem__(name, setitem)
+                _layout_changed(self)
             else:
                 raise FactoryTypeError(self, item, setitem, name)
         else:
@@ -724,11 +2869,14 @@ class Structure(dict, Container):
             well (chained method call).
             Each :class:`Pointer` field stores the bytes for its referenced
             :attr:`~Pointer.data` object in its :attr:`~Pointer.bytestream`.
+        :keyword bool lazy: if :data:`True` all :class:`Pointer` fields in the
+            `Structure` defer reading their referenced :attr:`~Pointer.data`
+            object until its first access, see :meth:`~Container.prefetch`.
         """
         for item in self.values():
             # Container or Pointer
             if is_mixin(item):
-                item.read_from(provider, **options)
+                _read_item(item, provider, options)
 
     @byte_order_option()
     @nested_option()
@@ -765,8 +2913,26 @@ class Structure(dict, Container):
             referenced  :attr:`~Pointer.data` object its own
             :attr:`~Pointer.bytestream`.
         """
+        return self._deserialize(buffer, index,
+                                 TraversalContext.from_options(options))
+
+    def _deserialize(self,
+                     buffer: bytes,
+                     index: Index,
+                     context: TraversalContext) -> Index:
+        """ De-serializes the `Structure` from the byte *buffer* starting with
+        the given *index* with the resolved traversal *context*.
+        """
+        layout, fields = self._layout_plan()
+        if layout is not None:
+            end = layout.deserialize(fields, buffer, index, context)
+            if end is not None:
+                return end
+        start, version = index, self._version
         for item in self.values():
-            index = item.deserialize(buffer, index, **options)
+            index = _deserialize_item(item, buffer, index, context)
+        if version == self._version:
+            self._compile_layout(start, index)
         return index
 
     @byte_order_option()
@@ -803,8 +2969,26 @@ class Structure(dict, Container):
             referenced :attr:`~Pointer.data` object its own
             :attr:`~Pointer.bytestream`.
         """
+        return self._serialize(buffer, index,
+                               TraversalContext.from_options(options))
+
+    def _serialize(self,
+                   buffer: bytearray,
+                   index: Index,
+                   context: TraversalContext) -> Index:
+        """ Serializes the `Structure` to the byte *buffer* starting with the
+        given *index* with the resolved traversal *context*.
+        """
+        layout, fields = self._layout_plan()
+        if layout is not None:
+            end = layout.serialize(fields, buffer, index, context)
+            if end is not None:
+                return end
+        start, version = index, self._version
         for item in self.values():
-            index = item.serialize(buffer, index, **options)
+            index = _serialize_item(item, buffer, index, context)
+        if version == self._version:
+            self._compile_layout(start, index)
         return index
 
     @nested_option()
@@ -821,12 +3005,27 @@ class Structure(dict, Container):
             `Structure` indexes their referenced :attr:`~Pointer.data` object
             fields as well (chained method call).
         """
+        return self._index_fields(index,
+                                  TraversalContext.from_options(options))
+
+    def _index_fields(self,
+                      index: Index,
+                      context: TraversalContext) -> Index:
+        """ Indexes all fields in the `Structure` starting with the given *index*
+        with the resolved traversal *context*.
+        """
+        layout, fields = self._layout_plan()
+        if layout is not None:
+            end = layout.index_fields(fields, index, context)
+            if end is not None:
+                return end
+        start, version = index, self._version
         for name, item in self.items():
             # Container
             if is_container(item):
-                index = item.index_fields(index, **options)
+                index = _index_item(item, index, context)
             # Pointer
-            elif is_pointer(item) and get_nested(options):
+            elif is_pointer(item) and context.nested:
                 index = item.index_field(index)
                 item.index_data()
             # Field
@@ -834,12 +3033,17 @@ class Structure(dict, Container):
                 index = item.index_field(index)
             else:
                 raise MemberTypeError(self, item, name, index)
+        if version == self._version:
+            self._compile_layout(start, index)
         return index
 
     def container_size(self) -> tuple[int, int]:
         """ Returns the accumulated bit size of all fields in the `Structure` as
         a tuple in the form of ``(number of bytes, remaining number of bits)``.
         """
+        size = self._compiled_size()
+        if size is not None:
+            return size
         length = 0
         for name, item in self.items():
             # Container
@@ -853,6 +3057,34 @@ class Structure(dict, Container):
                 raise MemberTypeError(self, item, name)
         return divmod(length, 8)
 
+    def _layout_key(self, fields: list[Field]) -> tuple[Any, ...] | None:
+        """ Returns the layout key of the `Structure` and collects its fields
+        and the fields of its nested containers in the list of *fields*, or
+        returns :data:`None` if the layout of the `Structure` can not be
+        compiled.
+        """
+        cls = self.__class__
+        if (_is_hooked(cls, 'deserialize') or
+                _is_hooked(cls, 'serialize') or
+                _is_hooked(cls, 'index_fields')):
+            return None
+        members = list()
+        for name, item in self.items():
+            _adopt(self, item)
+            # Container
+            if is_container(item):
+                key = item._layout_key(fields)
+            # Field
+            elif is_field(item):
+                key = item._layout_key()
+                fields.append(item)
+            else:
+                return None
+            if key is None:
+                return None
+            members.append((name, key))
+        return self.__class__, tuple(members)
+
     def first_field(self) -> Field | None:
         """ Returns the first :class:`Field` in the `Structure`, or :data:`None`
         for an empty `Structure`.
@@ -944,25 +3176,34 @@ class Structure(dict, Container):
             `Structure` list their referenced :attr:`~Pointer.data` object field
             items as well (chained method call).
         """
-        parent = path if path else str()
+        return [(join_field_path(item_path), item) for item_path, item in
+                self.iter_field_items((path,) if path else (), **options)]
 
-        items = list()
+    @nested_option()
+    def iter_field_items(self,
+                         path: tuple[str | int, ...] = (),
+                         **options: Any) -> Iterator[tuple[tuple[str | int, ...],
+                                                           Field]]:
+        """ Yields a **flatten** sequence of ``(field path, field item)``
+        tuples for each :class:`Field` *nested* in the `Structure`.
+
+        :param tuple path: field path of the `Structure`.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            :attr:`~Pointer.data` objects of all :class:`Pointer` fields in the
+            `Structure` yield their referenced :attr:`~Pointer.data` object
+            field items as well (chained method call).
+        """
+        nested = get_nested(options)
         for name, item in self.items():
-            item_path = f"{parent}.{name}" if parent else name
-            # Container
-            if is_container(item):
-                for field in item.field_items(item_path, **options):
-                    items.append(field)
-            # Pointer
-            elif is_pointer(item) and get_nested(options):
-                for field in item.field_items(item_path, **options):
-                    items.append(field)
+            item_path = (*path, name)
+            # Container or Pointer
+            if is_container(item) or (is_pointer(item) and nested):
+                yield from _iter_field_items(item, item_path, options)
             # Field
             elif is_field(item):
-                items.append((item_path, item))
+                yield item_path, item
             else:
-                raise MemberTypeError(self, item, item_path)
-        return items
+                raise MemberTypeError(self, item, join_field_path(item_path))
 
     @nested_option(True)
     def describe(self,
@@ -1113,9 +3354,11 @@ class Sequence(MutableSequence, Container):
         if not is_any(item):
             raise MemberTypeError(self, item, member=index)
         self._data[index] = item
+        _layout_changed(self)
 
     def __delitem__(self, index: int) -> None:
         del self._data[index]
+        _layout_changed(self)
 
     def __iter__(self) -> Iterator[Structure | Sequence | Field]:
         return iter(self._data)
@@ -1131,6 +3374,7 @@ class Sequence(MutableSequence, Container):
         if not is_any(item):
             raise MemberTypeError(self, item, member=len(self))
         self._data.append(item)
+        _layout_changed(self)
 
     def insert(self,
                index: int,
@@ -1145,17 +3389,21 @@ class Sequence(MutableSequence, Container):
         if not is_any(item):
             raise MemberTypeError(self, item, member=len(self))
         self._data.insert(index, item)
+        _layout_changed(self)
 
     def pop(self, index: int = -1) -> Structure | Sequence | Field:
         """ Removes and returns the item at the *index* from the `Sequence`.
 
         :param int index: `Sequence` index.
         """
-        return self._data.pop(index)
+        item = self._data.pop(index)
+        _layout_changed(self)
+        return item
 
     def clear(self) -> None:
         """ Remove all items from the `Sequence`."""
         self._data.clear()
+        _layout_changed(self)
 
     def remove(self, item: Structure | Sequence | Field) -> None:
         """ Removes the first occurrence of an *item* from the `Sequence`.
@@ -1165,10 +3413,12 @@ class Sequence(MutableSequence, Container):
         :type item: Structure|Sequence|Field
         """
         self._data.remove(item)
+        _layout_changed(self)
 
     def reverse(self) -> None:
         """ In place reversing of the `Sequence` items."""
         self._data.reverse()
+        _layout_changed(self)
 
     def extend(self,
                iterable: (Iterable[Structure | Sequence | Field] |
@@ -1196,6 +3446,10 @@ class Sequence(MutableSequence, Container):
             self._data.extend(Sequence(iterable))
         else:
             raise MemberTypeError(self, iterable, member=len(self))
+        _layout_changed(self)
+
+    def _members(self) -> Iterable[Structure | Sequence | Field]:
+        return self._data
 
     @nested_option()
     def read_from(self,
@@ -1212,11 +3466,14 @@ class Sequence(MutableSequence, Container):
             well (chained method call).
             Each :class:`Pointer` field stores the bytes for its referenced
             :attr:`~Pointer.data` object in its :attr:`~Pointer.bytestream`.
+        :keyword bool lazy: if :data:`True` all :class:`Pointer` fields in the
+            `Sequence` defer reading their referenced :attr:`~Pointer.data`
+            object until its first access, see :meth:`~Container.prefetch`.
         """
         for item in iter(self):
             # Container or Pointer
             if is_mixin(item):
-                item.read_from(provider, **options)
+                _read_item(item, provider, options)
 
     @byte_order_option()
     @nested_option()
@@ -1253,8 +3510,26 @@ class Sequence(MutableSequence, Container):
             referenced :attr:`~Pointer.data` object its own
             :attr:`~Pointer.bytestream`.
         """
+        return self._deserialize(buffer, index,
+                                 TraversalContext.from_options(options))
+
+    def _deserialize(self,
+                     buffer: bytes,
+                     index: Index,
+                     context: TraversalContext) -> Index:
+        """ De-serializes the `Sequence` from the byte *buffer* starting with
+        the given *index* with the resolved traversal *context*.
+        """
+        layout, fields = self._layout_plan()
+        if layout is not None:
+            end = layout.deserialize(fields, buffer, index, context)
+            if end is not None:
+                return end
+        start, version = index, self._version
         for item in iter(self):
-            index = item.deserialize(buffer, index, **options)
+            index = _deserialize_item(item, buffer, index, context)
+        if version == self._version:
+            self._compile_layout(start, index)
         return index
 
     @byte_order_option()
@@ -1291,8 +3566,26 @@ class Sequence(MutableSequence, Container):
             referenced :attr:`~Pointer.data` object its own
             :attr:`~Pointer.bytestream`.
         """
+        return self._serialize(buffer, index,
+                               TraversalContext.from_options(options))
+
+    def _serialize(self,
+                   buffer: bytearray,
+                   index: Index,
+                   context: TraversalContext) -> Index:
+        """ Serializes the `Sequence` to the byte *buffer* starting with the
+        given *index* with the resolved traversal *context*.
+        """
+        layout, fields = self._layout_plan()
+        if layout is not None:
+            end = layout.serialize(fields, buffer, index, context)
+            if end is not None:
+                return end
+        start, version = index, self._version
         for item in iter(self):
-            index = item.serialize(buffer, index, **options)
+            index = _serialize_item(item, buffer, index, context)
+        if version == self._version:
+            self._compile_layout(start, index)
         return index
 
     @nested_option()
@@ -1309,12 +3602,27 @@ class Sequence(MutableSequence, Container):
             `Sequence` indexes their referenced :attr:`~Pointer.data` object
             fields as well (chained method call).
         """
+        return self._index_fields(index,
+                                  TraversalContext.from_options(options))
+
+    def _index_fields(self,
+                      index: Index,
+                      context: TraversalContext) -> Index:
+        """ Indexes all fields in the `Sequence` starting with the given *index*
+        with the resolved traversal *context*.
+        """
+        layout, fields = self._layout_plan()
+        if layout is not None:
+            end = layout.index_fields(fields, index, context)
+            if end is not None:
+                return end
+        start, version = index, self._version
         for name, item in enumerate(self):
             # Container
             if is_container(item):
-                index = item.index_fields(index, **options)
+                index = _index_item(item, index, context)
             # Pointer
-            elif is_pointer(item) and get_nested(options):
+            elif is_pointer(item) and context.nested:
                 index = item.index_field(index)
                 item.index_data()
             # Field
@@ -1322,12 +3630,17 @@ class Sequence(MutableSequence, Container):
                 index = item.index_field(index)
             else:
                 raise MemberTypeError(self, item, name, index)
+        if version == self._version:
+            self._compile_layout(start, index)
         return index
 
     def container_size(self) -> tuple[int, int]:
         """ Returns the accumulated bit size of all fields in the `Sequence` as
         a tuple in the form of ``(number of bytes, remaining number of bits)``.
         """
+        size = self._compiled_size()
+        if size is not None:
+            return size
         length = 0
         for name, item in enumerate(self):
             # Container
@@ -1341,6 +3654,34 @@ class Sequence(MutableSequence, Container):
                 raise MemberTypeError(self, item, name)
         return divmod(length, 8)
 
+    def _layout_key(self, fields: list[Field]) -> tuple[Any, ...] | None:
+        """ Returns the layout key of the `Sequence` and collects its fields
+        and the fields of its nested containers in the list of *fields*, or
+        returns :data:`None` if the layout of the `Sequence` can not be
+        compiled.
+        """
+        cls = self.__class__
+        if (_is_hooked(cls, 'deserialize') or
+                _is_hooked(cls, 'serialize') or
+                _is_hooked(cls, 'index_fields')):
+            return None
+        members = list()
+        for item in iter(self):
+            _adopt(self, item)
+            # Container
+            if is_container(item):
+                key = item._layout_key(fields)
+            # Field
+            elif is_field(item):
+                key = item._layout_key()
+                fields.append(item)
+            else:
+                return None
+            if key is None:
+                return None
+            members.append(key)
+        return self.__class__, tuple(members)
+
     def first_field(self) -> Field | None:
         """ Returns the first :class:`Field` in the `Sequence`, or :data:`None`
         for an empty `Sequence`.
@@ -1434,26 +3775,34 @@ class Sequence(MutableSequence, Container):
             the `Sequence` list their referenced :attr:`~Pointer.data` object
             field items as well (chained method call).
         """
-        items = list()
+        return [(join_field_path(item_path), item) for item_path, item in
+                self.iter_field_items((path,) if path else (), **options)]
+
+    @nested_option()
+    def iter_field_items(self,
+                         path: tuple[str | int, ...] = (),
+                         **options: Any) -> Iterator[tuple[tuple[str | int, ...],
+                                                           Field]]:
+        """ Yields a **flatten** sequence of ``(field path, field item)``
+        tuples for each :class:`Field` *nested* in the `Sequence`.
+
+        :param tuple path: field path of the `Sequence`.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            :attr:`~Pointer.data` objects of all :class:`Pointer` fields in
+            the `Sequence` yield their referenced :attr:`~Pointer.data` object
+            field items as well (chained method call).
+        """
+        nested = get_nested(options)
         for index, item in enumerate(self):
-            if path:
-                item_path = f"{path}[{str(index)}]"
-            else:
-                item_path = f"[{str(index)}]"
-            # Container
-            if is_container(item):
-                for field_item in item.field_items(item_path, **options):
-                    items.append(field_item)
-            # Pointer
-            elif is_pointer(item) and get_nested(options):
-                for field_item in item.field_items(item_path, **options):
-                    items.append(field_item)
+            item_path = (*path, index)
+            # Container or Pointer
+            if is_container(item) or (is_pointer(item) and nested):
+                yield from _iter_field_items(item, item_path, options)
             # Field
             elif is_field(item):
-                items.append((item_path, item))
+                yield item_path, item
             else:
-                raise MemberTypeError(self, item, item_path)
-        return items
+                raise MemberTypeError(self, item, join_field_path(item_path))
 
     @nested_option(True)
     def describe(self,
@@ -1601,6 +3950,277 @@ class Array(Sequence):
             for i in range(abs(count)):
                 self.pop()
 
+    def _field_elements(self) -> list[Field]:
+        """ Returns the :class:`Field` elements of the `Array`."""
+        fields = list(self._data)
+        for cls in set(map(type, fields)):
+            if not issubclass(cls, Field):
+                index = list(map(type, fields)).index(cls)
+                raise MemberTypeError(self, fields[index], index)
+        return fields
+
+    @staticmethod
+    def _uniform(fields: list[Field]) -> bool:
+        """ Returns :data:`True` if all *fields* share the field class, the
+        bit size and the decoding attributes of the first field.
+        """
+        def parameters(field: Field) -> tuple[Any, ...]:
+            return (field.__class__, field._bit_size,
+                    *(getattr(field, name, None)
+                      for name in _DECODING_ATTRIBUTES))
+
+        first = parameters(fields[0])
+        return all(parameters(field) == first for field in fields)
+
+    @staticmethod
+    def _raw_values(numpy: Any, fields: list[Field]) -> Any:
+        """ Returns the internal values of the *fields* as a
+        :class:`numpy.ndarray`, integers for :class:`Decimal` fields.
+        """
+        field = fields[0]
+        if isinstance(field, Decimal):
+            if field.bit_size < 64 or field.min() < 0:
+                dtype = numpy.int64
+            else:
+                dtype = numpy.uint64
+            return numpy.fromiter(map(attrgetter('_value'), fields),
+                                  dtype, len(fields))
+        elif isinstance(field, Stream) and len(field):
+            # Byte strings of the same size
+            return numpy.frombuffer(
+                bytearray().join(map(attrgetter('_value'), fields)),
+                f'S{len(field)}')
+        return numpy.array(list(map(attrgetter('_value'), fields)))
+
+    def to_numpy(self, raw: bool = False) -> Any:
+        """ Returns the field values of the :class:`Field` elements in the
+        `Array` as a one-dimensional :class:`numpy.ndarray`.
+
+        The values are converted in bulk from the raw values of the elements
+        with the conversion parameters of the elements, elements with
+        differing field classes, bit sizes or decoding attributes are
+        converted one by one:
+
+        - :class:`Scaled` and :class:`Fraction` elements to floating-point
+          numbers, see :meth:`Scaled.as_float_array` and
+          :meth:`Fraction.as_float_array`.
+        - :class:`Datetime` elements to a ``datetime64[s]`` array.
+        - :class:`IPv4Address` elements to an ``uint32`` array with the
+          packed addresses.
+        - :class:`String` elements to a ``'U'`` array with the strings
+          truncated at their first zero byte, same as :attr:`String.value`.
+        - Other :class:`Decimal` elements to an ``object`` array with the
+          field value of each distinct raw value, see :meth:`to_categorical`.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param bool raw: if :data:`True` the raw values of the elements are
+            returned, the integer values of :class:`Decimal` elements.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> array = Array(Scaled(100, 16), 3)
+        >>> array.deserialize(bytes.fromhex('002000f00008'))
+        Index(byte=6, bit=0, address=6, base_address=0, update=False)
+        >>> array.to_numpy().tolist()
+        [50.0, -25.0, 12.5]
+        >>> array.to_numpy(raw=True).tolist()
+        [8192, -4096, 2048]
+        >>> array[2].scale = 200
+        >>> array.to_numpy().tolist() == [item.value for item in array]
+        True
+
+        The bulk views of :class:`Datetime`, :class:`IPv4Address` and
+        :class:`String` elements match their field values:
+
+        >>> times = Array(Datetime, 2)
+        >>> times.deserialize(bytes.fromhex('0000000080a9e65e'))
+        Index(byte=8, bit=0, address=8, base_address=0, update=False)
+        >>> [str(time) for time in times.to_numpy().tolist()]
+        ['1970-01-01 00:00:00', '2020-06-14 22:49:36']
+        >>> [str(time) for time in times.to_numpy().tolist()] == [
+        ...     item.value for item in times]
+        True
+        >>> addresses = Array(IPv4Address, 2)
+        >>> addresses.deserialize(bytes.fromhex('0100007f0101a8c0'))
+        Index(byte=8, bit=0, address=8, base_address=0, update=False)
+        >>> [str(ipaddress.IPv4Address(address))
+        ...  for address in addresses.to_numpy().tolist()]
+        ['127.0.0.1', '192.168.1.1']
+        >>> strings = Array(String(4), 2)
+        >>> strings.deserialize(b'ab\\x00cwxyz')
+        Index(byte=8, bit=0, address=8, base_address=0, update=False)
+        >>> strings.to_numpy().tolist()
+        ['ab', 'wxyz']
+        >>> strings.to_numpy().tolist() == [item.value for item in strings]
+        True
+        """
+        numpy = _import_numpy(self, 'to_numpy')
+        fields = self._field_elements()
+        if not fields:
+            return numpy.array([])
+        field = fields[0]
+        if not self._uniform(fields):
+            # Mixed elements
+            if raw:
+                return numpy.array([item._value for item in fields])
+            return numpy.array([item.value for item in fields])
+        if not (raw or isinstance(field, (Decimal, String))):
+            return numpy.array([item.value for item in fields])
+        values = self._raw_values(numpy, fields)
+        if raw:
+            return values
+        elif isinstance(field, (Scaled, Fraction)):
+            return field.as_float_array(values)
+        elif isinstance(field, Datetime):
+            return values.astype('datetime64[s]')
+        elif isinstance(field, IPv4Address):
+            return values.astype(numpy.uint32)
+        elif isinstance(field, String):
+            # Strings end at their first zero byte
+            characters = values.view(numpy.uint8).reshape(len(values), -1)
+            characters = characters * numpy.logical_and.accumulate(
+                characters != 0, axis=1)
+            strings = characters.view(values.dtype).reshape(-1)
+            if (characters > 0x7f).any():
+                # Raises the decoding error of String.value
+                return numpy.char.decode(strings, 'ascii')
+            return strings.astype(str)
+        codes, categories = self._categorize(numpy, fields, values)
+        table = numpy.empty(len(categories), dtype=object)
+        table[:] = categories
+        return table[codes]
+
+    def to_categorical(self) -> tuple[Any, list[Any]]:
+        """ Returns the field values of the :class:`Field` elements in the
+        `Array` as categorical codes and categories.
+
+        The categories are the field values of the distinct raw values of the
+        elements in the order of the raw values, the codes are the positions
+        of the categories of the elements in a :class:`numpy.ndarray`. The
+        field value of each distinct raw value is only converted once, e.g.
+        the enumeration member name of an :class:`Enum` element. The
+        categories of mixed elements are their distinct field values in the
+        order of their first occurrence.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> class Color(Enumeration):
+        ...     red = 1
+        ...     green = 2
+        >>> colors = Array(Enum(8, enumeration=Color), 4)
+        >>> colors.deserialize(bytes([2, 1, 2, 7]))
+        Index(byte=4, bit=0, address=4, base_address=0, update=False)
+        >>> codes, categories = colors.to_categorical()
+        >>> codes.tolist(), categories
+        ([1, 0, 1, 2], ['red', 'green', 7])
+        >>> colors.to_numpy().tolist() == [item.value for item in colors]
+        True
+        """
+        numpy = _import_numpy(self, 'to_categorical')
+        fields = self._field_elements()
+        if not fields:
+            return numpy.array([], dtype=numpy.intp), list()
+        if not self._uniform(fields):
+            # Mixed elements
+            categories = dict()
+            codes = [categories.setdefault(item.value, len(categories))
+                     for item in fields]
+            return numpy.array(codes, dtype=numpy.intp), list(categories)
+        return self._categorize(numpy, fields,
+                                self._raw_values(numpy, fields))
+
+    @staticmethod
+    def _categorize(numpy: Any,
+                    fields: list[Field],
+                    values: Any) -> tuple[Any, list[Any]]:
+        """ Returns the categorical codes and categories of the *fields*
+        with the raw *values*.
+        """
+        _, first, codes = numpy.unique(values,
+                                       return_index=True,
+                                       return_inverse=True)
+        categories = [fields[index].value for index in first.tolist()]
+        return codes.reshape(-1), categories
+
+    def from_numpy(self,
+                   values: Any,
+                   raw: bool = False) -> None:
+        """ Sets the field values of the :class:`Field` elements in the
+        `Array` from the one-dimensional array-like *values* object with one
+        value for each element.
+
+        The values of :class:`Scaled` and :class:`Fraction` elements and the
+        ``datetime64`` values of :class:`Datetime` elements are converted in
+        bulk to their raw integer values with the conversion parameters of
+        the elements, see :meth:`Scaled.to_scaled_array` and
+        :meth:`Fraction.to_fraction_array`. Elements with differing field
+        classes, bit sizes or decoding attributes are set one by one.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param values: array-like object with the field values.
+        :param bool raw: if :data:`True` the *values* are the raw integer
+            values of :class:`Decimal` elements.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> array = Array(Fraction(2, 16), 3)
+        >>> array.from_numpy(numpy.array([50.0, 125.0, 400.0]))
+        >>> [item.value for item in array]
+        [50.0, 125.0, 399.993896484375]
+        >>> array[1] = Fraction(2, 16, signed=True)
+        >>> array.from_numpy([50.0, -125.0, 400.0])
+        >>> [item.value for item in array]
+        [50.0, -125.0, 399.993896484375]
+        >>> array.from_numpy([16384, 0, 1], raw=True)
+        >>> array.to_numpy(raw=True).tolist()
+        [16384, 0, 1]
+        """
+        numpy = _import_numpy(self, 'from_numpy')
+        values = numpy.asarray(values).ravel()
+        fields = self._field_elements()
+        if len(values) != len(fields):
+            raise ContainerLengthError(self, (len(fields), len(values)))
+        if not fields:
+            return
+        field = fields[0]
+        if not self._uniform(fields):
+            # Mixed elements
+            for item, value in zip(fields, values.tolist()):
+                if raw and isinstance(item, Decimal):
+                    item._value = item.to_decimal(value)
+                else:
+                    item.value = value
+            return
+        if raw and isinstance(field, Decimal):
+            if field.bit_size > 53:
+                values = [field.to_decimal(value) for value in values.tolist()]
+            else:
+                values = _numpy_integers(numpy, values.astype(float),
+                                         field.min(), field.max()).tolist()
+        elif isinstance(field, Scaled):
+            values = field.to_scaled_array(values).tolist()
+        elif isinstance(field, Fraction):
+            values = field.to_fraction_array(values).tolist()
+        elif isinstance(field, Datetime) and values.dtype.kind == 'M':
+            values = numpy.clip(values.astype('datetime64[s]').astype(
+                numpy.int64), field.min(), field.max()).tolist()
+        else:
+            for item, value in zip(fields, values.tolist()):
+                item.value = value
+            return
+        for item, value in zip(fields, values):
+            item._value = value
+
     def initialize_fields(self,
                           content: list[Any]) -> None:
         """ Initializes the :class:`Field` elements in the `Array` with the
@@ -1663,6 +4283,8 @@ class Field:
     """
     # Item type.
     item_type: ItemClass = ItemClass.Field
+    # Weak reference or weak references to the containers of the field
+    _owners: weakref.ref | tuple[weakref.ref, ...] | None = None
 
     def __init__(self,
                  bit_size: int = 0,
@@ -1683,6 +4305,14 @@ class Field:
         # Field value
         self._value = None
 
+    def __copy__(self) -> Field:
+        field = self.__class__.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        # A copy is not contained in the containers of the field
+        field.__dict__.pop('_owners', None)
+        field.__dict__.pop('_owner_ref', None)
+        return field
+
     def __str__(self) -> str:
         return (f"{self.name}"
                 f"({self.index!s}, "
@@ -1726,6 +4356,8 @@ class Field:
         if not isinstance(byte_order, Byteorder):
             raise ByteOrderTypeError(self, value)
         self._byte_order = byte_order
+        if self._owners is not None:
+            _layout_changed(self)
 
     @property
     def index(self) -> Index:
@@ -1902,8 +4534,18 @@ class Field:
             referenced :attr:`~Pointer.data` object its own
             :attr:`~Pointer.bytestream`.
         """
+        return self._deserialize(buffer, index,
+                                 TraversalContext.from_options(options))
+
+    def _deserialize(self,
+                     buffer: bytes,
+                     index: Index,
+                     context: TraversalContext) -> Index:
+        """ De-serializes the `Field` from the byte *buffer* starting with the
+        given *index* with the resolved traversal *context*.
+        """
         self.index = index
-        self._value = self.unpack(buffer, index, **options)
+        self._value = self.unpack(buffer, index, byte_order=context.byte_order)
         return self.index_field(index)
 
     @byte_order_option()
@@ -1936,10 +4578,100 @@ class Field:
             Each :class:`Pointer` field uses for the encoding of its referenced
             :attr:`~Pointer.data` object its own :attr:`~Pointer.bytestream`.
         """
+        return self._serialize(buffer, index,
+                               TraversalContext.from_options(options))
+
+    @byte_order_option()
+    @nested_option()
+    def serialize_into(self,
+                       buffer: Any,
+                       index: Index = Index(),
+                       **options: Any) -> Index:
+        """ Serializes the `Field` in place to the writable *buffer* starting
+        at the byte offset of the given *index*, without re-sizing the
+        *buffer*.
+
+        The *buffer* can be any object supporting the writable buffer
+        protocol, like a :class:`bytearray`, a writable :class:`memoryview`
+        or a :class:`mmap.mmap`.
+
+        Returns the :class:`Index` of the *buffer* after the `Field`.
+
+        :param buffer: writable byte buffer to serialize to.
+        :param Index index: current write :class:`Index` within the *buffer*.
+        :keyword byte_order: encoding byte order for the serialization.
+        :type byte_order: Byteorder|Literal['auto', 'big', 'little']
+        :keyword bool nested: if :data:`True` a :class:`Pointer` field
+            serializes its referenced :attr:`~Pointer.data` object to its own
+            :attr:`~Pointer.bytestream` as well.
+        :raises BufferError: if the *buffer* is too small for the `Field`.
+        """
+        return _serialize_into(self, buffer, index,
+                               self.alignment.byte_size, options)
+
+    def _serialize(self,
+                   buffer: bytearray,
+                   index: Index,
+                   context: TraversalContext) -> Index:
+        """ Serializes the `Field` to the byte *buffer* starting with the
+        given *index* with the resolved traversal *context*.
+        """
         self.index = index
-        buffer += self.pack(buffer, **options)
+        buffer += self.pack(buffer, byte_order=context.byte_order)
         return self.index_field(index)
 
+    def _decode(self,
+                buffer: bytes,
+                index: Index,
+                context: TraversalContext) -> None:
+        """ De-serializes the `Field` from the byte *buffer* with the trusted
+        *index* of a compiled layout without validating the *index*.
+        """
+        self._index = index
+        if not self.is_bit():
+            self._align_to_bit_offset = index.bit
+        self._value = self.unpack(buffer, index, byte_order=context.byte_order)
+
+    def _encode(self,
+                buffer: bytearray,
+                index: Index,
+                context: TraversalContext) -> None:
+        """ Serializes the `Field` to the byte *buffer* with the trusted
+        *index* of a compiled layout without validating the *index*.
+        """
+        self._index = index
+        if not self.is_bit():
+            self._align_to_bit_offset = index.bit
+        buffer += self.pack(buffer, byte_order=context.byte_order)
+
+    def _load(self) -> Any:
+        """ Decodes the field value of a bound `Field` from its backing
+        buffer.
+        """
+        view, byte_order = self._binding
+        index = self._index
+        content = bytes(view[index.byte:index.byte +
+                             self.alignment.byte_size])
+        return self.unpack(content, index._replace(byte=0),
+                           byte_order=byte_order)
+
+    def _store(self) -> None:
+        """ Encodes the field value of a bound `Field` into its backing
+        buffer.
+        """
+        view, byte_order = self._binding
+        content = self.pack(bytearray(), byte_order=byte_order)
+        start = self._index.byte
+        stop = start + len(content)
+        if self.bit_size != len(content) * 8:
+            # Keep the other fields of the field group in the buffer
+            mask = ((1 << self.bit_size) - 1) << self._index.bit
+            value = int.from_bytes(view[start:stop], byte_order.value)
+            value &= ~mask
+            value |= int.from_bytes(content, byte_order.value)
+            content = value.to_bytes(len(content), byte_order.value)
+        view[start:stop] = content
+
     def index_field(self,
                     index: Index = Index()) -> Index:
         """ Indexes the `Field` with the given *index* und returns the
@@ -1975,6 +4707,19 @@ class Field:
         # Index for the next field
         return Index(byte, bit, address, base, update)
 
+    def _layout_key(self) -> tuple[Any, ...] | None:
+        """ Returns the layout key of the `Field` for a compiled layout, or
+        :data:`None` if the `Field` overrides its :meth:`index_field` method.
+        """
+        if self.__class__.index_field is not Field.index_field:
+            return None
+        return (self.__class__,
+                self._bit_size,
+                self._align_to_byte_size,
+                self._align_to_bit_offset if self.is_bit() else None,
+                self._byte_order,
+                getattr(self, '_signed', None))
+
     @nested_option(True)
     def describe(self,
                  name: str = str(),
@@ -2020,7 +4765,10 @@ class Stream(Field):
     and returns its field :attr:`value` as a hexadecimal string.
 
     Internally a `Stream` field uses a :class:`bytes` class to store the
-    data of its field :attr:`value`.
+    data of its field :attr:`value`, or a :class:`bytearray` class after it
+    was re-sized or padded, which is re-sized in place. The raw bytes are
+    accessible without a hexadecimal encoding with :meth:`view` and
+    ``bytes(self)``.
 
     A `Stream` field is:
 
@@ -2098,6 +4846,8 @@ class Stream(Field):
     False
     >>> stream[5:].hex()  # converts to bytes
     '060708090a'
+    >>> stream.view()[5:].tobytes()
+    b'\\x06\\x07\\x08\\t\\n'
     >>> stream.describe()
     {'address': 0,
      'alignment': [10, 0],
@@ -2115,10 +4865,17 @@ class Stream(Field):
     def __init__(self, capacity: int = 0) -> None:
         super().__init__()
         # Field value
-        self._value: bytes = bytes()
+        self._value: bytes | bytearray = bytes()
         # Stream size
         self.resize(capacity)
 
+    def __copy__(self) -> Stream:
+        field = super().__copy__()
+        if isinstance(self._value, bytearray):
+            # Copies must not share a mutable field value
+            field._value = bytearray(self._value)
+        return field
+
     def __bytes__(self) -> bytes:
         return bytes(self._value)
 
@@ -2129,6 +4886,8 @@ class Stream(Field):
         return len(self._value)
 
     def __getitem__(self, key: int | slice) -> int | bytes:
+        if isinstance(key, slice):
+            return memoryview(self._value)[key].tobytes()
         return self._value[key]
 
     def __iter__(self) -> Iterator[int]:
@@ -2158,6 +4917,12 @@ class Stream(Field):
         """
         return self._value.hex()
 
+    def view(self) -> memoryview:
+        """ Returns a read-only :class:`memoryview` of the bytes in the
+        :attr:`value` of the `Stream` field without copying them.
+        """
+        return memoryview(self._value).toreadonly()
+
     @staticmethod
     def is_stream() -> bool:
         """ Returns :data:`True`."""
@@ -2191,10 +4956,15 @@ class Stream(Field):
             raise FieldIndexError(self, index)
 
         # Content of the buffer mapped by the field
-        offset = self.index.byte
-        size = offset + len(self)
-        bytestream = buffer[offset:size]
-        bytestream += b'\x00' * max(len(self) - len(bytestream), 0)
+        offset = index.byte
+        size = len(self)
+        available = max(min(len(buffer) - offset, size), 0)
+        if available == size:
+            return buffer[offset:offset + size]
+
+        # Pad the content beyond the end of the buffer in place
+        bytestream = bytearray(memoryview(buffer)[offset:offset + available])
+        bytestream.extend(bytes(size - available))
         return bytestream
 
     @byte_order_option()
@@ -2206,25 +4976,38 @@ class Stream(Field):
             raise FieldIndexError(self, self.index)
         return self._value
 
+    def _resized(self, capacity: int) -> bytearray:
+        """ Returns a copy of the field value re-sized to the *capacity*."""
+        size = min(capacity, len(self._value))
+        value = bytearray(memoryview(self._value)[:size])
+        value.extend(bytes(capacity - size))
+        return value
+
     def resize(self, capacity: int) -> None:
         """ Re-sizes the `Stream` field by appending zero bytes or
         removing bytes from the end.
 
         :param int capacity: `Stream` capacity in number of bytes.
         """
-        count = max(int(capacity), 0) - len(self)
-
-        if count == 0:
+        capacity = max(int(capacity), 0)
+        if capacity == len(self):
             pass
-        elif -count == len(self):
-            self._value = bytes()
-        elif count > 0:
-            self._value += b'\x00' * count
+        elif isinstance(self._value, bytearray):
+            try:
+                # Re-size the field value in place
+                if capacity > len(self):
+                    self._value.extend(bytes(capacity - len(self)))
+                else:
+                    del self._value[capacity:]
+            except BufferError:
+                # Field value is exported by a view
+                self._value = self._resized(capacity)
         else:
-            self._value = self._value[:count]
-        capacity = len(self)
+            self._value = self._resized(capacity)
         self._bit_size = capacity * 8
         self._align_to_byte_size = capacity
+        if self._owners is not None:
+            _layout_changed(self)
 
 
 class String(Stream):
@@ -2353,6 +5136,340 @@ class String(Stream):
         return self._value.find(b'\x00') >= 0
 
 
+def _import_numpy(owner: Any, method: str) -> Any:
+    """ Returns the optional :mod:`numpy` package required by the *method*
+    of the *owner*.
+    """
+    try:
+        return importlib.import_module('numpy')
+    except ImportError as error:
+        raise ImportError(
+            f"{owner.__class__.__name__}.{method}() requires the "
+            f"optional package 'numpy'.") from error
+
+
+def _numpy_integers(numpy: Any,
+                    values: Any,
+                    minimum: int,
+                    maximum: int) -> Any:
+    """ Returns the float *values* truncated to integers and limited between
+    the *minimum* and *maximum* value as a :class:`numpy.int64` array, same
+    as :func:`int` and :func:`clamp` for each value.
+    """
+    if not numpy.isfinite(values).all():
+        raise ValueError("cannot convert non-finite values to integers")
+    return numpy.clip(numpy.trunc(values), minimum, maximum).astype(
+        numpy.int64)
+
+
+def _swap_words(content: bytes, size: int) -> bytes:
+    """ Returns the *content* with the bytes of each word with the *size*
+    in bytes in reversed order.
+    """
+    if size <= 1:
+        return bytes(content)
+    swapped = bytearray(len(content))
+    for offset in range(size):
+        swapped[offset::size] = content[size - 1 - offset::size]
+    return bytes(swapped)
+
+
+class BitArray(Field):
+    """ The :class:`BitArray` field is a :class:`Field` with a variable number
+    of packed bit flags, and returns its field :attr:`value` as a string with
+    a ``'0'`` or ``'1'`` character for each flag.
+
+    The flags are packed into *words* with a size of one or more bytes. The
+    flag with the number *n* is the bit ``n % (8 * word_size)`` of the word
+    ``n // (8 * word_size)``, same as the flag *n* of an :class:`Array` with
+    :class:`Bitset` fields of the word size.
+
+    Internally a `BitArray` field uses a :class:`bytes` class to store its
+    words in little endian byte order, and decodes and encodes all words of
+    the `BitArray` field at once.
+
+    A `BitArray` field is:
+
+    - *sized*: ``len(self)`` returns the number of flags of the `BitArray`
+      field.
+    - *indexable* ``self[index]`` returns the *flag* at the *index*
+      of the `BitArray` field.
+    - *iterable* ``iter(self)`` iterates over the flags of the `BitArray`
+      field.
+
+    :param int capacity: is the *capacity* of the `BitArray` field in flags.
+    :param int word_size: is the *size* of a word in bytes,
+        can be between ``1`` and ``8``.
+    :param byte_order: byte order used to unpack and pack the words of the
+        `BitArray` field.
+    :type byte_order: Byteorder|Literal['auto', 'big', 'little']
+
+    Example:
+
+    >>> flags = BitArray(12, word_size=2)
+    >>> flags.name
+    'BitArray12'
+    >>> flags.alignment
+    Alignment(byte_size=2, bit_offset=0)
+    >>> flags.byte_order
+    Byteorder.auto = 'auto'
+    >>> flags.index
+    Index(byte=0, bit=0, address=0, base_address=0, update=False)
+    >>> flags.index_field()
+    Index(byte=2, bit=0, address=2, base_address=0, update=False)
+    >>> flags.bit_size
+    16
+    >>> flags.word_size
+    2
+    >>> len(flags)
+    12
+    >>> flags.value
+    '000000000000'
+    >>> flags.deserialize(bytes.fromhex('0180'), byte_order='big')
+    Index(byte=2, bit=0, address=2, base_address=0, update=False)
+    >>> flags.value
+    '000000011000'
+    >>> flags[7], flags[-1]
+    (True, False)
+    >>> flags.count()
+    2
+    >>> bytes(flags)
+    b'\\x80\\x01'
+    >>> buffer = bytearray()
+    >>> flags.serialize(buffer, byte_order='big')
+    Index(byte=2, bit=0, address=2, base_address=0, update=False)
+    >>> buffer.hex()
+    '0180'
+    >>> flags.value = '101'
+    >>> flags.value
+    '101000000000'
+    >>> [flag for flag in flags][:4]
+    [True, False, True, False]
+    >>> flags.value = [True, True]
+    >>> flags.value
+    '110000000000'
+    >>> flags.resize(20)
+    >>> flags.alignment
+    Alignment(byte_size=4, bit_offset=0)
+    >>> flags.value
+    '11000000000000000000'
+    >>> flags.describe()
+    {'address': 0,
+     'alignment': [4, 0],
+     'class': 'BitArray20',
+     'index': [0, 0],
+     'name': 'BitArray20',
+     'order': 'auto',
+     'size': 32,
+     'type': 'Field',
+     'value': '11000000000000000000'}
+    """
+    # Item type.
+    item_type: ItemClass = ItemClass.BitArray
+
+    def __init__(self,
+                 capacity: int = 0,
+                 word_size: int = 1,
+                 byte_order: (Literal['auto', 'big', 'little'] |
+                              Byteorder) = 'auto') -> None:
+        super().__init__(byte_order=byte_order)
+        # Invalid word size
+        if int(word_size) not in range(1, 9):
+            raise FieldAlignmentError(self, self.index,
+                                      Alignment(word_size, 0))
+        # Word size
+        self._word_size: int = int(word_size)
+        # Number of flags
+        self._capacity: int = 0
+        # Field value
+        self._value: bytes = bytes()
+        # BitArray size
+        self.resize(capacity)
+
+    def __bytes__(self) -> bytes:
+        if self.byte_order is Byteorder.auto:
+            byte_order = BYTEORDER
+        else:
+            byte_order = self.byte_order
+        if byte_order is Byteorder.big:
+            return _swap_words(self._value, self._word_size)
+        return bytes(self._value)
+
+    def __len__(self) -> int:
+        return self._capacity
+
+    def __getitem__(self, key: int | slice) -> bool | list[bool]:
+        flags = range(self._capacity)[key]
+        if isinstance(flags, range):
+            return [self._flag(flag) for flag in flags]
+        return self._flag(flags)
+
+    def __iter__(self) -> Iterator[bool]:
+        return (flag == '1' for flag in self.value)
+
+    def _flag(self, number: int) -> bool:
+        return bool(self._value[number >> 3] >> (number & 7) & 1)
+
+    @property
+    def name(self) -> str:
+        """ Returns the type name of the `BitArray` field (read-only)."""
+        if self._capacity > 0:
+            return self.item_type.name + str(self._capacity)
+        else:
+            return self.item_type.name
+
+    @property
+    def word_size(self) -> int:
+        """ Returns the size of a word of the `BitArray` field in bytes
+        (read-only).
+        """
+        return self._word_size
+
+    @property
+    def value(self) -> str:
+        """ Field value as a string with a ``'0'`` or ``'1'`` character for
+        each flag.
+        """
+        flags = int.from_bytes(self._value, 'little')
+        return format(flags, f"0{len(self._value) * 8}b")[::-1][:self._capacity]
+
+    @value.setter
+    def value(self, flags: str | bytes | bytearray | Iterable[Any]) -> None:
+        self._value = self.to_flags(flags)
+
+    def count(self) -> int:
+        """ Returns the number of set flags of the `BitArray` field."""
+        return bin(int.from_bytes(self._value, 'little')).count('1')
+
+    def to_flags(self, value: str | bytes | bytearray | Iterable[Any]) -> bytes:
+        """ Returns the words in little endian byte order for the flags
+        *value*, either a string with a ``'0'`` or ``'1'`` character for each
+        flag, the packed words in little endian byte order, or an iterable
+        with the truth value of each flag.
+        """
+        size = len(self._value)
+        if isinstance(value, (bytearray, bytes)):
+            words = bytes(value[:size])
+            return words + b'\x00' * (size - len(words))
+        if isinstance(value, str):
+            flags = value[:self._capacity]
+            if flags.strip('01'):
+                raise FieldValueError(self, self.index, value)
+        elif isinstance(value, Iterable):
+            flags = ''.join('1' if flag else '0'
+                            for flag, _ in zip(value, range(self._capacity)))
+        else:
+            raise FieldTypeError(self, self.index, value)
+        return int(flags[::-1] or '0', 2).to_bytes(size, 'little')
+
+    def to_numpy(self, dtype: Any = bool) -> Any:
+        """ Returns the flags of the `BitArray` field as a one-dimensional
+        :class:`numpy.ndarray` with the *dtype*.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param dtype: data type of the array, a boolean array by default.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> flags = BitArray(10)
+        >>> flags.value = '1000000011'
+        >>> flags.to_numpy().tolist() == [flag == '1' for flag in flags.value]
+        True
+        >>> flags.to_numpy(numpy.uint8).tolist()
+        [1, 0, 0, 0, 0, 0, 0, 0, 1, 1]
+        """
+        numpy = _import_numpy(self, 'to_numpy')
+        flags = numpy.unpackbits(numpy.frombuffer(self._value, numpy.uint8),
+                                 count=self._capacity,
+                                 bitorder='little')
+        if numpy.dtype(dtype) == numpy.bool_:
+            return flags.view(numpy.bool_)
+        return flags.astype(dtype, copy=False)
+
+    def from_numpy(self, flags: Any) -> None:
+        """ Sets the flags of the `BitArray` field from the truth values
+        of a one-dimensional array-like *flags* object.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param flags: truth values of the flags.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> flags = BitArray(10)
+        >>> flags.from_numpy(numpy.array([1, 0, 1, 1, 0, 0, 0, 0, 0, 1]))
+        >>> flags.value
+        '1011000001'
+        >>> flags.from_numpy(flags.to_numpy())
+        >>> flags.value
+        '1011000001'
+        """
+        numpy = _import_numpy(self, 'from_numpy')
+        flags = numpy.asarray(flags).ravel()[:self._capacity] != 0
+        self.value = numpy.packbits(flags, bitorder='little').tobytes()
+
+    @byte_order_option()
+    def unpack(self,
+               buffer: bytes = bytes(),
+               index: Index = Index(),
+               **options: Any) -> bytes:
+        # Bad placed field
+        if index.bit:
+            raise FieldIndexError(self, index)
+
+        # Content of the buffer mapped by the field
+        offset = index.byte
+        size = len(self._value)
+        words = buffer[offset:offset + size]
+        words += b'\x00' * max(size - len(words), 0)
+
+        # Decoding byte order of the words
+        byte_order = self.byte_order
+        if byte_order is Byteorder.auto:
+            byte_order = get_byte_order(options)
+        if byte_order is Byteorder.big:
+            return _swap_words(words, self._word_size)
+        return bytes(words)
+
+    @byte_order_option()
+    def pack(self,
+             buffer: bytearray = bytearray(),
+             **options: Any) -> bytes:
+        # Bad placed field
+        if self.index.bit:
+            raise FieldIndexError(self, self.index)
+
+        # Encoding byte order of the words
+        byte_order = self.byte_order
+        if byte_order is Byteorder.auto:
+            byte_order = get_byte_order(options)
+        if byte_order is Byteorder.big:
+            return _swap_words(self._value, self._word_size)
+        return self._value
+
+    def resize(self, capacity: int) -> None:
+        """ Re-sizes the `BitArray` field by appending cleared flags or
+        removing flags from the end.
+
+        :param int capacity: `BitArray` capacity in number of flags.
+        """
+        capacity = max(int(capacity), 0)
+        words = -(-capacity // (self._word_size * 8))
+        size = words * self._word_size
+        flags = int.from_bytes(self._value, 'little') & ((1 << capacity) - 1)
+        self._value = flags.to_bytes(size, 'little')
+        self._capacity = capacity
+        self._bit_size = size * 8
+        self._align_to_byte_size = size
+        if self._owners is not None:
+            _layout_changed(self)
+
+
 class Float(Field):
     """ The :class:`Float` field is a :class:`Field` with a fix *size* of four
     bytes, and returns its field :attr:`value` as a single precision float.
@@ -2983,6 +6100,8 @@ class Decimal(Field):
     @signed.setter
     def signed(self, value: bool) -> None:
         self._signed = bool(value)
+        if self._owners is not None:
+            _layout_changed(self)
         self._value = self._cast(self._value,
                                  self.min(), self.max(),
                                  self._signed)
@@ -3241,10 +6360,9 @@ class Decimal(Field):
         size = offset + self.alignment.byte_size
         if len(buffer) == size:
             # Map the field value into the existing field group content of the buffer
-            view = memoryview(buffer)
             value |= int.from_bytes(buffer[offset:size], byte_order.value)
-            view[offset:size] = value.to_bytes(self.alignment.byte_size,
-                                               byte_order.value)
+            buffer[offset:size] = value.to_bytes(self.alignment.byte_size,
+                                                 byte_order.value)
             return bytes()
         else:
             # Extent the buffer with the field group content and the field value
@@ -4355,6 +7473,67 @@ class Scaled(Decimal):
         return self.to_decimal((float(value) / self.scale) *
                                self.scaling_base())
 
+    def as_float_array(self, values: Any) -> Any:
+        """ Returns the scaled floating-point numbers of the raw integer
+        *values* as a :class:`numpy.ndarray`, same as :meth:`as_float` for
+        each value.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param values: array-like object with the raw integer values.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> scaled = Scaled(100, 16)
+        >>> values = [0, 0x2000, 0x4000, -0x8000]
+        >>> scaled.as_float_array(values).tolist()
+        [0.0, 50.0, 100.0, -200.0]
+        >>> scaled.as_float_array(values).tolist() == list(map(scaled.as_float,
+        ...                                                    values))
+        True
+        """
+        numpy = _import_numpy(self, 'as_float_array')
+        if self.bit_size > 53:
+            # Raw values are not exact as double precision numbers
+            values = numpy.asarray(values, dtype=object)
+            return numpy.fromiter(map(self.as_float, values.ravel().tolist()),
+                                  float, values.size).reshape(values.shape)
+        return (numpy.asarray(values) / self.scaling_base()) * self.scale
+
+    def to_scaled_array(self, values: Any) -> Any:
+        """ Returns the raw integer values of the floating-point numbers
+        *values* as a :class:`numpy.ndarray`, same as :meth:`to_scaled` for
+        each value.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param values: array-like object with the floating-point numbers.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> scaled = Scaled(100, 16)
+        >>> values = [0.0, 25.0, 50.01, -200.0]
+        >>> scaled.to_scaled_array(values).tolist()
+        [0, 4096, 8193, -32768]
+        >>> scaled.to_scaled_array(values).tolist() == list(map(scaled.to_scaled,
+        ...                                                     values))
+        True
+        """
+        numpy = _import_numpy(self, 'to_scaled_array')
+        values = numpy.asarray(values, dtype=float)
+        if self.bit_size > 53:
+            # Raw values are not exact as double precision numbers
+            return numpy.array(list(map(self.to_scaled,
+                                        values.ravel().tolist())),
+                               dtype=numpy.int64).reshape(values.shape)
+        return _numpy_integers(numpy,
+                               (values / self.scale) * self.scaling_base(),
+                               self.min(), self.max())
+
     @property
     def scale(self) -> float:
         """ Scaling factor of the `Scaled` field."""
@@ -4655,6 +7834,95 @@ class Fraction(Decimal):
             decimal = clamp(integer | fraction, 0, 2 ** self.bit_size - 1)
         return self.to_decimal(decimal)
 
+    def as_float_array(self, values: Any) -> Any:
+        """ Returns the floating-point numbers of the raw integer *values*
+        as a :class:`numpy.ndarray`, same as :meth:`as_float` for each value.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param values: array-like object with the raw integer values.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> fraction = Fraction(2, 16, signed=True)
+        >>> values = [0, 0x2000, 0xa000, 0x7fff]
+        >>> fraction.as_float_array(values).tolist()
+        [0.0, 50.0, -50.0, 199.993896484375]
+        >>> fraction.as_float_array(values).tolist() == list(
+        ...     map(fraction.as_float, values))
+        True
+        """
+        numpy = _import_numpy(self, 'as_float_array')
+        if self.bit_size > 53:
+            # Raw values are not exact as double precision numbers
+            values = numpy.asarray(values, dtype=object)
+            return numpy.fromiter(map(self.as_float, values.ravel().tolist()),
+                                  float, values.size).reshape(values.shape)
+        values = numpy.asarray(values, dtype=numpy.int64)
+        bits_fraction = max(self.bit_size - self._bits_integer, 0)
+        fraction = (values & (2 ** bits_fraction - 1)) / 2 ** bits_fraction
+        if self._signed_fraction:
+            mask = 2 ** (self.bit_size - 1)
+            factor = numpy.where(values & mask, -100.0, 100.0)
+            integer = (values & (mask - 1)) >> bits_fraction
+        else:
+            factor = 100.0
+            integer = values >> bits_fraction
+        return (integer + fraction) * factor
+
+    def to_fraction_array(self, values: Any) -> Any:
+        """ Returns the raw integer values of the floating-point numbers
+        *values* as a :class:`numpy.ndarray`, same as :meth:`to_fraction`
+        for each value.
+
+        .. note:: Requires the optional package ``numpy``.
+
+        :param values: array-like object with the floating-point numbers.
+
+        Example:
+
+        >>> import pytest
+        >>> numpy = pytest.importorskip('numpy')
+        >>> fraction = Fraction(2, 16, signed=True)
+        >>> values = [0.0, 50.0, -50.0, 400.0]
+        >>> fraction.to_fraction_array(values).tolist()
+        [0, 8192, 40960, 32767]
+        >>> fraction.to_fraction_array(values).tolist() == list(
+        ...     map(fraction.to_fraction, values))
+        True
+        """
+        numpy = _import_numpy(self, 'to_fraction_array')
+        values = numpy.asarray(values, dtype=float)
+        if self.bit_size > 53:
+            # Raw values are not exact as double precision numbers
+            return numpy.array(list(map(self.to_fraction,
+                                        values.ravel().tolist())),
+                               dtype=numpy.uint64).reshape(values.shape)
+        normalized = values / 100.0
+        if not numpy.isfinite(normalized).all():
+            raise ValueError("cannot convert non-finite values to integers")
+        bits_fraction = max(self.bit_size - self._bits_integer, 0)
+        if self._signed_fraction:
+            integer = numpy.trunc(normalized)
+            fraction = numpy.trunc(numpy.fabs(normalized - integer) *
+                                   2 ** bits_fraction)
+            decimal = numpy.clip(
+                numpy.fabs(integer) * 2 ** bits_fraction + fraction,
+                0, 2 ** (self.bit_size - 1) - 1).astype(numpy.int64)
+            decimal |= numpy.where(normalized < 0,
+                                   2 ** (self.bit_size - 1), 0)
+        else:
+            normalized = numpy.maximum(normalized, 0)
+            integer = numpy.trunc(normalized)
+            fraction = numpy.trunc((normalized - integer) *
+                                   2 ** bits_fraction)
+            decimal = numpy.clip(
+                integer * 2 ** bits_fraction + fraction,
+                0, 2 ** self.bit_size - 1).astype(numpy.int64)
+        return decimal
+
     def describe(self,
                  name: str = str(),
                  **options: Any) -> dict[str, Any]:
@@ -5097,6 +8365,10 @@ class IPv4Address(Decimal):
         self._value = int(ipaddress.IPv4Address(x))
 
 
+#: Policies for the bytestream of a pointer field after reading its data object.
+_STREAM_POLICIES = ('retain', 'drop', 'compress')
+
+
 class Pointer(Decimal, Container):
     """ The :class:`Pointer` field is an unsigned :class:`Decimal` field with a
     *size* of four bytes, and returns its field :attr:`value` as a hexadecimal
@@ -5278,6 +8550,12 @@ class Pointer(Decimal, Container):
     # Item type of a Pointer field.
     item_type: ItemClass = ItemClass.Pointer
 
+    # Policy for the bytestream after reading the data object.
+    _stream_policy: str = 'retain'
+
+    # Released bytestream as a tuple of the policy and the retained content.
+    _released: tuple[str, bytes] | None = None
+
     def __init__(self,
                  template: Structure | Sequence | Field | None = None,
                  address: int | None = None,
@@ -5300,6 +8578,11 @@ class Pointer(Decimal, Container):
         # Data objects byte order
         self._data_byte_order = self.data_byte_order = data_order
 
+    def _members(self) -> Iterable[Structure | Sequence | Field]:
+        # Deferred data objects are not read
+        data = self.__dict__.get('_data')
+        return () if data is None else (data,)
+
     @property
     def address(self) -> int:
         """ Returns the *data source* address of the :attr:`data` object
@@ -5319,18 +8602,94 @@ class Pointer(Decimal, Container):
         """ Byte stream of the `Pointer` field for the referenced :attr:`data`
         object. Returned as a lowercase hexadecimal encoded string.
         """
-        return self._data_stream.hex()
+        return self._stream().hex()
 
     @bytestream.setter
     def bytestream(self,
-                   value: bytes | bytearray | str) -> None:
+                   value: bytes | bytearray | memoryview | str) -> None:
+        self._released = None
         if isinstance(value, str):
             self._data_stream = bytes.fromhex(value)
-        elif isinstance(value, (bytearray, bytes)):
+        elif isinstance(value, (bytearray, bytes, memoryview)):
             self._data_stream = bytes(value)
         else:
             raise FieldTypeError(self, self.index, value)
 
+    def bytestream_view(self) -> memoryview:
+        """ Returns a read-only :class:`memoryview` of the :attr:`bytestream`
+        of the `Pointer` field without copying or encoding it, unless the
+        :attr:`bytestream` is released by the :attr:`stream_policy`.
+        """
+        return memoryview(self._stream()).toreadonly()
+
+    @property
+    def stream_policy(self) -> str:
+        """ Policy for the :attr:`bytestream` of the `Pointer` field after
+        :meth:`read_from` de-serialized the referenced :attr:`data` object.
+
+        - ``'retain'`` keeps the :attr:`bytestream` (default).
+        - ``'drop'`` drops the :attr:`bytestream`, it is re-encoded from the
+          :attr:`data` object on demand.
+        - ``'compress'`` keeps the :attr:`bytestream` compressed, it is
+          decompressed on demand.
+
+        Example:
+
+        >>> class Memory(Provider):
+        ...     def read(self, address=0, count=0):
+        ...         return bytes.fromhex('00000100')[address:address + count]
+        ...     def write(self, buffer=bytes(), address=0, count=0):
+        ...         pass
+        >>> pointer = Pointer(Structure(x=Decimal(16)), address=2)
+        >>> pointer.stream_policy
+        'retain'
+        >>> pointer.stream_policy = 'drop'
+        >>> pointer.read_from(Memory())
+        >>> pointer.data.x.value
+        1
+        >>> pointer.data.x.value = 2
+        >>> pointer.bytestream
+        '0200'
+        """
+        return self._stream_policy
+
+    @stream_policy.setter
+    def stream_policy(self, value: str) -> None:
+        self._stream_policy = self._check_policy(value)
+
+    def _check_policy(self, policy: str) -> str:
+        """ Returns the validated bytestream *policy*."""
+        if policy not in _STREAM_POLICIES:
+            raise FieldValueError(self, self.index, policy)
+        return policy
+
+    def _stream(self) -> bytes:
+        """ Returns the :attr:`bytestream` of the `Pointer` field, a released
+        :attr:`bytestream` is restored without retaining it.
+        """
+        if self._released is None:
+            return self._data_stream
+        policy, content = self._released
+        if policy == 'compress':
+            return zlib.decompress(content)
+        stream = bytearray()
+        _serialize_item(self._data, stream,
+                        Index(0, 0, self.address, self.base_address, False),
+                        TraversalContext(byte_order=self.data_byte_order))
+        return bytes(stream)
+
+    def _release_stream(self, policy: str) -> None:
+        """ Releases the :attr:`bytestream` of the `Pointer` field in
+        accordance with the bytestream *policy*.
+        """
+        if policy == 'drop':
+            self._released = policy, bytes()
+        elif policy == 'compress':
+            self._released = policy, zlib.compress(self._data_stream)
+        else:
+            return
+        self._data_stream = bytes()
+
     @property
     def data(self) -> Structure | Sequence | Field | None:
         """ `Data` object referenced by the `Pointer` field."""
@@ -5344,6 +8703,7 @@ class Pointer(Decimal, Container):
             self._data = value
         else:
             raise MemberTypeError(self, value, 'data')
+        _layout_changed(self)
 
     @property
     def data_byte_order(self) -> Byteorder:
@@ -5430,7 +8790,7 @@ class Pointer(Decimal, Container):
             if byte_order not in ('big', 'little',
                                   Byteorder.big, Byteorder.little):
                 byte_order = self.data_byte_order
-            index = self._data.deserialize(buffer or self._data_stream,
+            index = self._data.deserialize(buffer or self._stream(),
                                            index,
                                            nested=False,
                                            byte_order=byte_order)
@@ -5505,31 +8865,114 @@ class Pointer(Decimal, Container):
             :attr:`~Pointer.data` object fields as well (chained method call).
             Each `Pointer` field stores the bytes for its referenced
             :attr:`data` object in its :attr:`bytestream`.
+        :keyword bool lazy: if :data:`True` all :class:`Pointer` fields in the
+            :attr:`data` object of the `Pointer` field defer reading their
+            referenced :attr:`data` object until its first access, see
+            :meth:`~Container.prefetch`.
+        :keyword str stream_policy: overrules the :attr:`stream_policy` of
+            the `Pointer` field and of all :class:`Pointer` fields read in
+            the :attr:`data` object for this read.
         """
+        policy = self._check_policy(get_stream_policy(options) or
+                                    self._stream_policy)
         if self._data is None:
             pass
         elif is_provider(provider):
             if self._value < 0:
                 pass
             elif null_allowed or self._value > 0:
+                self.bytestream = provider.read(self.address, self.data_size)
+                index = self.deserialize_data()
+                resume = None
                 while True:
-                    self.bytestream = provider.read(self.address,
-                                                    self.data_size)
-                    index = self.deserialize_data()
                     # Incomplete data object
                     if index.bit != 0:
                         length = index.byte, index.bit
                         raise ContainerLengthError(self, length)
                     if not index.update:
                         break
+                    # Read only the missing tail of the re-sized data object
+                    size = self.data_size
+                    stream = self._data_stream
+                    if size > len(stream):
+                        stream += provider.read(self.address + len(stream),
+                                                size - len(stream))
+                    self.bytestream = stream[:size]
+                    index, resume = self._resume_data(resume)
+                self._release_stream(policy)
                 if is_mixin(self._data) and get_nested(options):
-                    self._data.read_from(provider, **options)
+                    _read_item(self._data, provider, options)
             else:
                 self.bytestream = bytes()
                 self.deserialize_data()
         else:
             raise ProviderTypeError(self, provider)
 
+    def _defer(self,
+               provider: Provider,
+               options: dict[str, Any]) -> None:
+        """ Defers reading the :attr:`data` object referenced by the `Pointer`
+        field from the data *provider* with the keyword *options* until the
+        first access of the :attr:`data` object.
+        """
+        if '_lazy' not in self.__dict__:
+            self.__class__ = _lazy_class(self.__class__)
+        self._lazy = provider, options
+
+    def _undefer(self) -> None:
+        """ Cancels the deferred reading of the :attr:`data` object."""
+        del self._lazy
+        self.__class__ = self.__class__.__base__
+
+    def _fetch(self) -> int:
+        """ Reads the deferred :attr:`data` object referenced by the `Pointer`
+        field and returns the number of bytes read, or zero if the reading of
+        the :attr:`data` object is not deferred.
+        """
+        if '_lazy' not in self.__dict__:
+            return 0
+        provider, options = self._lazy
+        self._undefer()
+        self.read_from(provider, **options)
+        return self.data_size
+
+    def _resume_data(self,
+                     resume: tuple[int, Index] | None
+                     ) -> tuple[Index, tuple[int, Index] | None]:
+        """ De-serializes the :attr:`data` object from the :attr:`bytestream`
+        starting with the member at the *resume* point ``(position, index)``
+        or with the first member of the :attr:`data` object.
+
+        Returns the :class:`Index` after the last de-serialized member and the
+        resume point of the first member requesting an update of the
+        :attr:`bytestream`. The members before this member are not affected
+        by the update.
+
+        A :attr:`data` object which is not a container or overrides its
+        :meth:`~Container.deserialize` method is de-serialized as a whole.
+        """
+        data = self._data
+        if (not is_container(data) or
+                _is_hooked(data.__class__, 'deserialize') or
+                _is_hooked(self.__class__, 'deserialize_data')):
+            return self.deserialize_data(), None
+        if resume is None:
+            resume = 0, Index(0, 0, self.address, self.base_address, False)
+        position, index = resume
+        if is_structure(data):
+            items = list(data.values())
+        else:
+            items = data._data
+        context = TraversalContext(byte_order=self.data_byte_order)
+        resume = None
+        for number in range(position, len(items)):
+            start = index
+            index = _deserialize_item(items[number], self._data_stream,
+                                      index, context)
+            if resume is None and index.update:
+                resume = number, start
+        return index, resume
+
     def patch(self,
               item: Structure | Sequence | Field,
               byte_order: (Literal['big', 'little'] |
@@ -5561,17 +9004,15 @@ class Pointer(Decimal, Container):
                 # Bad placed container
                 raise FieldIndexError(field, index)
 
-            # Create a dummy byte array filled with zero bytes.
-            # The dummy byte array is necessary because the length of
-            # the buffer must correlate to the field indexes of the
-            # appending fields.
-            buffer = bytearray(b'\x00' * index.byte)
-
-            # Append to the buffer the content mapped by the container fields
-            item.serialize(buffer, index, byte_order=byte_order)
-
-            # Content of the buffer mapped by the container fields
-            content = buffer[index.byte:]
+            # Serialize the container fields relative to the container
+            # start, the buffer holds only the content mapped by them.
+            content = bytearray()
+            try:
+                item.serialize(content, index._replace(byte=0),
+                               byte_order=byte_order)
+            finally:
+                # Restore the field indexes of the container
+                item.index_fields(index)
 
             if len(content) != length[0]:
                 # Not correct filled buffer!
@@ -5594,17 +9035,15 @@ class Pointer(Decimal, Container):
                 raise FieldGroupOffsetError(
                     item, index, Alignment(alignment.byte_size, index.bit))
 
-            # Create a dummy byte array filled with zero bytes.
-            # The dummy byte array is necessary because the length of
-            # the buffer must correlate to the field index of the
-            # appending field group.
-            buffer = bytearray(b'\x00' * index.byte)
-
-            # Append to the buffer the content mapped by the field
-            item.serialize(buffer, index, byte_order=byte_order)
-
-            # Content of the buffer mapped by the field group
-            content = buffer[index.byte:]
+            # Serialize the field relative to its field group start, the
+            # buffer holds only the content mapped by the field group.
+            content = bytearray()
+            try:
+                item.serialize(content, index._replace(byte=0),
+                               byte_order=byte_order)
+            finally:
+                # Restore the field index
+                item.index_field(index)
 
             if len(content) != alignment.byte_size:
                 # Not correct filled buffer!
@@ -5710,18 +9149,45 @@ class Pointer(Decimal, Container):
             Each :class:`Pointer` field uses for the de-serialization of its
             referenced :attr:`data` object its own :attr:`bytestream`.
         """
+        return self._deserialize(buffer, index,
+                                 TraversalContext.from_options(options))
+
+    def _deserialize(self,
+                     buffer: bytes,
+                     index: Index,
+                     context: TraversalContext) -> Index:
+        """ De-serializes the `Pointer` field from the byte *buffer* starting
+        with the given *index* with the resolved traversal *context*.
+        """
         # Field
-        index = super().deserialize(buffer, index, **options)
+        index = super()._deserialize(buffer, index, context)
         # Data Object
-        if self._data and get_nested(options):
-            options[str(Option.byte_order.value)] = self.data_byte_order
-            self._data.deserialize(self._data_stream,
-                                   Index(0, 0,
-                                         self.address, self.base_address,
-                                         False),
-                                   **options)
+        self._deserialize_nested(context)
         return index
 
+    def _decode(self,
+                buffer: bytes,
+                index: Index,
+                context: TraversalContext) -> None:
+        # Field
+        super()._decode(buffer, index, context)
+        # Data Object
+        self._deserialize_nested(context)
+
+    def _deserialize_nested(self, context: TraversalContext) -> None:
+        """ De-serializes the :attr:`data` object referenced by the `Pointer`
+        field from its :attr:`bytestream` if the traversal *context* is
+        nested.
+        """
+        if context.nested and self._data:
+            _deserialize_item(self._data,
+                              self._stream(),
+                              Index(0, 0,
+                                    self.address, self.base_address,
+                                    False),
+                              context._replace(
+                                  byte_order=self.data_byte_order))
+
     @byte_order_option()
     @nested_option()
     def serialize(self,
@@ -5751,19 +9217,46 @@ class Pointer(Decimal, Container):
             Each :class:`Pointer` field uses for the serialization of its
             referenced :attr:`data` object its own :attr:`bytestream`.
         """
+        return self._serialize(buffer, index,
+                               TraversalContext.from_options(options))
+
+    def _serialize(self,
+                   buffer: bytearray,
+                   index: Index,
+                   context: TraversalContext) -> Index:
+        """ Serializes the `Pointer` field to the byte *buffer* starting with
+        the given *index* with the resolved traversal *context*.
+        """
+        # Field
+        index = super()._serialize(buffer, index, context)
+        # Data Object
+        self._serialize_nested(context)
+        return index
+
+    def _encode(self,
+                buffer: bytearray,
+                index: Index,
+                context: TraversalContext) -> None:
         # Field
-        index = super().serialize(buffer, index, **options)
+        super()._encode(buffer, index, context)
         # Data Object
-        if self._data and get_nested(options):
-            options[str(Option.byte_order.value)] = self.data_byte_order
+        self._serialize_nested(context)
+
+    def _serialize_nested(self, context: TraversalContext) -> None:
+        """ Serializes the :attr:`data` object referenced by the `Pointer`
+        field to its :attr:`bytestream` if the traversal *context* is nested.
+        """
+        if context.nested and self._data:
+            self._released = None
             self._data_stream = bytearray()
-            self._data.serialize(self._data_stream,
-                                 Index(0, 0,
-                                       self.address, self.base_address,
-                                       False),
-                                 **options)
+            _serialize_item(self._data,
+                            self._data_stream,
+                            Index(0, 0,
+                                  self.address, self.base_address,
+                                  False),
+                            context._replace(
+                                byte_order=self.data_byte_order))
             self._data_stream = bytes(self._data_stream)
-        return index
 
     def initialize_fields(self,
                           content: dict[str, Any]) -> None:
@@ -5805,20 +9298,27 @@ class Pointer(Decimal, Container):
             referenced :attr:`~Pointer.data` object fields as well
             (chained method call).
         """
+        return self._index_fields(index,
+                                  TraversalContext.from_options(options))
+
+    def _index_fields(self,
+                      index: Index,
+                      context: TraversalContext) -> Index:
+        """ Indexes the `Pointer` field and its :attr:`data` object starting
+        with the given *index* with the resolved traversal *context*.
+        """
         index = self.index_field(index)
 
         # Container
         if is_container(self._data):
-            self._data.index_fields(Index(0, 0,
-                                          self.address, self.base_address,
-                                          False),
-                                    **options)
+            _index_item(self._data,
+                        Index(0, 0, self.address, self.base_address, False),
+                        context)
         # Pointer
-        elif is_pointer(self._data) and get_nested(options):
-            self._data.index_fields(Index(0, 0,
-                                          self.address, self.base_address,
-                                          False),
-                                    **options)
+        elif is_pointer(self._data) and context.nested:
+            _index_item(self._data,
+                        Index(0, 0, self.address, self.base_address, False),
+                        context)
         # Field
         elif is_field(self._data):
             self._data.index_field(Index(0, 0,
@@ -5900,23 +9400,35 @@ class Pointer(Decimal, Container):
             referenced :attr:`~Pointer.data` object field items as well
             (chained method call).
         """
-        items = list()
+        return [(join_field_path(item_path), item) for item_path, item in
+                self.iter_field_items((path,) if path else (), **options)]
+
+    @nested_option()
+    def iter_field_items(self,
+                         path: tuple[str | int, ...] = (),
+                         **options: Any) -> Iterator[tuple[tuple[str | int, ...],
+                                                           Field]]:
+        """ Yields a **flatten** sequence of ``(field path, field item)``
+        tuples for the `Pointer` field itself and for each :class:`Field`
+        *nested* in the :attr:`data` object referenced by the `Pointer` field.
+
+        :param tuple path: field path of the `Pointer` field.
+        :keyword bool nested: if :data:`True` all :class:`Pointer` fields in the
+            :attr:`data` object referenced by the `Pointer` field yield their
+            referenced :attr:`~Pointer.data` object field items as well
+            (chained method call).
+        """
         # Field
-        items.append((path if path else 'field', self))
+        yield path, self
         # Data Object
-        data_path = f"{path}.data" if path else 'data'
-        # Container
-        if is_container(self._data):
-            for field_item in self._data.field_items(data_path, **options):
-                items.append(field_item)
-        # Pointer
-        elif is_pointer(self._data) and get_nested(options):
-            for field_item in self._data.field_items(data_path, **options):
-                items.append(field_item)
+        data_path = (*path, 'data')
+        # Container or Pointer
+        if is_container(self._data) or (is_pointer(self._data) and
+                                        get_nested(options)):
+            yield from _iter_field_items(self._data, data_path, options)
         # Field
         elif is_field(self._data):
-            items.append((data_path, self._data))
-        return items
+            yield data_path, self._data
 
     @nested_option(True)
     def describe(self,
@@ -7276,10 +10788,16 @@ class AutoStringPointer(StringPointer):
     >>> pointer.to_dict()
     {'AutoStringPointer': {'field': '0xffffffff', 'data': 'KonFoo is '}}
     """
-    #: Block size in *bytes* to read for the :class:`String` field.
+    #: Block size in *bytes* of the first read for the :class:`String` field.
     BLOCK_SIZE = 64
+    #: Maximal block size in *bytes* of the following reads, each read
+    #: doubles the block size up to this limit.
+    MAX_BLOCK_SIZE = 4096
     #: Maximal allowed address of the :class:`String` field.
     MAX_ADDRESS = 0xffffffff
+    #: Maximal length in *bytes* of the :class:`String` field to scan for
+    #: its terminating zero byte, or :data:`None` for no limit.
+    MAX_LENGTH: int | None = None
 
     def __init__(self,
                  address: int | None = None,
@@ -7298,33 +10816,48 @@ class AutoStringPointer(StringPointer):
                   provider: Provider,
                   null_allowed: bool = False,
                   **options: Any) -> None:
+        policy = self._check_policy(get_stream_policy(options) or
+                                    self._stream_policy)
         if self._data is None:
             pass
         elif is_provider(provider):
             if self._value < 0:
                 pass
             elif null_allowed or self._value > 0:
-                self._data_stream = bytes()
-                self.resize(0)
-                for address in range(self.address,
-                                     self.MAX_ADDRESS,
-                                     self.BLOCK_SIZE):
-                    count = clamp(self.BLOCK_SIZE,
-                                  0,
-                                  (self.MAX_ADDRESS - address))
-                    self._data_stream += provider.read(address, count)
-                    self.resize(len(self) + count)
-                    index = self.deserialize_data()
-                    # Incomplete data object
-                    if index.bit != 0:
-                        length = index.byte, index.bit
-                        raise ContainerLengthError(self, length)
-                    # Terminated?
-                    if self.data.is_terminated():
-                        self.resize(len(self.data.value) + 1)
+                stream = bytearray()
+                address = self.address
+                limit = self.MAX_ADDRESS
+                if self.MAX_LENGTH is not None:
+                    limit = min(limit, address + self.MAX_LENGTH)
+                count = self.BLOCK_SIZE
+                size = 0
+                while address < limit:
+                    count = min(count, limit - address)
+                    block = provider.read(address, count)
+                    stream += block
+                    # Scan only the new block for the terminating zero byte
+                    size = stream.find(b'\x00', len(stream) - len(block))
+                    if size >= 0:
+                        size += 1
                         break
+                    size = len(stream)
+                    # End of the data source: zero padded
+                    if len(block) < count:
+                        size += 1
+                        break
+                    address += count
+                    count = max(count, min(count * 2, self.MAX_BLOCK_SIZE))
+                # Over-read bytes behind the terminating zero byte
+                self.bytestream = stream[:size]
+                self.resize(size)
+                index = self.deserialize_data()
+                # Incomplete data object
+                if index.bit != 0:
+                    length = index.byte, index.bit
+                    raise ContainerLengthError(self, length)
+                self._release_stream(policy)
             else:
-                self._data_stream = bytes()
+                self.bytestream = bytes()
                 self.resize(0)
                 self.deserialize_data()
         else:
@@ -8195,7 +11728,7 @@ class ArrayRelativePointer(SequenceRelativePointer):
                          bit_size=bit_size,
                          align_to=align_to,
                          field_order=field_order)
-        self._data = Array(template, capacity)
+        self.data = Array(template, capacity)
 
     def append(self) -> None:
         """ Appends a new :class:`Array` element to the :class:`Array`."""
@@ -10,6 +10,53 @@ Extended Python integer enum type.
 from __future__ import annotations
 
 import enum
+from typing import Any
+
+
+def member_maps(enumeration: type[enum.Enum]) -> tuple[
+        dict[Any, enum.Enum] | None, dict[str, enum.Enum]]:
+    """ Returns the ``{value: member}`` and ``{name: member}`` maps of the
+    members of the *enumeration* class, built on first use and cached per
+    class.
+
+    The value map is :data:`None` if a member value is not hashable.
+
+    :param enumeration: enumeration class.
+    """
+    maps = enumeration.__dict__.get('_member_maps_cache')
+    if maps is None:
+        by_value: dict[Any, enum.Enum] | None = dict()
+        by_name: dict[str, enum.Enum] = dict()
+        for member in enumeration:
+            by_name.setdefault(member.name, member)
+            if by_value is not None:
+                try:
+                    by_value.setdefault(member.value, member)
+                except TypeError:
+                    by_value = None
+        maps = by_value, by_name
+        enumeration._member_maps_cache = maps
+    return maps
+
+
+def lookup_member(enumeration: type[enum.Enum],
+                  value: Any) -> enum.Enum | None:
+    """ Returns the first member of the *enumeration* class matches the
+    *value* or :data:`None`.
+
+    :param enumeration: enumeration class.
+    :param value: member value to look up.
+    """
+    by_value = member_maps(enumeration)[0]
+    if by_value is not None:
+        try:
+            return by_value.get(value)
+        except TypeError:
+            pass
+    for member in enumeration:
+        if member.value == value:
+            return member
+    return None
 
 
 class Enumeration(enum.IntEnum):
@@ -174,10 +221,10 @@ class Enumeration(enum.IntEnum):
         >>> Color.get_name(0x777777)
         ''
         """
-        for member in cls:
-            if member.value == value:
-                return member.name
-        return str()
+        member = lookup_member(cls, value)
+        if member is None:
+            return str()
+        return member.name
 
     @classmethod
     def get_value(cls,
@@ -196,10 +243,10 @@ class Enumeration(enum.IntEnum):
         >>> Color.get_value('red')
 
         """
-        for member in cls:
-            if member.name == name:
-                return member.value
-        return None
+        member = member_maps(cls)[1].get(name)
+        if member is None:
+            return None
+        return member.value
 
     @classmethod
     def get_member(cls,
@@ -219,7 +266,7 @@ class Enumeration(enum.IntEnum):
         >>> Color.get_member(0x777777, None)
 
         """
-        for member in cls:
-            if member.value == value:
-                return member
-        return default
+        member = lookup_member(cls, value)
+        if member is None:
+            return default
+        return member
@@ -123,6 +123,34 @@ class ContainerLengthError(ValueError):
         super().__init__(message)
 
 
+class ContainerSnapshotError(ValueError):
+    """ Raised if a snapshot of a container class has an inappropriate format.
+    """
+
+    def __init__(self,
+                 container: Structure | Sequence | Pointer,
+                 reason: str) -> None:
+        message = (
+            f"{container.__class__.__name__}: Inappropriate snapshot format, "
+            f"{reason}.")
+        super().__init__(message)
+
+
+class ContainerLayoutError(ContainerSnapshotError):
+    """ Raised if the layout of a container class does not match the layout of
+    its snapshot.
+    """
+
+    def __init__(self,
+                 container: Structure | Sequence | Pointer,
+                 fingerprint: str,
+                 expected: str) -> None:
+        reason = (
+            f"container layout '{fingerprint}' does not match the snapshot "
+            f"layout '{expected}'")
+        super().__init__(container, reason)
+
+
 class FieldAddressError(ValueError):
     """ Raised if an inappropriate address is assigned to a field class.
     """
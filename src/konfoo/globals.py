@@ -22,6 +22,7 @@ class ItemClass(Enumeration):
     Array: ItemClass = 12
     Stream: ItemClass = 20
     String: ItemClass = 21
+    BitArray: ItemClass = 22
     Float: ItemClass = 30
     Double: ItemClass = 31
     Decimal: ItemClass = 40
@@ -10,7 +10,8 @@ Function decorators.
 from __future__ import annotations
 
 from functools import wraps
-from typing import (Any, Callable)
+from types import MappingProxyType
+from typing import (Any, Callable, Mapping, NamedTuple)
 
 from .categories import Category
 from .globals import (
@@ -21,6 +22,8 @@ class Option(Category):
     byte_order: Option = 'byte_order'
     nested: Option = 'nested'
     verbose: Option = 'verbose'
+    lazy: Option = 'lazy'
+    stream_policy: Option = 'stream_policy'
 
 
 def byte_order_option(
@@ -76,6 +79,16 @@ def get_nested(options: dict[str, Any]) -> bool:
     return options.get(option, False)
 
 
+def get_lazy(options: dict[str, Any]) -> bool:
+    option = Option.lazy.value
+    return options.get(option, False)
+
+
+def get_stream_policy(options: dict[str, Any]) -> str | None:
+    option = Option.stream_policy.value
+    return options.get(option)
+
+
 def verbose_option(
     default: bool = False) -> Callable[[Callable[..., Any]],
                                        Callable[..., Any]]:
@@ -101,3 +114,40 @@ def verbose(options: dict[str, Any],
     option = Option.verbose.value
     if options.get(option, False) and message:
         print(message)
+
+
+class TraversalContext(NamedTuple):
+    """ Resolved options of a traversal through a container.
+
+    The context is created once from the keyword *options* of the top-level
+    call and passed down to the nested containers and fields instead of the
+    keyword *options*.
+    """
+    #: Byte order for the de-/serialization.
+    byte_order: Byteorder = BYTEORDER
+    #: Traverse the data objects of the pointer fields as well.
+    nested: bool = False
+    #: Other keyword options passed through to the overridden traversal
+    #: methods.
+    keywords: Mapping[str, Any] = MappingProxyType({})
+
+    @classmethod
+    def from_options(cls, options: dict[str, Any]) -> TraversalContext:
+        """ Returns the traversal context resolved from the keyword
+        *options*.
+        """
+        keywords = {key: value for key, value in options.items()
+                    if key not in _CONTEXT_OPTIONS}
+        return cls(get_byte_order(options), bool(get_nested(options)),
+                   MappingProxyType(keywords) if keywords else
+                   cls._field_defaults['keywords'])
+
+    def options(self) -> dict[str, Any]:
+        """ Returns the keyword options of the traversal context."""
+        return {**self.keywords,
+                Option.byte_order.value: self.byte_order,
+                Option.nested.value: self.nested}
+
+
+#: Keyword options resolved by the traversal context.
+_CONTEXT_OPTIONS = (Option.byte_order.value, Option.nested.value)
@@ -10,7 +10,15 @@ Data provider.
 from __future__ import annotations
 
 import abc
+import hashlib
+import os
+import secrets
+import struct
+import sys
+from bisect import bisect_right
+from multiprocessing import (resource_tracker, shared_memory)
 from pathlib import Path
+from typing import (Any, BinaryIO)
 
 
 class Provider:
@@ -128,3 +136,631 @@ class FileProvider(Provider):
             self.path.write_bytes(self._cache)
         else:
             Path(file).write_bytes(self._cache)
+
+
+#: Name prefix of the shared memory blocks of the :class:`SharedMemoryProvider`.
+_SHARED_MEMORY_PREFIX = 'kfp'
+
+
+def _tracker_tag() -> str:
+    """ Returns a tag identifying the pipe to the resource tracker of the
+    process, shared by its forked and spawned child processes.
+    """
+    stat = os.fstat(resource_tracker.getfd())
+    return hashlib.blake2b(struct.pack('<QQ', stat.st_dev, stat.st_ino),
+                           digest_size=4).hexdigest()
+
+
+def _create_shared_memory(size: int) -> shared_memory.SharedMemory:
+    """ Creates a new shared memory block with the given *size*, the name of
+    the block is tagged with the resource tracker of the creating process.
+    """
+    if os.name != 'posix':
+        return shared_memory.SharedMemory(create=True, size=size)
+    while True:
+        name = (f"{_SHARED_MEMORY_PREFIX}_{_tracker_tag()}_"
+                f"{secrets.token_hex(4)}")
+        try:
+            return shared_memory.SharedMemory(name=name, create=True,
+                                              size=size)
+        except FileExistsError:
+            continue
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """ Attaches the existing shared memory block *name* without handing it
+    over to the resource tracker of the process, which would unlink the block
+    at the exit of the process.
+
+    Processes sharing the resource tracker of the creator of the block keep
+    its registration.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    memory = shared_memory.SharedMemory(name=name)
+    if (os.name == 'posix' and not memory.name.startswith(
+            f"{_SHARED_MEMORY_PREFIX}_{_tracker_tag()}_")):
+        resource_tracker.unregister(memory._name, 'shared_memory')
+    return memory
+
+
+class SharedMemoryProvider(Provider):
+    """ The :class:`SharedMemoryProvider` is a byte stream :class:`Provider`
+    for binary files shared by several processes.
+
+    The *file* content is internal stored in a named
+    :class:`~multiprocessing.shared_memory.SharedMemory` block, which is
+    created once by the parent process and attached by its :attr:`name` in
+    the worker processes. A `SharedMemoryProvider` passed to a worker process
+    is attached to the same shared memory block without copying it.
+
+    The :meth:`read` method returns read-only :class:`memoryview` slices of
+    the shared memory block without copying them, concurrent reads are safe.
+
+    The :meth:`write` method writes unsynchronized into the shared memory
+    block, the processes must not read and write the same memory area
+    concurrently.
+
+    Call :meth:`close` to detach the shared memory block and :meth:`unlink`
+    in the parent process to release it. Used as a context manager, the
+    shared memory block is detached and released by its creator.
+
+    .. note:: Only the creator of the shared memory block may unlink it.
+       An attached shared memory block is not tracked by the resource
+       tracker of the attaching process, the block survives the exit of
+       independent reader processes.
+
+    :param Path|str|None file: name and location of the file to read into
+        a new shared memory block.
+    :param str|None name: name of the existing shared memory block to attach.
+    :param int|None size: size of the content of the existing shared memory
+        block. Default is the size of the shared memory block.
+
+    >>> import os, subprocess, sys, tempfile
+    >>> with tempfile.NamedTemporaryFile(delete=False) as file:
+    ...     file.write(bytes(range(8)))
+    8
+    >>> provider = SharedMemoryProvider(file.name)
+    >>> provider.size
+    8
+    >>> reader = SharedMemoryProvider(name=provider.name)
+    >>> bytes(reader.read(2, 4)).hex()
+    '02030405'
+    >>> reader.close()
+    >>> code = ('import sys; from konfoo import SharedMemoryProvider; '
+    ...         'SharedMemoryProvider(name=sys.argv[1], size=8).close()')
+    >>> subprocess.run([sys.executable, '-c', code, provider.name],
+    ...                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+    ...                capture_output=True, check=True).stderr
+    b''
+    >>> reader = SharedMemoryProvider(name=provider.name, size=provider.size)
+    >>> bytes(reader.read(4, 4)).hex()
+    '04050607'
+    >>> reader.close()
+    >>> provider.close()
+    >>> provider.unlink()
+    >>> os.remove(file.name)
+    """
+
+    def __init__(self,
+                 file: Path | str | None = None,
+                 name: str | None = None,
+                 size: int | None = None) -> None:
+        #: File path.
+        self.path = None if file is None else Path(file).absolute()
+        if self.path is not None:
+            size = self.path.stat().st_size
+            # A shared memory block must not be empty
+            self._memory = _create_shared_memory(max(size, 1))
+            with self.path.open('rb') as file:
+                file.readinto(self._memory.buf[:size])
+            self._owner = True
+        elif name is not None:
+            self._memory = _attach_shared_memory(name)
+            if size is None:
+                size = self._memory.size
+            self._owner = False
+        else:
+            raise ValueError("SharedMemoryProvider requires a file or a name")
+        #: Size of the content of the shared memory block.
+        self.size = size
+        # Read-only view of the content of the shared memory block.
+        self._view = self._memory.buf[:size].toreadonly()
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}"
+                f"({self.name!s}, {self.size!s})")
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}"
+                f"(name={self.name!r}, size={self.size!r})")
+
+    def __del__(self) -> None:
+        # Release the view before the shared memory block is detached
+        if hasattr(self, '_view'):
+            self.close()
+
+    def __reduce__(self) -> tuple:
+        # Worker processes attach the shared memory block by its name
+        return self.__class__, (None, self.name, self.size)
+
+    def __enter__(self) -> SharedMemoryProvider:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        """ Returns the name of the shared memory block (read-only)."""
+        return self._memory.name
+
+    @property
+    def cache(self) -> memoryview:
+        """ Returns a read-only view of the content of the shared memory
+        block (read-only)."""
+        return self._view
+
+    def read(self,
+             address: int = 0,
+             count: int = 0) -> memoryview:
+        """ Returns a read-only view of a *number* of bytes of the shared
+        memory block beginning at the start *address*.
+
+        :param int address: start address.
+        :param int count: number of bytes to read from the shared memory block.
+        """
+        return self._view[address:address + count]
+
+    def write(self,
+              buffer: bytes | bytearray = bytes(),
+              address: int = 0,
+              count: int = 0) -> None:
+        """ Writes the content of the *buffer* to the shared memory block
+        beginning at the start *address*.
+
+        :param bytes|bytearray buffer: content to write.
+        :param int address: start address.
+        :param int count: number of bytes to write to the shared memory block.
+        """
+        self._memory.buf[address:address + count] = buffer[:count]
+
+    def flush(self,
+              file: Path | str | None = None) -> None:
+        """ Flushes the content of the shared memory block to the given *file*.
+
+        .. note::  Overwrites an existing file.
+
+        :param Path|str|None file: name and location of the file.
+            Default is the original file.
+        """
+        path = self.path if file is None else Path(file)
+        if path is None:
+            raise ValueError("SharedMemoryProvider requires a file to flush")
+        path.write_bytes(self._view)
+
+    def close(self) -> None:
+        """ Detaches the shared memory block from the process.
+
+        .. note:: Views returned by :meth:`read` must be released before.
+        """
+        self._view.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """ Releases the shared memory block, called once by the creating
+        process.
+
+        .. note:: Only the creator of the shared memory block may unlink it.
+        """
+        self._memory.unlink()
+
+
+#: Cache file format of the :class:`DiskCacheProvider`.
+_CACHE_MAGIC = b'KFPC'
+
+_CACHE_VERSION = 1
+
+#: Cache file header: magic, version, known end of the data source.
+_CACHE_HEADER = struct.Struct('<4sB3xQ')
+
+#: Cache file record: start address and size of a cached range.
+_CACHE_RECORD = struct.Struct('<QQ')
+
+#: Unknown end of the data source.
+_CACHE_NO_END = 2 ** 64 - 1
+
+
+class DiskCacheProvider(Provider):
+    """ The :class:`DiskCacheProvider` is a byte stream :class:`Provider`,
+    which wraps another *provider* and persists the byte ranges read from the
+    wrapped *provider* in a cache file on the local disk.
+
+    The cache file is identified by the *key* of the data source and an
+    optional *generation* tag of its content. A later :class:`DiskCacheProvider`
+    with the same *key* and *generation* serves the cached byte ranges from
+    the cache file and reads only the missing byte ranges from the wrapped
+    *provider*. Adjacent and overlapping byte ranges are merged.
+
+    The byte ranges in the cache file are read on demand, only the byte
+    ranges read from the wrapped *provider* since the last :meth:`flush` are
+    held in memory.
+
+    The :meth:`write` method writes through to the wrapped *provider*.
+
+    Call :meth:`flush` or use the `DiskCacheProvider` as a context manager
+    to store the cached byte ranges in the cache file.
+
+    :param Provider provider: wrapped data :class:`Provider`.
+    :param Path|str directory: location of the cache files.
+    :param str|None key: identity of the data source. Default is the class
+        and the :attr:`~FileProvider.path` of the wrapped *provider*, a
+        *provider* without a path requires a *key*.
+    :param generation: tag of the content of the data source. A new
+        *generation* starts a new cache file.
+    :param int|None max_size: maximal size of all cache files in the
+        *directory* in bytes. The least recently used cache files are
+        removed by :meth:`flush` to keep the size.
+    :raises ValueError: if no *key* is given for a *provider* without a path.
+
+    Example:
+
+    >>> import tempfile
+    >>> class Memory(Provider):
+    ...     reads = 0
+    ...     def read(self, address=0, count=0):
+    ...         Memory.reads += 1
+    ...         return bytes(range(16))[address:address + count]
+    >>> directory = tempfile.TemporaryDirectory()
+    >>> with DiskCacheProvider(Memory(), directory.name, key='memory') as cache:
+    ...     cache.read(2, 4).hex()
+    ...     cache.read(4, 4).hex()
+    '02030405'
+    '04050607'
+    >>> Memory.reads
+    2
+    >>> cache = DiskCacheProvider(Memory(), directory.name, key='memory')
+    >>> cache.size
+    6
+    >>> cache.read(2, 6).hex()
+    '020304050607'
+    >>> cache.read(14, 4).hex()
+    '0e0f'
+    >>> Memory.reads
+    3
+    >>> cache.flush()
+    >>> cache.close()
+    >>> cache.read(0, 4).hex()
+    '00010203'
+    >>> Memory.reads
+    4
+    >>> cache.close()
+    >>> DiskCacheProvider(Memory(), directory.name)
+    Traceback (most recent call last):
+    ...
+    ValueError: DiskCacheProvider requires a key for the data source of the provider 'Memory'
+    >>> directory.cleanup()
+    """
+
+    def __init__(self,
+                 provider: Provider,
+                 directory: Path | str,
+                 key: str | None = None,
+                 generation: str | int | None = None,
+                 max_size: int | None = None) -> None:
+        #: Wrapped data provider.
+        self.provider = provider
+        #: Cache directory.
+        self.directory = Path(directory).absolute()
+        #: Identity of the data source.
+        self.key = self._source_key(provider) if key is None else str(key)
+        #: Tag of the content of the data source.
+        self.generation = generation
+        #: Maximal size of all cache files in the directory in bytes.
+        self.max_size = max_size
+        digest = hashlib.blake2b(f"{self.key}\0{generation}".encode(),
+                                 digest_size=16)
+        #: Cache file path.
+        self.path = self.directory / f"{digest.hexdigest()}.kfc"
+        # Start addresses and contents of the cached byte ranges, the content
+        # is either held in memory or the (offset, size) in the cache file.
+        self._starts: list[int] = list()
+        self._blocks: list[bytearray | tuple[int, int]] = list()
+        # Opened cache file.
+        self._file: BinaryIO | None = None
+        # Device, inode and size of the cache file of the stored byte ranges.
+        self._identity: tuple[int, int, int] | None = None
+        # Known end address of the data source.
+        self._end: int | None = None
+        # Cached byte ranges are not stored in the cache file.
+        self._dirty = False
+        self._load()
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}"
+                f"({self.path!s}, {self.size!s})")
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}"
+                f"(provider={self.provider!r}, path={self.path!r}, "
+                f"size={self.size!r})")
+
+    def __enter__(self) -> DiskCacheProvider:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """ Returns the number of cached bytes (read-only)."""
+        return sum(self._size(number) for number in range(len(self._blocks)))
+
+    def _source_key(self, provider: Provider) -> str:
+        """ Returns the identity of the data source of the *provider* by
+        its class and its path.
+        """
+        path = getattr(provider, 'path', None)
+        if path is None:
+            raise ValueError(
+                f"{self.__class__.__name__} requires a key for the data "
+                f"source of the provider '{provider.__class__.__name__}'")
+        cls = provider.__class__
+        return f"{cls.__module__}.{cls.__qualname__}({Path(path).absolute()!s})"
+
+    def _size(self, number: int) -> int:
+        """ Returns the size of the cached byte range with the *number*."""
+        block = self._blocks[number]
+        if isinstance(block, tuple):
+            return block[1]
+        return len(block)
+
+    def _content(self,
+                 number: int,
+                 offset: int,
+                 count: int) -> bytes:
+        """ Returns a *count* of bytes of the cached byte range with the
+        *number* beginning at the *offset* in the byte range.
+        """
+        block = self._blocks[number]
+        if isinstance(block, tuple):
+            position, size = block
+            file = self._open()
+            file.seek(position + offset)
+            return file.read(min(count, size - offset))
+        return bytes(block[offset:offset + count])
+
+    @staticmethod
+    def _file_identity(file: BinaryIO) -> tuple[int, int, int]:
+        """ Returns the device, the inode and the size of the opened *file*."""
+        stat = os.fstat(file.fileno())
+        return stat.st_dev, stat.st_ino, stat.st_size
+
+    def _open(self) -> BinaryIO:
+        """ Returns the cache file of the stored byte ranges, a cache file
+        closed by :meth:`close` is reopened.
+
+        :raises ValueError: if the cache file was replaced or removed since
+            it was closed.
+        """
+        if self._file is None:
+            try:
+                file = self.path.open('rb')
+            except OSError:
+                file = None
+            if file is None or self._file_identity(file) != self._identity:
+                if file is not None:
+                    file.close()
+                raise ValueError(
+                    f"{self.__class__.__name__} cache file '{self.path!s}' "
+                    f"was replaced or removed since it was closed")
+            self._file = file
+        return self._file
+
+    def _load(self) -> None:
+        """ Loads the index of the cached byte ranges in the cache file."""
+        try:
+            file = self.path.open('rb')
+        except OSError:
+            return
+        header = file.read(_CACHE_HEADER.size)
+        if len(header) < _CACHE_HEADER.size:
+            file.close()
+            return
+        magic, version, end = _CACHE_HEADER.unpack(header)
+        if magic != _CACHE_MAGIC or version != _CACHE_VERSION:
+            file.close()
+            return
+        length = os.fstat(file.fileno()).st_size
+        offset = _CACHE_HEADER.size
+        stop = 0
+        while offset + _CACHE_RECORD.size <= length:
+            address, size = _CACHE_RECORD.unpack(file.read(_CACHE_RECORD.size))
+            offset += _CACHE_RECORD.size
+            # Truncated or unordered byte range
+            if offset + size > length or address < stop:
+                break
+            self._starts.append(address)
+            self._blocks.append((offset, size))
+            offset += size
+            stop = address + size
+            file.seek(offset)
+        self._file = file
+        self._identity = self._file_identity(file)
+        self._end = None if end == _CACHE_NO_END else end
+        # Mark the cache file as recently used
+        os.utime(self.path)
+
+    def _store(self,
+               address: int,
+               content: bytes) -> None:
+        """ Merges the *content* at the start *address* into the cached
+        byte ranges.
+        """
+        if not content:
+            return
+        starts, blocks = self._starts, self._blocks
+        stop = address + len(content)
+        first = bisect_right(starts, address) - 1
+        if first < 0 or starts[first] + self._size(first) < address:
+            first += 1
+        last = bisect_right(starts, stop)
+        # Byte ranges in the cache file adjacent to the content are kept
+        if (first < last and isinstance(blocks[first], tuple) and
+                starts[first] + self._size(first) == address):
+            first += 1
+        if (first < last and isinstance(blocks[last - 1], tuple) and
+                starts[last - 1] == stop):
+            last -= 1
+        block = bytearray()
+        start = address
+        if first < last and starts[first] < address:
+            start = starts[first]
+            block += self._content(first, 0, address - start)
+        block += content
+        if first < last:
+            end = starts[last - 1] + self._size(last - 1)
+            if end > stop:
+                block += self._content(last - 1,
+                                       stop - starts[last - 1],
+                                       end - stop)
+        starts[first:last] = [start]
+        blocks[first:last] = [block]
+        self._dirty = True
+
+    def read(self,
+             address: int = 0,
+             count: int = 0) -> bytes:
+        """ Returns a *number* of bytes read from the cached byte ranges
+        beginning at the start *address*. Missing byte ranges are read from
+        the wrapped :attr:`provider` and cached.
+
+        :param int address: start address.
+        :param int count: number of bytes to read.
+        """
+        starts = self._starts
+        content = bytearray()
+        position = address
+        stop = address + count
+        if self._end is not None:
+            stop = min(stop, self._end)
+        while position < stop:
+            number = bisect_right(starts, position) - 1
+            if number >= 0:
+                offset = position - starts[number]
+                if offset < self._size(number):
+                    chunk = self._content(number, offset, stop - position)
+                    content += chunk
+                    position += len(chunk)
+                    continue
+            # Missing byte range up to the next cached byte range
+            gap = stop
+            if number + 1 < len(starts):
+                gap = min(gap, starts[number + 1])
+            size = gap - position
+            chunk = bytes(self.provider.read(position, size))[:size]
+            self._store(position, chunk)
+            content += chunk
+            position += len(chunk)
+            if len(chunk) < size:
+                # End of the data source
+                self._end = position
+                self._dirty = True
+                break
+        return bytes(content)
+
+    def write(self,
+              buffer: bytes | bytearray = bytes(),
+              address: int = 0,
+              count: int = 0) -> None:
+        """ Writes the content of the *buffer* to the wrapped :attr:`provider`
+        and to the cached byte ranges beginning at the start *address*.
+
+        :param bytes|bytearray buffer: content to write.
+        :param int address: start address.
+        :param int count: number of bytes to write.
+        """
+        self.provider.write(buffer, address, count)
+        self._store(address, bytes(buffer[:count]))
+
+    def flush(self) -> None:
+        """ Stores the cached byte ranges in the cache file and removes the
+        least recently used cache files in the :attr:`directory` exceeding
+        the :attr:`max_size`. Adjacent byte ranges are stored as one byte
+        range, the stored byte ranges are released from the memory.
+
+        .. note:: The cached byte ranges are not stored if they alone exceed
+            the :attr:`max_size`.
+        """
+        if self._dirty:
+            # Runs of adjacent byte ranges
+            runs = list()
+            for number, start in enumerate(self._starts):
+                if runs and runs[-1][0] + runs[-1][1] == start:
+                    runs[-1][1] += self._size(number)
+                    runs[-1][2].append(number)
+                else:
+                    runs.append([start, self._size(number), [number]])
+            length = _CACHE_HEADER.size + sum(
+                _CACHE_RECORD.size + size for start, size, numbers in runs)
+            if self.max_size is None or length <= self.max_size:
+                self._save(runs)
+            self._dirty = False
+        if self.max_size is not None and self.directory.is_dir():
+            files = sorted((path.stat().st_mtime, path)
+                           for path in self.directory.glob('*.kfc')
+                           if path != self.path)
+            size = sum(path.stat().st_size
+                       for path in self.directory.glob('*.kfc'))
+            for mtime, path in files:
+                if size <= self.max_size:
+                    break
+                size -= path.stat().st_size
+                path.unlink(missing_ok=True)
+
+    def _save(self, runs: list[list[Any]]) -> None:
+        """ Writes the *runs* of adjacent cached byte ranges to the cache
+        file and refers the cached byte ranges to the cache file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        end = _CACHE_NO_END if self._end is None else self._end
+        # Replace the cache file atomic for concurrent readers
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        starts, blocks = list(), list()
+        with temporary.open('wb') as file:
+            file.write(_CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, end))
+            for start, size, numbers in runs:
+                file.write(_CACHE_RECORD.pack(start, size))
+                starts.append(start)
+                blocks.append((file.tell(), size))
+                for number in numbers:
+                    block = self._blocks[number]
+                    if not isinstance(block, tuple):
+                        file.write(block)
+                        continue
+                    # Copy the byte range from the replaced cache file
+                    offset, count = 0, block[1]
+                    while offset < count:
+                        chunk = self._content(number, offset,
+                                              min(count - offset, 2 ** 20))
+                        file.write(chunk)
+                        offset += len(chunk)
+        self.close()
+        os.replace(temporary, self.path)
+        self._file = self.path.open('rb')
+        self._identity = self._file_identity(self._file)
+        self._starts, self._blocks = starts, blocks
+
+    def close(self) -> None:
+        """ Closes the cache file, the byte ranges not stored by
+        :meth:`flush` stay cached in memory.
+
+        The cache file is reopened to read a stored byte range after closing,
+        unless the cache file was replaced or removed in the meantime.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
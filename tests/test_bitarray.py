@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+test_bitarray.py
+~~~~~~~~~~~~~~~~
+Tests of the packed bit array field against arrays of scalar bit fields.
+
+:copyright: (c) 2015-2022 by Jochen Gerhaeusser.
+:license: BSD, see LICENSE for details.
+"""
+import random
+
+import pytest
+
+from konfoo import Array, Bit, BitArray, Bitset, Byteorder, Structure
+
+WORDS = 16
+DATA = bytes(random.Random(38).randrange(256) for _ in range(WORDS * 8))
+
+
+def bitset_flags(word_size, byte_order):
+    """ Returns the flags of an array of bitset fields as a list."""
+    array = Array(Bitset(8 * word_size), WORDS)
+    array.deserialize(DATA, byte_order=byte_order)
+    return [int(item.value, 2) >> bit & 1 == 1
+            for item in array for bit in range(8 * word_size)]
+
+
+@pytest.mark.parametrize('byte_order', [Byteorder.little, Byteorder.big])
+@pytest.mark.parametrize('word_size', [1, 2, 3, 4, 8])
+def test_deserialize(word_size, byte_order):
+    flags = BitArray(WORDS * 8 * word_size, word_size)
+    index = flags.deserialize(DATA, byte_order=byte_order)
+    assert index.byte == WORDS * word_size
+    expected = bitset_flags(word_size, byte_order)
+    assert list(flags) == expected
+    assert flags[:] == expected
+    assert flags.value == ''.join('1' if flag else '0' for flag in expected)
+    assert flags.count() == sum(expected)
+
+
+@pytest.mark.parametrize('byte_order', [Byteorder.little, Byteorder.big])
+@pytest.mark.parametrize('word_size', [1, 2, 4])
+def test_serialize(word_size, byte_order):
+    flags = BitArray(WORDS * 8 * word_size, word_size, byte_order)
+    flags.deserialize(DATA)
+    array = Array(Bitset(8 * word_size), WORDS)
+    array.deserialize(DATA, byte_order=byte_order)
+    expected = bytearray()
+    array.serialize(expected, byte_order=byte_order)
+    buffer = bytearray()
+    flags.serialize(buffer)
+    assert buffer == expected == DATA[:WORDS * word_size]
+
+
+def test_bit_fields():
+    array = Array(lambda: Structure(
+        (f"bit{number}", Bit(number, align_to=1)) for number in range(8)),
+        WORDS)
+    array.deserialize(DATA)
+    flags = BitArray(8 * WORDS)
+    flags.deserialize(DATA)
+    assert list(flags) == [field.value == 1 for bits in array
+                           for field in bits.values()]
+
+
+def test_capacity():
+    flags = BitArray(13, word_size=2)
+    flags.deserialize(b'\xff\xff')
+    assert len(flags) == 13
+    assert list(flags) == [True] * 13
+    assert flags.count() == 16
+    flags.value = flags.value
+    assert flags.count() == 13
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    flags = BitArray(WORDS * 16 - 5, word_size=2)
+    flags.deserialize(DATA, byte_order='big')
+    assert flags.to_numpy().dtype == numpy.bool_
+    assert flags.to_numpy().tolist() == list(flags)
+    assert flags.to_numpy(numpy.uint8).tolist() == [int(flag) for flag in flags]
+
+
+def test_from_numpy():
+    numpy = pytest.importorskip('numpy')
+    flags = BitArray(WORDS * 16 - 5, word_size=2)
+    flags.deserialize(DATA, byte_order='big')
+    value = flags.value
+    copy = BitArray(len(flags), word_size=2)
+    copy.from_numpy(flags.to_numpy())
+    assert copy.value == value
+    copy.from_numpy(numpy.zeros(len(flags)))
+    assert copy.count() == 0
+    copy.value = list(flags)
+    assert copy.value == value
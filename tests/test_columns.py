@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+test_columns.py
+~~~~~~~~~~~~~~~
+Tests of the columnar container exports against the field values.
+
+:copyright: (c) 2015-2022 by Jochen Gerhaeusser.
+:license: BSD, see LICENSE for details.
+"""
+import pytest
+
+from konfoo import (Array, Byte, Decimal, Enum, Enumeration, Pointer, Scaled,
+                    Sequence, Signed, Stream, String, Structure, Unsigned8)
+
+
+class Color(Enumeration):
+    red = 1
+    green = 2
+
+
+class Point(Structure):
+
+    def __init__(self):
+        super().__init__()
+        self.x = Signed(16)
+        self.y = Scaled(100, 16)
+        self.color = Enum(8, enumeration=Color)
+        self.flags = Byte()
+        self.name = String(4)
+
+
+def points(count=64):
+    array = Array(Point, count)
+    array.deserialize(bytes(range(128)) * (count * 9 // 128 + 1))
+    return array
+
+
+def rows(container, attribute='value'):
+    """ Returns the scalar field attribute rows of the container elements."""
+    return [dict((path, getattr(field, attribute))
+                 for path, field in element.field_items())
+            for element in container]
+
+
+def test_columns_of_array():
+    array = points()
+    columns = array.to_columns()
+    assert list(columns) == ['x', 'y', 'color', 'flags', 'name']
+    assert [dict(zip(columns, row)) for row in zip(*columns.values())] == \
+        rows(array)
+
+
+def test_columns_of_array_attributes():
+    array = points()
+    columns = array.to_columns('value', 'bit_size',
+                               fieldnames=('value', 'size'))
+    for path, values in rows(array, 'bit_size')[0].items():
+        assert columns[f"{path}.size"] == [values] * len(array)
+    assert columns['x.value'] == [point.x.value for point in array]
+
+
+def test_columns_of_structure():
+    point = points(1)[0]
+    assert point.to_columns() == dict((path, [value])
+                                      for path, value in rows([point])[0].items())
+
+
+def test_columns_of_heterogeneous_sequence():
+    sequence = Sequence([Structure(a=Decimal(8)),
+                         Structure(a=Decimal(8), b=Decimal(8)),
+                         Unsigned8()])
+    sequence.deserialize(bytes([1, 2, 3, 4]))
+    assert sequence.to_columns() == {'a': [1, 2, None],
+                                     'b': [None, 3, None],
+                                     'value': [None, None, '0x4']}
+
+
+def test_columns_of_pointer_to_array():
+    pointer = Pointer(Array(Point, 4))
+    pointer.data.deserialize(bytes(range(36)))
+    assert pointer.to_columns() == pointer.data.to_columns()
+    assert pointer.to_columns()['x'] == [point.x.value for point in pointer.data]
+
+
+def test_columns_of_nested_pointer():
+    pointer = Pointer(Structure(a=Pointer(Structure(b=Byte()))))
+    assert pointer.to_columns(nested=False) == {'value': ['0x0']}
+    assert pointer.to_columns(nested=True) == dict(
+        (path, [value]) for path, value
+        in pointer.to_dict(nested=True)['Pointer'].items())
+
+
+def test_dataframe():
+    pandas = pytest.importorskip('pandas')
+    array = points()
+    frame = array.to_dataframe()
+    assert isinstance(frame, pandas.DataFrame)
+    assert frame.columns.tolist() == ['x', 'y', 'color', 'flags', 'name']
+    assert frame.to_dict('records') == rows(array)
+
+
+def test_arrow():
+    pyarrow = pytest.importorskip('pyarrow')
+    array = points()
+    table = array.to_arrow()
+    assert isinstance(table, pyarrow.Table)
+    assert table.num_rows == len(array)
+    assert table.to_pylist() == [
+        dict(row, color=str(row['color'])) for row in rows(array)]
+
+
+def test_arrow_of_mixed_types():
+    pytest.importorskip('pyarrow')
+    array = Array(Enum(8, enumeration=Color), 4)
+    array.deserialize(bytes([1, 7, 2, 0]))
+    assert [item.value for item in array] == ['red', 7, 'green', 0]
+    assert array.to_arrow()['value'].to_pylist() == ['red', '7', 'green', '0']
+
+
+def test_exports_of_stream():
+    pytest.importorskip('pandas')
+    array = Array(Stream(2), 3)
+    array.deserialize(bytes(range(6)))
+    assert array.to_dataframe()['value'].tolist() == \
+        [item.value for item in array]
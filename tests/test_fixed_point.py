@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+test_fixed_point.py
+~~~~~~~~~~~~~~~~~~~
+Tests of the bulk fixed-point conversions against the scalar conversions.
+
+:copyright: (c) 2015-2022 by Jochen Gerhaeusser.
+:license: BSD, see LICENSE for details.
+"""
+import random
+
+import pytest
+
+from konfoo import (Array, Bipolar, Bipolar2, Fraction, Scaled, Scaled8,
+                    Scaled16, Scaled64, Unipolar, Unipolar2)
+
+numpy = pytest.importorskip('numpy')
+
+FIELDS = [
+    lambda: Scaled8(100),
+    lambda: Scaled16(100),
+    lambda: Scaled16(0.5),
+    lambda: Scaled(1000, 24),
+    lambda: Scaled64(100),
+    lambda: Fraction(2, 16),
+    lambda: Fraction(2, 16, signed=True),
+    lambda: Fraction(4, 32, signed=True),
+    lambda: Fraction(8, 8),
+    Bipolar2,
+    lambda: Bipolar(4, 8),
+    Unipolar2,
+    lambda: Unipolar(4, 32),
+]
+
+
+def raw_values(field, count=4096):
+    """ Returns the minimum, maximum and random raw values of the field."""
+    generator = random.Random(field.bit_size)
+    values = [field.min(), field.max(), 0, 1, -1]
+    values += [generator.randint(field.min(), field.max())
+               for _ in range(count)]
+    return [value for value in values if field.min() <= value <= field.max()]
+
+
+def floats(field, count=4096):
+    """ Returns in and out of range floating-point numbers of the field."""
+    generator = random.Random(field.bit_size)
+    values = [field.as_float(value) for value in raw_values(field, count)]
+    values += [value * generator.uniform(-1.5, 1.5) for value in values[:count]]
+    return values + [0.0, -0.0, 1e-9, -1e-9, 1e9, -1e9]
+
+
+def to_raw(field):
+    """ Returns the scalar conversion of a float to the raw value."""
+    if isinstance(field, Scaled):
+        return field.to_scaled
+    return field.to_fraction
+
+
+def to_raw_array(field):
+    """ Returns the bulk conversion of floats to the raw values."""
+    if isinstance(field, Scaled):
+        return field.to_scaled_array
+    return field.to_fraction_array
+
+
+@pytest.mark.parametrize('factory', FIELDS)
+def test_as_float_array(factory):
+    field = factory()
+    values = raw_values(field)
+    assert field.as_float_array(values).tolist() == list(
+        map(field.as_float, values))
+
+
+def test_as_float_array_exhaustive():
+    for field in (Scaled16(100), Bipolar2(), Unipolar2(),
+                  Fraction(3, 16, signed=True)):
+        values = numpy.arange(field.min(), field.max() + 1)
+        assert field.as_float_array(values).tolist() == list(
+            map(field.as_float, values.tolist()))
+
+
+@pytest.mark.parametrize('factory', FIELDS)
+def test_to_raw_array(factory):
+    field = factory()
+    values = floats(field)
+    assert to_raw_array(field)(values).tolist() == list(
+        map(to_raw(field), values))
+
+
+@pytest.mark.parametrize('factory', FIELDS)
+def test_to_raw_array_of_non_finite(factory):
+    field = factory()
+    with pytest.raises((OverflowError, ValueError)):
+        to_raw(field)(float('nan'))
+    with pytest.raises((OverflowError, ValueError)):
+        to_raw_array(field)([0.0, float('inf')])
+
+
+@pytest.mark.parametrize('factory', FIELDS)
+def test_array_to_numpy(factory):
+    array = Array(factory, 512)
+    field = array[0]
+    array.deserialize(bytes(random.Random(39).randrange(256)
+                            for _ in range(512 * field.bit_size // 8)))
+    assert array.to_numpy().tolist() == [item.value for item in array]
+    assert array.to_numpy(raw=True).tolist() == [
+        int(item) for item in array]
+
+
+@pytest.mark.parametrize('factory', FIELDS)
+def test_array_from_numpy(factory):
+    array = Array(factory, 512)
+    values = floats(array[0], 256)[:512]
+    array.resize(len(values))
+    array.from_numpy(numpy.array(values))
+    expected = Array(factory, len(values))
+    for item, value in zip(expected, values):
+        item.value = value
+    assert [int(item) for item in array] == [int(item) for item in expected]
+    assert array.to_numpy().tolist() == [item.value for item in expected]
+
+
+def test_array_of_mixed_elements():
+    array = Array(Bipolar2, 3)
+    array[1] = Scaled16(100)
+    array[2] = Unipolar2()
+    array.deserialize(bytes.fromhex('00200020ff7f'))
+    assert array.to_numpy().tolist() == [item.value for item in array]
+    array.from_numpy([-10.0, 10.0, 25.0])
+    assert array.to_numpy().tolist() == [item.value for item in array]
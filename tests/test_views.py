@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+test_views.py
+~~~~~~~~~~~~~
+Tests of the bulk array views against the field values of the elements.
+
+:copyright: (c) 2015-2022 by Jochen Gerhaeusser.
+:license: BSD, see LICENSE for details.
+"""
+import ipaddress
+import random
+
+import pytest
+
+from konfoo import (Array, Datetime, Decimal, Enum, Enumeration, IPv4Address,
+                    Signed16, String, Unsigned8)
+
+numpy = pytest.importorskip('numpy')
+
+COUNT = 1024
+
+
+class Color(Enumeration):
+    black = 0
+    red = 1
+    green = 2
+    blue = 3
+    alias = 3
+
+
+def random_bytes(size, maximum=256):
+    generator = random.Random(40)
+    return bytes(generator.randrange(maximum) for _ in range(size))
+
+
+def array_of(factory, data):
+    array = Array(factory, COUNT)
+    array.deserialize(data)
+    return array
+
+
+def test_enum_categorical():
+    array = array_of(lambda: Enum(8, enumeration=Color),
+                     random_bytes(COUNT, 6))
+    codes, categories = array.to_categorical()
+    assert codes.shape == (COUNT,)
+    assert [categories[code] for code in codes.tolist()] == [
+        item.value for item in array]
+    assert len(categories) == len(set(item._value for item in array))
+    assert array.to_numpy().tolist() == [item.value for item in array]
+
+
+def test_enum_categorical_interned():
+    array = array_of(lambda: Enum(8, enumeration=Color),
+                     random_bytes(COUNT, 4))
+    names = array.to_numpy()
+    assert all(name is Color(item._value).name
+               for name, item in zip(names.tolist(), array))
+
+
+@pytest.mark.parametrize('factory', [lambda: Decimal(16), Signed16,
+                                     Unsigned8])
+def test_decimal_categorical(factory):
+    array = array_of(factory, random_bytes(2 * COUNT, 8))
+    codes, categories = array.to_categorical()
+    assert [categories[code] for code in codes.tolist()] == [
+        item.value for item in array]
+    assert array.to_numpy().tolist() == [item.value for item in array]
+
+
+def test_mixed_categorical():
+    array = Array(Unsigned8, 4)
+    array[1] = Enum(8, enumeration=Color)
+    array.deserialize(bytes([1, 1, 2, 1]))
+    codes, categories = array.to_categorical()
+    assert categories == ['0x1', 'red', '0x2']
+    assert codes.tolist() == [0, 1, 2, 0]
+    assert array.to_numpy().tolist() == [item.value for item in array]
+
+
+def test_datetime():
+    array = array_of(Datetime, random_bytes(4 * COUNT))
+    times = array.to_numpy()
+    assert times.dtype == numpy.dtype('datetime64[s]')
+    assert [str(time) for time in times.tolist()] == [
+        item.value for item in array]
+
+
+def test_ipv4_address():
+    array = array_of(IPv4Address, random_bytes(4 * COUNT))
+    addresses = array.to_numpy()
+    assert addresses.dtype == numpy.uint32
+    assert [str(ipaddress.IPv4Address(address))
+            for address in addresses.tolist()] == [
+        item.value for item in array]
+
+
+@pytest.mark.parametrize('size', [1, 4, 7])
+def test_string(size):
+    generator = random.Random(size)
+    data = bytes(generator.choice(b'\x00abcXYZ09 ')
+                 for _ in range(size * COUNT))
+    array = array_of(lambda: String(size), data)
+    strings = array.to_numpy()
+    assert strings.dtype.kind == 'U'
+    assert strings.tolist() == [item.value for item in array]
+    assert array.to_numpy(raw=True).tobytes() == data
+
+
+def test_string_of_non_ascii():
+    array = Array(lambda: String(2), 2)
+    array.deserialize(b'a\x00\x80b')
+    with pytest.raises(UnicodeDecodeError):
+        array[1].value
+    with pytest.raises(UnicodeDecodeError):
+        array.to_numpy()
+    array.deserialize(b'a\x00b\x00')
+    assert array.to_numpy().tolist() == ['a', 'b']